@@ -1,12 +1,18 @@
+import hashlib
+import os
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException
+import anyio
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Literal
 
 from src.crud import (
     create_project,
     get_all_projects,
+    get_projects_signature,
     get_project_details,
+    get_project_with_children,
 
     create_sprint,
     get_sprint_details,
@@ -34,11 +40,53 @@ class TaskCreate(BaseModel):
 class TaskUpdateStatus(BaseModel):
     status: Literal["Not Started", "In progress", "Done"]
 
+# Response Bodies
+class SprintSummary(BaseModel):
+    id: int
+    name: str
+    project_id: int | None
+
+class SprintWithTasks(SprintSummary):
+    tasks: List[Task]  # required, so a sprint-only body never passes for the full tree
+
+class ProjectWithSprints(BaseModel):
+    id: int
+    name: str
+    sprints: List[SprintSummary] = []
+
+class ProjectWithChildren(ProjectWithSprints):
+    sprints: List[SprintWithTasks] = []
+
+PROJECT_INCLUDES = {"sprints", "tasks"}
+
+# Clients may reuse a list response for a few seconds, then must revalidate
+PROJECTS_CACHE_CONTROL = "private, max-age=5, must-revalidate"
+
+# === Conditional Requests ===
+# Weak ETag for the project list, from one COUNT/MAX query instead of
+# loading and serializing every row.
+def projects_etag() -> str:
+    count, max_id = get_projects_signature()
+    digest = hashlib.blake2b(f"{count}:{max_id}".encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    # Weak comparison: W/"x" and "x" match each other
+    return "*" in candidates or etag in candidates or etag.removeprefix("W/") in candidates
+
 # ===  Lifespan Management ===
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("Starting up... creating database and tables.")
-    create_db_and_tables()
+    # The route handlers are plain `def`, so FastAPI runs them (and their blocking
+    # CRUD calls) in anyio's worker threads. Size that pool to the machine.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 2 * (os.cpu_count() or 1)
+    # Create the tables in a worker thread too, keeping the event loop free
+    await anyio.to_thread.run_sync(create_db_and_tables)
     print("🌍 Server is running!")
     print("🕹️  API Documentation: http://127.0.0.1:8000/docs")
     print("🕳️  Alternative docs: http://127.0.0.1:8000/redoc")
@@ -50,7 +98,9 @@ app = FastAPI(
     title="Project Management API",
     description="API for managing Projects, Sprints, and Tasks.",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes responses much faster than the stdlib json encoder
+    default_response_class=ORJSONResponse
 )
 
 # === Routes ===
@@ -63,18 +113,44 @@ def api_create_project(project_data: ProjectCreate):
     return new_project
 
 # List All Projects
+# Answers 304 Not Modified, with no row reads or JSON encoding, when the
+# client's If-None-Match still matches the list's ETag.
 @app.get("/projects/", response_model=List[Project], tags=["Projects"])
-def api_get_all_projects():
+def api_get_all_projects(request: Request, response: Response, etag: str = Depends(projects_etag)):
+    headers = {"ETag": etag, "Cache-Control": PROJECTS_CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
     projects = get_all_projects()
     return projects
 
 # Get the Project Details
-@app.get("/projects/{project_id}", response_model=Project, tags=["Projects"])
-def api_get_project(project_id: int):
-    project = get_project_details(project_id=project_id)
+# ?include=sprints adds the project's sprints; ?include=tasks (alone or with
+# sprints) returns the whole tree, so the client makes one request instead of
+# one more call per sprint and per task.
+@app.get("/projects/{project_id}", response_model=ProjectWithChildren | ProjectWithSprints | Project, tags=["Projects"])
+def api_get_project(
+    project_id: int,
+    include: str | None = Query(default=None, description="Comma-separated: sprints, tasks")
+):
+    includes = {part.strip() for part in include.split(",") if part.strip()} if include else set()
+    unknown = includes - PROJECT_INCLUDES
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown include value(s): {', '.join(sorted(unknown))}")
+
+    if not includes:
+        project = get_project_details(project_id=project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return project
+
+    include_tasks = "tasks" in includes
+    project = get_project_with_children(project_id=project_id, include_tasks=include_tasks)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    if include_tasks:
+        return ProjectWithChildren.model_validate(project, from_attributes=True)
+    return ProjectWithSprints.model_validate(project, from_attributes=True)
 
 # --- Sprint Endpoints ---
 
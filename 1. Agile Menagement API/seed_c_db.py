@@ -1,5 +1,6 @@
-from src.database import create_db_and_tables
-from src.crud import create_project, create_sprint, create_task, list_all_data_to_console
+from sqlmodel import Session
+from src.database import create_db_and_tables, engine
+from src.crud import _create_project_in, _create_sprint_in, _create_task_in, list_all_data_to_console
 
 # === Main Execution block to run functions in a logical order. ===
 if __name__ == "__main__":
@@ -7,16 +8,20 @@ if __name__ == "__main__":
 
     # --Create Data--
     print("--- CREATING DATA ---")
-    project1 = create_project(name="AutomateOs v0.1")
+    # One session and one commit for the whole seed (a single transaction)
+    with Session(engine) as session:
+        project1 = _create_project_in(session, name="AutomateOs v0.1")
 
-    # Sprint
-    sprint1 = create_sprint(name="Week1: Foundations & Project Setup", project_id=project1.id)
-    sprint2 = create_sprint(name="Week2: Workflow CRUD", project_id=project1.id)
+        # Sprint
+        sprint1 = _create_sprint_in(session, name="Week1: Foundations & Project Setup", project_id=project1.id)
+        sprint2 = _create_sprint_in(session, name="Week2: Workflow CRUD", project_id=project1.id)
 
-    # Task
-    create_task(title="Define User model", sprint_id=sprint1.id, status="In progress")
-    create_task(title="Set up JWT authentication", sprint_id=sprint1.id)
-    create_task(title="Create /workflows endpoint", sprint_id=sprint2.id, status="Done")
+        # Task
+        _create_task_in(session, title="Define User model", sprint_id=sprint1.id, status="In progress")
+        _create_task_in(session, title="Set up JWT authentication", sprint_id=sprint1.id)
+        _create_task_in(session, title="Create /workflows endpoint", sprint_id=sprint2.id, status="Done")
+
+        session.commit()
 
     print("--- DATA CREATED ---\n")
 
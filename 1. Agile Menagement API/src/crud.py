@@ -1,16 +1,42 @@
 # :Modules: CRUD Modules
 
-from sqlmodel import Session, select
+from sqlmodel import Session, func, select
+from sqlalchemy.orm import selectinload
 from typing import Literal, List
 from .models import Project, Sprint, Task
 from .database import engine
 
 # === Create Operations ===
+# The _create_*_in helpers add a row to a session the caller already holds
+# and flush it so its id is available, but leave the commit to the caller.
+# Bulk work (seeding, future imports) can then share one transaction.
+def _create_project_in(session: Session, name: str) -> Project:
+    project = Project(name=name)
+    session.add(project)
+    session.flush()
+    return project
+
+def _create_sprint_in(session: Session, name: str, project_id: int | None) -> Sprint:
+    sprint = Sprint(name=name, project_id=project_id)
+    session.add(sprint)
+    session.flush()
+    return sprint
+
+def _create_task_in(
+    session: Session,
+    title: str,
+    sprint_id: int | None = None,
+    status: Literal["Not Started", "In progress", "Done"] = "Not Started"
+) -> Task:
+    task = Task(title=title, sprint_id=sprint_id, status=status)
+    session.add(task)
+    session.flush()
+    return task
+
 # -Creates a new project instance and saves it to the database.-
 def create_project(name: str) -> Project:
     with Session(engine) as session:
-        project = Project(name=name)
-        session.add(project)
+        project = _create_project_in(session, name)
         session.commit()
         session.refresh(project)
     return project
@@ -18,11 +44,7 @@ def create_project(name: str) -> Project:
 # --Creates a new sprint can link to a project.--
 def create_sprint(name: str, project_id: int | None) -> Sprint:
     with Session(engine) as session:
-        if project_id is not None:
-            sprint = Sprint(name=name, project_id=project_id)
-        else:
-            sprint = Sprint(name=name, project_id=None)
-        session.add(sprint)
+        sprint = _create_sprint_in(session, name, project_id)
         session.commit()
         session.refresh(sprint)
     return sprint
@@ -34,30 +56,45 @@ def create_task(
     status: Literal["Not Started", "In progress", "Done"] = "Not Started"
 ) -> Task:
     with Session(engine) as session:
-        task = Task(title=title, sprint_id=sprint_id, status=status)
-        session.add(task)
+        task = _create_task_in(session, title, sprint_id, status)
         session.commit()
         session.refresh(task)
     return task
 
 # === Read Operations ===
+
 # Get All Project return as List
 def get_all_projects() -> List[Project]:
     with Session(engine) as session:
-        statement = select(Project)     
-        results = session.exec(statement).all()
-        projects = list(results)
-        return projects
+        statement = select(Project)
+        return session.exec(statement).all()
+
+# Row count and highest id of the project table, in one SELECT.
+# Projects are insert-only (no update/delete), so this pair changes exactly
+# when the project list does and can stand in for its version.
+def get_projects_signature() -> tuple[int, int | None]:
+    with Session(engine) as session:
+        statement = select(func.count(Project.id), func.max(Project.id))
+        count, max_id = session.exec(statement).one()
+        return count, max_id
 
 # Display Database Hierarchy
+REPORT_BATCH_SIZE = 500
+
 def list_all_data_to_console() -> None:
     with Session(engine) as session:
-        # Query all projects
-        statement = select(Project)
-        projects = session.exec(statement).all()
+        # Query all projects, loading their sprints and tasks up front
+        # (3 SELECTs per batch instead of one more per project and per sprint).
+        # yield_per streams projects in batches, so memory stays bounded by the
+        # batch size rather than the whole table.
+        statement = (
+            select(Project)
+            .options(selectinload(Project.sprints).selectinload(Sprint.tasks))
+            .execution_options(yield_per=REPORT_BATCH_SIZE)
+        )
 
         # [Loop through each project]
-        for project in projects:
+        for project in session.exec(statement):
             print(f'📁 Project: {project.name} (ID: {project.id})')
 
             # [Loop through the sprints linked to this project.]
@@ -77,6 +114,16 @@ def get_project_details(project_id: int) -> Project | None:
         if project is None:
             return None
         return project
+
+# Get Project with its sprints and, unless include_tasks is False, their
+# tasks (3 SELECTs for the whole tree, 2 for sprints only)
+def get_project_with_children(project_id: int, include_tasks: bool = True) -> Project | None:
+    with Session(engine) as session:
+        load_sprints = selectinload(Project.sprints)
+        if include_tasks:
+            load_sprints = load_sprints.selectinload(Sprint.tasks)
+        statement = select(Project).where(Project.id == project_id).options(load_sprints)
+        return session.exec(statement).one_or_none()
     
 # Get Sprint Details
 def get_sprint_details(sprint_id: int) -> tuple[Sprint | None, int]:
@@ -4,11 +4,12 @@
 
 from __future__ import annotations
 
+from typing import Annotated
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlmodel import Session
 
-from app.core.deps import get_db
+from app.core.deps import DbDep
 from app.services.users import UserService
 from app.schemas.tokens import Token
 from app.schemas.users import UserCreate, UserRead
@@ -19,27 +20,28 @@ router = APIRouter(tags=["Authentication"])  # === Router: Authentication ===
 
 # --- Register new user ---
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def register_user(user_in: UserCreate, db: Session = Depends(get_db)):
+async def register_user(user_in: UserCreate, db: DbDep):
     svc = UserService(db)
-    if svc.repo.get_by_email(user_in.email):
+    if await svc.repo.get_by_email(user_in.email):
         raise HTTPException(status_code=400, detail="Email already registered")
-    user = svc.create_user(user_in)
+    user = await svc.create_user(user_in)
     return user
 
 
 # --- Issue JWT access token ---
 @router.post("/login", response_model=Token)
-def login_for_access_token(
-    db: Session = Depends(get_db),
-    form_data: OAuth2PasswordRequestForm = Depends(),
+async def login_for_access_token(
+    db: DbDep,
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ):
     svc = UserService(db)
-    user = svc.authenticate(email=form_data.username, password=form_data.password)
+    user = await svc.authenticate(email=form_data.username, password=form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token = create_access_token(data={"sub": user.email})
+    # Carry the user id as a claim so authenticated requests need no user lookup
+    access_token = create_access_token(data={"sub": user.email, "uid": user.id})
     return {"access_token": access_token, "token_type": "bearer"}
@@ -4,26 +4,27 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
-from sqlmodel import Session
+from datetime import timezone
 
-from app.core.deps import get_db, get_current_user
-from app.models.user import User
-from app.schemas.apikeys import ApiKeyCreateResponse, ApiKeyMeta
+import msgspec
+from fastapi import APIRouter, Response, status
+
+from app.core.deps import CurrentUserDep, DbDep
+from app.schemas.apikeys import ApiKeyCreateResponse, ApiKeyMeta, ApiKeyMetaMsg
 from app.services.api_keys import ApiKeyService
 
 
 router = APIRouter(prefix="/users/me/apikeys", tags=["API Keys"])  # === Router: API Keys ===
 
+# Encodes a whole key list of msgspec structs in one C call
+_LIST_ENCODER = msgspec.json.Encoder()
+
 
 # --- Create a new API key (returns plaintext once) ---
 @router.post("", response_model=ApiKeyCreateResponse, status_code=status.HTTP_201_CREATED)
-def create_my_api_key(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
+async def create_my_api_key(db: DbDep, current_user: CurrentUserDep):
     svc = ApiKeyService(db)
-    apikey, plaintext = svc.create_for_user(current_user.id)  # type: ignore[arg-type]
+    apikey, plaintext = await svc.create_for_user(current_user.id)
     return ApiKeyCreateResponse(
         id=apikey.id,  # type: ignore[arg-type]
         key_prefix=apikey.key_prefix,
@@ -34,21 +35,27 @@ def create_my_api_key(
 
 # --- List all API keys for current user ---
 @router.get("", response_model=list[ApiKeyMeta])
-def list_my_api_keys(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
+async def list_my_api_keys(db: DbDep, current_user: CurrentUserDep):
     svc = ApiKeyService(db)
-    return svc.list_for_user(current_user.id)  # type: ignore[arg-type]
+    apikeys = await svc.list_for_user(current_user.id)
+    # Encode here so FastAPI doesn't validate and serialize the list a second time;
+    # ApiKeyMeta stays the response_model for the OpenAPI schema.
+    # SQLite hands created_at back naive; it is stored in UTC, so mark it as
+    # such to match the "...Z" timestamps the create endpoint returns
+    body = _LIST_ENCODER.encode([
+        ApiKeyMetaMsg(
+            id=apikey.id,
+            key_prefix=apikey.key_prefix,
+            created_at=apikey.created_at.replace(tzinfo=timezone.utc),
+        )
+        for apikey in apikeys
+    ])
+    return Response(content=body, media_type="application/json")
 
 
 # --- Revoke (delete) an API key ---
 @router.delete("/{key_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_my_api_key(
-    key_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
+async def delete_my_api_key(key_id: int, db: DbDep, current_user: CurrentUserDep):
     svc = ApiKeyService(db)
-    svc.revoke_for_user(current_user.id, key_id)  # type: ignore[arg-type]
+    await svc.revoke_for_user(current_user.id, key_id)
     return None
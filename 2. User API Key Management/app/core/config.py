@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+from pydantic import SecretStr
 from pydantic_settings import BaseSettings
 
 
@@ -11,11 +12,32 @@ class Settings(BaseSettings):
     # === Existing/feature flags ===
     MAX_KEYS_PER_USER: int = 5
 
+    # === Password hashing ===
+    # Argon2id cost for new password hashes (64 MiB, 3 passes, as in RFC 9106's
+    # low-memory profile). One lane per hash: the hash pool already runs one
+    # hash per core, so extra lanes would only oversubscribe the CPU.
+    # Lower the memory for small hosts or tests
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    ARGON2_TIME_COST: int = 3
+    ARGON2_PARALLELISM: int = 1
+
+    # === API key hashing ===
+    # Server-side secret mixed into every API key hash (BLAKE2b key)
+    API_KEY_PEPPER: SecretStr = SecretStr("your_api_key_pepper_that_should_be_in_a_env_file")
+
     # === JWT settings ===
     SECRET_KEY: str = "your_super_secret_key_that_should_be_in_a_env_file"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # === Redis cache (optional) ===
+    # Leave REDIS_URL unset to run without a cache
+    REDIS_URL: str | None = None
+    REDIS_MAX_CONNECTIONS: int = 10  # size to the number of app workers
+    USER_CACHE_TTL_SECONDS: int = 60
+    # Per-process LRU used instead when REDIS_URL is unset (0 disables it)
+    USER_LOCAL_CACHE_SIZE: int = 4096
+
     class Config:
         env_file = ".env"
 
@@ -4,46 +4,47 @@
 
 from __future__ import annotations
 
-from typing import Generator
+from typing import Annotated, AsyncGenerator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlmodel import Session
-from jose import JWTError, jwt
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db.session import get_session
-from app.core.config import settings
-from app.repositories.users import UserRepository
-from app.models.user import User
+from app.core.security import decode_access_token
+from app.schemas.users import CurrentUser
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")  # Bearer token (JWT)
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Provide a SQLModel session per request."""
-    yield from get_session()
+    async for session in get_session():
+        yield session
 
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
-    """Resolve and return the current authenticated user from a JWT bearer token."""
+async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> CurrentUser:
+    """
+    Resolve the current authenticated user from a JWT bearer token.
+    The identity comes from the verified claims alone, so no database
+    lookup is needed; the token's expiry bounds how stale it can be.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str | None = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
+    payload = decode_access_token(token)
+    if payload is None:
+        raise credentials_exception
+    email: str | None = payload.get("sub")
+    user_id: int | None = payload.get("uid")
+    if email is None or user_id is None:
         raise credentials_exception
 
-    user_repo = UserRepository(db)
-    user = user_repo.get_by_email(email=email)
+    return CurrentUser(id=user_id, email=email)
 
-    if user is None:
-        raise credentials_exception
-    return user
+
+# --- Shared annotated dependencies (use these in route signatures) ---
+DbDep = Annotated[AsyncSession, Depends(get_db)]
+CurrentUserDep = Annotated[CurrentUser, Depends(get_current_user)]
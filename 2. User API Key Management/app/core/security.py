@@ -2,16 +2,35 @@
 # === Purpose ===
 # Password hashing/verification, API key generation+hashing, and JWT helpers.
 
+import asyncio
+import hashlib
+import hmac
+import os
 import secrets
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+import jwt
 from passlib.context import CryptContext
-from jose import JWTError, jwt
-from typing import Any
+from typing import Any, Callable, TypeVar
 from .config import settings
 
+T = TypeVar("T")
+
 # === Password & API Key Hashing ===
-# Configure passlib for hashing API keys and passwords
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Configure passlib for hashing passwords (and API keys stored before HMAC).
+# New passwords use Argon2id (native libargon2 via argon2-cffi); bcrypt stays
+# listed so hashes created before the switch still verify.
+# Only login/register hash with it: API key checks use keyed BLAKE2b, not bcrypt.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__rounds=settings.ARGON2_TIME_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
 
 # Non-secret namespace used in the visible prefix (helps users identify keys)
 PREFIX_NAMESPACE = "amos"
@@ -31,26 +50,70 @@ def generate_api_key() -> tuple[str, str]:
     plaintext_key = f"{key_prefix}{KEY_SEPARATOR}{random_part}"
     return plaintext_key, key_prefix
 
+# The pepper as bytes, read once. BLAKE2b keys are capped at 64 bytes, so
+# its key is a 64-byte digest of the pepper (any pepper length works).
+_API_KEY_PEPPER = settings.API_KEY_PEPPER.get_secret_value().encode()
+_API_KEY_BLAKE2_KEY = hashlib.blake2b(_API_KEY_PEPPER).digest()
+# Marks keyed-BLAKE2b hashes; unmarked 64-hex hashes are older HMAC-SHA256
+BLAKE2_HASH_PREFIX = "b2$"
+
 def hash_api_key(plain_key: str) -> str:
     """
     Securely hash the plaintext API key for storage.
+    Keys are 256-bit random tokens, so one keyed BLAKE2b pass is enough;
+    its key mode does the pepper's job without an HMAC wrapper, and a slow
+    KDF like bcrypt only matters for low-entropy passwords.
     """
-    return pwd_context.hash(plain_key)
+    digest = hashlib.blake2b(plain_key.encode(), digest_size=32, key=_API_KEY_BLAKE2_KEY)
+    return BLAKE2_HASH_PREFIX + digest.hexdigest()
 
 def verify_api_key(plain_key: str, hashed_key: str) -> bool:
     """
     Verify a plaintext API key against a stored hash.
     """
-    return pwd_context.verify(plain_key, hashed_key)
+    if hashed_key.startswith(BLAKE2_HASH_PREFIX):
+        return hmac.compare_digest(hash_api_key(plain_key), hashed_key)
+    if hashed_key.startswith("$2"):
+        # Key stored before the switch to HMAC: still a bcrypt hash
+        return pwd_context.verify(plain_key, hashed_key)
+    # Key stored before the switch to BLAKE2b: HMAC-SHA256 hex digest
+    legacy = hmac.new(_API_KEY_PEPPER, plain_key.encode(), hashlib.sha256).hexdigest()
+    return hmac.compare_digest(legacy, hashed_key)
+
+# --- Password hashing pool ---
+# Argon2/bcrypt are CPU-bound, so they get one worker per core, apart from
+# the I/O-sized pool FastAPI uses for sync code. With Argon2 parallelism=1,
+# concurrent logins never ask for more threads than there are cores.
+HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
+
+
+async def run_in_hash_pool(func: Callable[..., T], *args: Any) -> T:
+    """Run a hashing call on HASH_POOL without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(HASH_POOL, func, *args)
+
 
 # --- Password helpers ---
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a user password against its bcrypt hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+# Hash of a random throwaway password, built at import so that even the
+# first failed login for an unknown email does not pay to create it
+_DUMMY_PASSWORD_HASH = pwd_context.hash(secrets.token_urlsafe(16))
+
+
+def verify_password(plain_password: str, hashed_password: str | None) -> bool:
+    """
+    Verify a user password against its Argon2id (or older bcrypt) hash.
+    The final tag comparison inside argon2-cffi and passlib's bcrypt is
+    already constant-time. A missing or unrecognised hash (unknown user,
+    empty legacy column) is checked against a dummy hash instead, so a
+    failed login costs the same whether or not the account exists.
+    """
+    if hashed_password and pwd_context.identify(hashed_password) is not None:
+        return pwd_context.verify(plain_password, hashed_password)
+    pwd_context.verify(plain_password, _DUMMY_PASSWORD_HASH)
+    return False
 
 
 def get_password_hash(password: str) -> str:
-    """Hash a user password using bcrypt."""
+    """Hash a user password using Argon2id."""
     return pwd_context.hash(password)
 
 
@@ -63,9 +126,33 @@ def create_access_token(data: dict[str, object]) -> str:
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+# --- JWT validation cache ---
+# Verified payloads keyed by the raw token (bounded LRU). A client reusing its
+# token skips the signature check; entries are dropped once the token expires.
+TOKEN_CACHE_SIZE = 4096
+_token_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
 def decode_access_token(token: str) -> dict[str, Any] | None:
     """Decode and verify a JWT. Returns payload dict or None if invalid/expired."""
+    now = datetime.now(timezone.utc).timestamp()
+    with _token_cache_lock:
+        payload = _token_cache.get(token)
+        if payload is not None:
+            if payload["exp"] > now:
+                _token_cache.move_to_end(token)
+                return payload
+            del _token_cache[token]
+
     try:
-        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-    except JWTError:
-        return None
\ No newline at end of file
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except jwt.PyJWTError:
+        return None  # failures are never cached
+
+    if "exp" in payload:  # only tokens that expire are safe to remember
+        with _token_cache_lock:
+            _token_cache[token] = payload
+            if len(_token_cache) > TOKEN_CACHE_SIZE:
+                _token_cache.popitem(last=False)
+    return payload
\ No newline at end of file
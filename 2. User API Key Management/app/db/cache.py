@@ -0,0 +1,24 @@
+# :Modules: Cache Client
+# === Purpose ===
+# Optional Redis connection pool shared by read-through caches.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+def _create_redis_client() -> Redis | None:
+    """Build the shared client, or None when no REDIS_URL is configured."""
+    if not settings.REDIS_URL:
+        return None
+    from redis.asyncio import Redis  # only needed when caching is enabled
+
+    return Redis.from_url(settings.REDIS_URL, max_connections=settings.REDIS_MAX_CONNECTIONS)
+
+
+redis_client = _create_redis_client()  # Singleton client (None = caching disabled)
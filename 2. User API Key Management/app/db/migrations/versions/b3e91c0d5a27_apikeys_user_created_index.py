@@ -0,0 +1,32 @@
+"""apikeys: composite (user_id, created_at) index
+
+Revision ID: b3e91c0d5a27
+Revises: 7727a5323fb0
+Create Date: 2026-10-15 23:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e91c0d5a27'
+down_revision: Union[str, Sequence[str], None] = '7727a5323fb0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_apikey_user_created', 'apikeys', ['user_id', 'created_at'], unique=False)
+    op.drop_index(op.f('ix_apikeys_user_id'), table_name='apikeys')
+    op.drop_index(op.f('ix_apikeys_created_at'), table_name='apikeys')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_apikeys_created_at'), 'apikeys', ['created_at'], unique=False)
+    op.create_index(op.f('ix_apikeys_user_id'), 'apikeys', ['user_id'], unique=False)
+    op.drop_index('ix_apikey_user_created', table_name='apikeys')
@@ -0,0 +1,36 @@
+"""user: hashed_password column
+
+Revision ID: c4f2a7d9e1b8
+Revises: b3e91c0d5a27
+Create Date: 2026-10-15 23:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f2a7d9e1b8'
+down_revision: Union[str, Sequence[str], None] = 'b3e91c0d5a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Databases from before this revision may already have the column, added
+    # by the old startup probe in app/db/session.py
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('user')}
+    if 'hashed_password' not in columns:
+        op.add_column(
+            'user',
+            sa.Column('hashed_password', sa.String(length=255), nullable=False, server_default=''),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.drop_column('hashed_password')
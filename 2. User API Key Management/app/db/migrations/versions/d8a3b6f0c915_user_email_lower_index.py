@@ -0,0 +1,29 @@
+"""user: unique index on lower(email)
+
+Revision ID: d8a3b6f0c915
+Revises: c4f2a7d9e1b8
+Create Date: 2026-10-15 23:55:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a3b6f0c915'
+down_revision: Union[str, Sequence[str], None] = 'c4f2a7d9e1b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fails if two stored emails differ only by case; merge those accounts first
+    op.create_index('ix_user_email_lower', 'user', [sa.text('lower(email)')], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_email_lower', table_name='user')
@@ -1,9 +1,15 @@
 # :Modules: Database Session & Engine
 # === Purpose ===
-# Create SQLite engine, ensure tables, and provide request-scoped sessions.
+# Create async SQLite engine, migrate the schema, and provide request-scoped sessions.
 
-from sqlmodel import SQLModel, create_engine, Session
-from sqlalchemy import inspect, text
+import asyncio
+from functools import lru_cache
+from typing import AsyncGenerator
+from alembic import command
+from alembic.config import Config
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 import re
 import os
 
@@ -13,8 +19,11 @@ import os
 # Provide db file name.
 name: str = "app"
 
+# Characters Windows forbids in file names (compiled once at import)
+_BAD_FN = re.compile(r'[\\/:*?"<>|]')
+
 def validate_file_name(name: str) -> str:
-    if re.search(r'[\\/:*?"<>|]', name):
+    if _BAD_FN.search(name):
         raise ValueError("A file name can't contain any of the following characters: \\ / : * ? \" < > |")
     return name
 file_name: str = validate_file_name(name)
@@ -25,24 +34,68 @@ db_dir = os.path.join(workspace_root, "db")
 os.makedirs(db_dir, exist_ok=True)
 
 # Database URL {change database here if needed}
-DATABASE_URL = f"sqlite:///{os.path.join(db_dir, file_name + '.db')}"
+db_path = os.path.join(db_dir, file_name + '.db')
+DATABASE_URL = f"sqlite+aiosqlite:///{db_path}"
+# Same file through the sync driver, for Alembic
+MIGRATIONS_DATABASE_URL = f"sqlite:///{db_path}"
+
+# Tune every new SQLite connection: WAL lets reads run alongside a write,
+# synchronous=NORMAL is still durable under WAL with far fewer fsyncs, and
+# the larger page cache / mmap window keep hot pages out of the disk path
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
 
 # === Create engine ===
-engine = create_engine(DATABASE_URL, echo=True)
-
-def create_db_and_tables():
-    SQLModel.metadata.create_all(engine)
-    # Lightweight migration: ensure 'hashed_password' exists on 'user' table
-    with engine.begin() as conn:
-        inspector = inspect(conn)
-        if 'user' in inspector.get_table_names():
-            try:
-                # Probe for column; will error if missing
-                conn.execute(text("SELECT hashed_password FROM user LIMIT 1"))
-            except Exception:
-                conn.execute(text("ALTER TABLE user ADD COLUMN hashed_password VARCHAR(255) NOT NULL DEFAULT ''"))
-
-def get_session():
+# Async engine: requests await the database on the event loop instead of
+# each one holding a worker thread while it waits. Built on first use and
+# then shared, so importing this module never sets up a pool by itself.
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    engine = create_async_engine(DATABASE_URL, echo=False)
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+# Sessions keep loaded attributes after commit, so returning an object from
+# a handler never triggers a lazy reload outside the session
+@lru_cache(maxsize=1)
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(get_engine(), class_=AsyncSession, expire_on_commit=False)
+
+# === Schema migrations (Alembic) ===
+ALEMBIC_INI = os.path.join(workspace_root, os.pardir, "alembic.ini")
+# alembic.ini's script_location is relative to the CWD; pin it like db_path
+MIGRATIONS_DIR = os.path.join(workspace_root, "db", "migrations")
+# First revision; databases created before Alembic ran are stamped with it
+BASELINE_REVISION = "7727a5323fb0"
+
+def _upgrade_to_head() -> None:
+    cfg = Config(ALEMBIC_INI)
+    cfg.set_main_option("script_location", MIGRATIONS_DIR)
+    cfg.set_main_option("sqlalchemy.url", MIGRATIONS_DATABASE_URL)
+    cfg.attributes["configure_logger"] = False  # keep the server's logging setup
+
+    legacy_engine = create_engine(MIGRATIONS_DATABASE_URL)
+    try:
+        tables = inspect(legacy_engine).get_table_names()
+    finally:
+        legacy_engine.dispose()
+    if "user" in tables and "alembic_version" not in tables:
+        command.stamp(cfg, BASELINE_REVISION)
+
+    command.upgrade(cfg, "head")
+
+async def run_migrations() -> None:
+    # Called once from the app lifespan; Alembic is sync, so keep it off the event loop
+    await asyncio.to_thread(_upgrade_to_head)
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Get database session."""
-    with Session(engine) as session:
+    async with get_sessionmaker()() as session:
         yield session
\ No newline at end of file
@@ -6,26 +6,37 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.api.routers.users_apikeys import router as apikeys_router
 from app.api.routers.auth import router as auth_router
-from app.db.session import create_db_and_tables
+from app.db.session import get_engine, run_migrations
+from app.db.cache import redis_client
 
 
 # === Lifespan (startup/shutdown) ===
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print("Starting up... creating database and tables.")
-    create_db_and_tables()
+    print("Starting up... applying database migrations.")
+    await run_migrations()
     print("🌍 Server is running!")
     print("🕹️  API Documentation: http://127.0.0.1:8000/docs")
     print("🕳️  Alternative docs: http://127.0.0.1:8000/redoc")
     yield
     print("Shutting down...")
+    if redis_client is not None:
+        await redis_client.aclose()
+    await get_engine().dispose()
 
 
 # === FastAPI Application Setup ===
-app = FastAPI(title="User API Key Management", lifespan=lifespan)
+app = FastAPI(
+    title="User API Key Management",
+    lifespan=lifespan,
+    # orjson writes the response bytes much faster than the stdlib json encoder;
+    # response_model validation still runs as before
+    default_response_class=ORJSONResponse,
+)
 
 # --- Routers Registration ---
 app.include_router(auth_router)  # Authentication endpoints (register/login)
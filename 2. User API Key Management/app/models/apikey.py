@@ -5,6 +5,7 @@
 from __future__ import annotations  # Enables modern, cleaner type hints for related models
 
 from datetime import datetime, timezone
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 from typing import TYPE_CHECKING
 
@@ -12,16 +13,18 @@ if TYPE_CHECKING:
     from app.models.user import User
 
 class ApiKeys(SQLModel, table=True):
+    # One (user_id, created_at) index serves list_by_user's
+    # WHERE user_id=? ORDER BY created_at DESC as an index walk, with no sort
+    __table_args__ = (Index("ix_apikey_user_created", "user_id", "created_at"),)
 
     # --- Columns ---
     id: int | None = Field(default=None, primary_key=True)
     key_prefix: str = Field(index=True, max_length=32)  # visible, non-secret prefix
-    hashed_key: str  # irreversible bcrypt hash of the full key
+    hashed_key: str  # irreversible keyed BLAKE2b hash of the full key
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc), 
-        index=True)
+        default_factory=lambda: datetime.now(timezone.utc))
 
     # --- Relationships ---
-    user_id: int = Field(foreign_key="user.id", index=True)
-    user: User = Relationship(back_populates="api_keys")
+    user_id: int = Field(foreign_key="user.id")
+    user: User = Relationship(back_populates="api_keys", sa_relationship_kwargs={"lazy": "raise"})
 
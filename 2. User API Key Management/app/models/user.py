@@ -18,4 +18,8 @@ class User(SQLModel, table=True):
     created_at: datetime | None = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
 
     # --- Relationships ---
-    api_keys: List["ApiKeys"] = Relationship(back_populates="user")
\ No newline at end of file
+    # lazy="raise": an async session can't lazy-load, and no auth path needs a
+    # user's keys, so any access must opt in with selectinload() at the query
+    api_keys: List["ApiKeys"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise"}
+    )
\ No newline at end of file
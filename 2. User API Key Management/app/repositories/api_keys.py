@@ -5,40 +5,68 @@
 from __future__ import annotations
 
 from typing import List, Optional
-from sqlmodel import Session, select
-from sqlalchemy import text
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import delete, func, insert, text
 
 from app.models.apikey import ApiKeys
 
 
 class ApiKeyRepository:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
     # === Create ===
-    def create(self, apikey: ApiKeys) -> ApiKeys:
+    async def create(self, apikey: ApiKeys) -> ApiKeys:
         self.session.add(apikey)
-        self.session.flush()
+        await self.session.flush()
         return apikey
 
+    async def create_many(self, apikeys: List[ApiKeys]) -> List[ApiKeys]:
+        # One multi-row INSERT ... RETURNING (a flush would insert row by row
+        # on SQLite). Asking SQLAlchemy for input-ordered RETURNING would also
+        # split it per row there, so rows are matched back by their unique hash
+        if not apikeys:
+            return []  # an empty parameter list would insert one default row
+        rows = [apikey.model_dump(exclude={"id"}) for apikey in apikeys]
+        stmt = insert(ApiKeys).returning(ApiKeys)
+        inserted = {apikey.hashed_key: apikey for apikey in await self.session.scalars(stmt, rows)}
+        return [inserted[apikey.hashed_key] for apikey in apikeys]
+
     # === Read ===
-    def get(self, key_id: int) -> Optional[ApiKeys]:
-        return self.session.get(ApiKeys, key_id)
+    async def get(self, key_id: int) -> Optional[ApiKeys]:
+        return await self.session.get(ApiKeys, key_id)
 
-    def list_by_user(self, user_id: int) -> List[ApiKeys]:
+    async def list_by_user(self, user_id: int) -> List[ApiKeys]:
         # Order by created_at desc; using text to avoid typing issues with SQLModel field
         stmt = (
             select(ApiKeys)
             .where(ApiKeys.user_id == user_id)
             .order_by(text("created_at DESC"))
         )
-        return list(self.session.exec(stmt))
+        return list(await self.session.exec(stmt))
+
+    async def list_by_prefix(self, key_prefix: str) -> List[ApiKeys]:
+        # Indexed lookup; prefixes are random, so this is almost always one row
+        stmt = select(ApiKeys).where(ApiKeys.key_prefix == key_prefix)
+        return list(await self.session.exec(stmt))
 
     # === Delete ===
-    def delete(self, apikey: ApiKeys) -> None:
-        self.session.delete(apikey)
+    async def delete(self, apikey: ApiKeys) -> None:
+        await self.session.delete(apikey)
+
+    async def delete_owned(self, key_id: int, user_id: int) -> int:
+        # One DELETE that also enforces ownership; returns the rows removed (0 or 1)
+        stmt = delete(ApiKeys).where(ApiKeys.id == key_id, ApiKeys.user_id == user_id)
+        result = await self.session.execute(stmt)
+        return result.rowcount
 
     # === Utility ===
-    def count_by_user(self, user_id: int) -> int:
-        stmt = select(ApiKeys).where(ApiKeys.user_id == user_id)
-        return len(list(self.session.exec(stmt)))
+    async def exists(self, key_id: int) -> bool:
+        stmt = select(ApiKeys.id).where(ApiKeys.id == key_id)
+        return (await self.session.exec(stmt)).first() is not None
+
+    async def count_by_user(self, user_id: int) -> int:
+        # COUNT in SQL (answered from the user_id index) instead of loading every row
+        stmt = select(func.count(ApiKeys.id)).where(ApiKeys.user_id == user_id)
+        return (await self.session.exec(stmt)).one()
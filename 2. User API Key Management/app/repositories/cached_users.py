@@ -0,0 +1,56 @@
+# :Modules: Cached User Repository
+# === Purpose ===
+# UserRepository variant with a Redis read-through cache for lookups by email.
+
+from __future__ import annotations
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.models.user import User
+from app.repositories.users import UserRepository, normalize_email
+from app.schemas.users import UserCreate
+
+
+class CachedUserRepository(UserRepository):
+    def __init__(self, session: AsyncSession, redis: Redis):
+        super().__init__(session)
+        self.redis = redis
+
+    @staticmethod
+    def _key(email: str) -> str:
+        return f"user:email:{normalize_email(email)}"
+
+    # === Read ===
+    async def get_by_email(self, email: str) -> User | None:
+        key = self._key(email)
+        try:
+            cached = await self.redis.get(key)
+        except RedisError:
+            cached = None  # cache unavailable: fall back to the database
+        if cached is not None:
+            return User.model_validate(orjson.loads(cached))
+
+        user = await super().get_by_email(email)
+        # Misses are not cached, so a new registration is visible immediately
+        if user is not None:
+            try:
+                await self.redis.setex(
+                    key, settings.USER_CACHE_TTL_SECONDS, orjson.dumps(user.model_dump())
+                )
+            except RedisError:
+                pass
+        return user
+
+    # === Create ===
+    async def create(self, user_create: UserCreate) -> User:
+        user = await super().create(user_create)
+        try:
+            await self.redis.delete(self._key(user.email))
+        except RedisError:
+            pass
+        return user
+
@@ -0,0 +1,49 @@
+# :Modules: Local Cached User Repository
+# === Purpose ===
+# UserRepository variant with a bounded in-process LRU cache for lookups by
+# email, used when Redis is not configured. Kept apart from cached_users.py so
+# that running without REDIS_URL never imports redis.
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.core.config import settings
+from app.models.user import User
+from app.repositories.users import UserRepository, normalize_email
+from app.schemas.users import UserCreate
+
+
+# Plain dicts keyed by normalized email, never live ORM instances, so no
+# session state leaks between requests. Entries expire after the same TTL
+# as the Redis cache; the event loop is single-threaded, so no lock is needed.
+_local_users: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+
+class LocalCachedUserRepository(UserRepository):
+    # === Read ===
+    async def get_by_email(self, email: str) -> User | None:
+        key = normalize_email(email)
+        entry = _local_users.get(key)
+        if entry is not None:
+            expires_at, data = entry
+            if expires_at > time.monotonic():
+                _local_users.move_to_end(key)
+                return User.model_validate(data)
+            del _local_users[key]
+
+        user = await super().get_by_email(email)
+        # Misses are not cached, so a new registration is visible immediately
+        if user is not None:
+            _local_users[key] = (time.monotonic() + settings.USER_CACHE_TTL_SECONDS, user.model_dump())
+            if len(_local_users) > settings.USER_LOCAL_CACHE_SIZE:
+                _local_users.popitem(last=False)
+        return user
+
+    # === Create ===
+    async def create(self, user_create: UserCreate) -> User:
+        user = await super().create(user_create)
+        _local_users.pop(normalize_email(user.email), None)
+        return user
@@ -4,28 +4,61 @@
 
 from __future__ import annotations
 
-from sqlmodel import Session, select
+from sqlalchemy import func
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.user import User
 from app.schemas.users import UserCreate
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash, run_in_hash_pool
+
+
+def normalize_email(email: str) -> str:
+    # Emails are matched case-insensitively; normalize once at the edge
+    return email.strip().lower()
 
 
 class UserRepository:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
     # === Read ===
-    def get_by_email(self, email: str) -> User | None:
-        statement = select(User).where(User.email == email)
-        return self.session.exec(statement).first()
+    async def get_by_email(self, email: str) -> User | None:
+        # lower(email) matches the ix_user_email_lower expression index, so a
+        # differently-cased login is still an index probe, not a table scan
+        statement = select(User).where(func.lower(User.email) == normalize_email(email))
+        return (await self.session.exec(statement)).first()
 
     # === Create ===
-    def create(self, user_create: UserCreate) -> User:
-        hashed_password = get_password_hash(user_create.password)
-        # Populate required 'name' using email local-part as a default
-        default_name = user_create.email.split("@")[0]
-        user = User(name=default_name, email=user_create.email, hashed_password=hashed_password)
+    async def create(self, user_create: UserCreate) -> User:
+        # Password hashing is deliberately slow; run it on the hash pool so the event loop stays free
+        hashed_password = await run_in_hash_pool(get_password_hash, user_create.password)
+        user = User(
+            name=user_create.name,
+            email=normalize_email(user_create.email),
+            hashed_password=hashed_password,
+        )
         self.session.add(user)
-        self.session.flush()
+        await self.session.flush()
         return user
+
+
+def get_user_repository(session: AsyncSession) -> UserRepository:
+    """
+    Return the Redis-cached repository when Redis is configured, else the
+    in-process cached one, or the plain one when USER_LOCAL_CACHE_SIZE is 0.
+    """
+    from app.core.config import settings
+    from app.db.cache import redis_client
+
+    # Each cached variant is imported only on its own branch, so redis is
+    # never imported when REDIS_URL is unset
+    if redis_client is not None:
+        from app.repositories.cached_users import CachedUserRepository
+
+        return CachedUserRepository(session, redis_client)
+    if settings.USER_LOCAL_CACHE_SIZE > 0:
+        from app.repositories.local_cached_users import LocalCachedUserRepository
+
+        return LocalCachedUserRepository(session)
+    return UserRepository(session)
@@ -5,7 +5,8 @@
 from __future__ import annotations
 
 from datetime import datetime
-from pydantic import BaseModel
+import msgspec
+from pydantic import BaseModel, ConfigDict
 
 
 class ApiKeyMeta(BaseModel):
@@ -13,8 +14,14 @@ class ApiKeyMeta(BaseModel):
     key_prefix: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ApiKeyMetaMsg(msgspec.Struct):
+    # Same fields as ApiKeyMeta, for encoding read-only lists with msgspec
+    id: int
+    key_prefix: str
+    created_at: datetime
 
 
 class ApiKeyCreateResponse(ApiKeyMeta):
@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, model_validator
 
 
 class UserBase(BaseModel):
@@ -14,11 +14,24 @@ class UserBase(BaseModel):
 
 class UserCreate(UserBase):
     password: str
+    name: str | None = Field(default=None, max_length=100)
+
+    @model_validator(mode="after")
+    def default_name_from_email(self) -> UserCreate:
+        # Default the display name to the email's local part
+        if not self.name:
+            self.name = self.email.split("@", 1)[0]
+        return self
 
 
 class UserRead(UserBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CurrentUser(BaseModel):
+    # Identity of the authenticated caller, read from verified JWT claims
+    id: int
+    email: str
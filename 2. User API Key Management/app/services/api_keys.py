@@ -4,41 +4,73 @@
 
 from __future__ import annotations
 
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi import HTTPException, status
 
-from app.core.security import generate_api_key, hash_api_key
+from app.core.security import KEY_SEPARATOR, generate_api_key, hash_api_key, run_in_hash_pool, verify_api_key
 from app.models.apikey import ApiKeys
+from app.repositories.api_keys import ApiKeyRepository
 
 
 class ApiKeyService:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
-    def create_for_user(self, user_id: int) -> tuple[ApiKeys, str]:
+    async def create_for_user(self, user_id: int) -> tuple[ApiKeys, str]:
         plaintext, prefix = generate_api_key()
         hashed = hash_api_key(plaintext)
 
-        apikey = ApiKeys(key_prefix=prefix, hashed_key=hashed, user_id=user_id)
-        self.session.add(apikey)
-        self.session.commit()
-        self.session.refresh(apikey)
+        repo = ApiKeyRepository(self.session)
+        # The flush fills in the id and every other column already has its
+        # value (sessions don't expire on commit), so no refresh SELECT is needed
+        apikey = await repo.create(ApiKeys(key_prefix=prefix, hashed_key=hashed, user_id=user_id))
+        await self.session.commit()
         return apikey, plaintext
 
-    def list_for_user(self, user_id: int) -> list[ApiKeys]:
-        from app.repositories.api_keys import ApiKeyRepository
+    async def create_for_users(self, user_ids: list[int]) -> list[tuple[ApiKeys, str]]:
+        """Provision one new key per user id with a single INSERT and commit."""
+        generated = [generate_api_key() for _ in user_ids]
+        # Hashing is one BLAKE2b pass per key (microseconds), so a thread pool
+        # would cost more than it saves
+        pending = [
+            ApiKeys(key_prefix=prefix, hashed_key=hash_api_key(plaintext), user_id=user_id)
+            for user_id, (plaintext, prefix) in zip(user_ids, generated)
+        ]
+        repo = ApiKeyRepository(self.session)
+        apikeys = await repo.create_many(pending)
+        await self.session.commit()
+        return [(apikey, plaintext) for apikey, (plaintext, _) in zip(apikeys, generated)]
 
+    async def verify(self, plain_key: str) -> ApiKeys | None:
+        """Return the stored key matching a presented API key, or None."""
+        # The visible prefix narrows the search to one indexed row, so only
+        # that candidate's hash is checked instead of every stored key
+        key_prefix, separator, _ = plain_key.partition(KEY_SEPARATOR)
+        if not separator:
+            return None
         repo = ApiKeyRepository(self.session)
-        return repo.list_by_user(user_id)
+        for candidate in await repo.list_by_prefix(key_prefix):
+            # Only legacy bcrypt hashes are slow enough to need the hash pool;
+            # BLAKE2b and HMAC checks take microseconds, less than the handoff
+            if candidate.hashed_key.startswith("$2"):
+                matched = await run_in_hash_pool(verify_api_key, plain_key, candidate.hashed_key)
+            else:
+                matched = verify_api_key(plain_key, candidate.hashed_key)
+            if matched:
+                return candidate
+        return None
 
-    def revoke_for_user(self, user_id: int, key_id: int) -> None:
-        from app.repositories.api_keys import ApiKeyRepository
+    async def list_for_user(self, user_id: int) -> list[ApiKeys]:
+        repo = ApiKeyRepository(self.session)
+        return await repo.list_by_user(user_id)
 
+    async def revoke_for_user(self, user_id: int, key_id: int) -> None:
         repo = ApiKeyRepository(self.session)
-        apikey = repo.get(key_id)
-        if not apikey:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="API key not found")
-        if apikey.user_id != user_id:
+        # Happy path is a single DELETE; only a miss pays for the lookup that
+        # tells "no such key" (404) apart from "someone else's key" (403)
+        deleted = await repo.delete_owned(key_id, user_id)
+        if not deleted:
+            if not await repo.exists(key_id):
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="API key not found")
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to revoke this key")
-        repo.delete(apikey)
-        self.session.commit()
+        await self.session.commit()
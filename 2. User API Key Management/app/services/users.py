@@ -4,27 +4,32 @@
 
 from __future__ import annotations
 
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.repositories.users import UserRepository
-from app.core.security import verify_password
+from app.repositories.users import get_user_repository
+from app.core.security import run_in_hash_pool, verify_password
 from app.schemas.users import UserCreate
 from app.models.user import User
 
 
 class UserService:
-    def __init__(self, session: Session):
-        self.repo = UserRepository(session)
+    def __init__(self, session: AsyncSession):
+        self.repo = get_user_repository(session)
         self.session = session
 
-    def authenticate(self, email: str, password: str) -> User | None:
-        user = self.repo.get_by_email(email)
-        if not user or not verify_password(password, user.hashed_password):  # type: ignore[attr-defined]
+    async def authenticate(self, email: str, password: str) -> User | None:
+        user = await self.repo.get_by_email(email)
+        # Verify even when the user is unknown, so the response time doesn't
+        # reveal which emails are registered. Hashing is CPU-bound; run it on
+        # the dedicated hash pool, off the event loop
+        hashed_password = user.hashed_password if user else None  # type: ignore[attr-defined]
+        if not await run_in_hash_pool(verify_password, password, hashed_password) or not user:
             return None
         return user
 
-    def create_user(self, user_create: UserCreate) -> User:
-        user = self.repo.create(user_create)
-        self.session.commit()
-        self.session.refresh(user)
+    async def create_user(self, user_create: UserCreate) -> User:
+        # The flush in repo.create already assigned the id, and created_at is
+        # set in Python, so the commit needs no follow-up refresh SELECT
+        user = await self.repo.create(user_create)
+        await self.session.commit()
         return user
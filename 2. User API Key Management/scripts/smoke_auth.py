@@ -1,9 +1,10 @@
+import asyncio
 from fastapi.testclient import TestClient
 import app.main as m
-from app.db.session import create_db_and_tables
+from app.db.session import run_migrations
 
 # Ensure DB schema is up to date for local smoke test
-create_db_and_tables()
+asyncio.run(run_migrations())
 
 with TestClient(m.app) as c:
     reg = c.post('/register', json={'email': 'alice@example.com', 'password': 'secret123'})
@@ -5,7 +5,8 @@ import subprocess
 import csv
 import os
 import re
-from datetime import datetime
+import tarfile
+from functools import lru_cache
 import sys
 
 # --- DYNAMIC CONFIGURATION ---
@@ -20,29 +21,48 @@ N8N_REPO_PATH = os.path.dirname(script_dir)
 COMMIT_LOG_CSV_PATH = os.path.join(script_dir, 'n8n_full_commit_log.csv')
 # --- END CONFIGURATION ---
 
+# Patterns used to sanitize commit messages, compiled once
+UNSAFE_CHARS_RE = re.compile(r'[^\w\s-]')
+WHITESPACE_RE = re.compile(r'\s+')
+
+@lru_cache(maxsize=1)
+def load_commit_index():
+    """
+    Reads the CSV log file once and indexes its commits by date string.
+    
+    Later calls reuse the cached index, so looking up many dates costs a
+    single read of the file. When several commits share a date, the first
+    one in the log is kept.
+    """
+    index = {}
+    with open(COMMIT_LOG_CSV_PATH, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        # Skip header
+        next(reader, None) 
+        for row in reader:
+            # Ensure row has enough columns to avoid errors
+            if len(row) >= 4:
+                index.setdefault(row[1], row)
+    return index
+
 def find_commit_by_date(target_date_str):
     """
-    Searches the CSV log file for a commit matching the target date string.
+    Looks up the commit matching the target date string in the CSV log index.
     
     Returns:
         A dictionary with 'hash', 'date', and 'message' if found, otherwise None.
     """
     print(f"Searching for commit on date: {target_date_str}...")
     try:
-        with open(COMMIT_LOG_CSV_PATH, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            # Skip header
-            next(reader, None) 
-            for row in reader:
-                # Ensure row has enough columns to avoid errors
-                if len(row) >= 4 and row[1] == target_date_str:
-                    commit_details = {
-                        'hash': row[0],
-                        'date': row[1],
-                        'message': row[3]
-                    }
-                    print(f"✅ Found commit: {commit_details['hash']}")
-                    return commit_details
+        row = load_commit_index().get(target_date_str)
+        if row is not None:
+            commit_details = {
+                'hash': row[0],
+                'date': row[1],
+                'message': row[3]
+            }
+            print(f"✅ Found commit: {commit_details['hash']}")
+            return commit_details
     except FileNotFoundError:
         print(f"❌ ERROR: Log file not found at '{COMMIT_LOG_CSV_PATH}'")
         return None
@@ -57,16 +77,16 @@ def create_snapshot_directory_name(commit_date_str, commit_message):
     """
     Creates a sanitized, file-system-safe directory name from commit details.
     """
-    # Parse the date to reformat it
-    dt_object = datetime.fromisoformat(commit_date_str)
-    # UPDATED THIS LINE to include hours and minutes
-    formatted_date = dt_object.strftime('%y_%m_%d__%H_%M') # yy_mm_dd__hh_mm format
+    # The log stores strict ISO 8601 dates (git's %cI, e.g. 2019-06-24T10:28:18+02:00),
+    # so the parts can be sliced out directly instead of parsing a datetime
+    d = commit_date_str
+    formatted_date = f"{d[2:4]}_{d[5:7]}_{d[8:10]}__{d[11:13]}_{d[14:16]}" # yy_mm_dd__hh_mm format
 
     # Sanitize the commit message for use in a folder name
     # 1. Keep only letters, numbers, spaces, and hyphens
-    sane_message = re.sub(r'[^\w\s-]', '', commit_message).strip()
+    sane_message = UNSAFE_CHARS_RE.sub('', commit_message).strip()
     # 2. Replace spaces with a single hyphen
-    sane_message = re.sub(r'\s+', '-', sane_message)
+    sane_message = WHITESPACE_RE.sub('-', sane_message)
     # 3. Truncate to a reasonable length
     sane_message = sane_message[:50]
 
@@ -76,6 +96,8 @@ def export_commit_snapshot(commit_hash, target_dir):
     """
     Uses 'git archive' to export a clean snapshot of a commit to a target directory.
     This is much more efficient than re-cloning.
+    The archive is streamed straight into Python's tarfile, so only one
+    process (git) is spawned and no shell is involved.
     """
     if not os.path.exists(target_dir):
         os.makedirs(target_dir)
@@ -85,13 +107,22 @@ def export_commit_snapshot(commit_hash, target_dir):
         return False
 
     # Command to export the commit content into the new directory
-    # 'git archive' creates a tarball, and 'tar -x' extracts it in the target directory.
-    command = f'git archive {commit_hash} | tar -x -C "{target_dir}"'
+    # 'git archive' writes a tarball to stdout, which is extracted as it streams in.
+    command = ['git', 'archive', commit_hash]
     
     print(f"Exporting snapshot of commit {commit_hash}...")
     try:
-        # We use shell=True because of the pipe (|) in the command
-        subprocess.run(command, shell=True, check=True, cwd=N8N_REPO_PATH)
+        with subprocess.Popen(command, stdout=subprocess.PIPE, cwd=N8N_REPO_PATH) as process:
+            try:
+                # 'r|' reads the tar as a stream, so it never needs to be buffered whole
+                with tarfile.open(fileobj=process.stdout, mode='r|') as archive:
+                    archive.extractall(target_dir, filter='tar')
+            except tarfile.ReadError:
+                # An empty stream just means git failed; report that via its exit code
+                if process.wait() == 0:
+                    raise
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, command)
         print("✅ Snapshot exported successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -5,13 +5,16 @@ This module defines all API endpoints with proper HTTP semantics,
 request/response models, and error handling.
 """
 
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, status
 
 from inventory_api.models.api import (
     ProductCreate,
     ProductResponse,
     ProductListResponse,
     StockOperation,
+    StockAdjustmentRequest,
     ErrorResponse,
     ValidationErrorResponse,
     InsufficientStockErrorResponse,
@@ -84,20 +87,32 @@ async def create_product(
     }
 )
 async def get_all_products(
+    skus: Optional[str] = Query(
+        default=None,
+        description="Comma-separated SKUs to look up; omit to list every product",
+        examples=["TSHIRT-RED-L,JEANS-BLUE-32"]
+    ),
     service: ProductServiceProtocol = Depends(get_product_service)
 ) -> ProductListResponse:
     """
-    Retrieve all products.
+    Retrieve all products, or only the ones named in `skus`.
     
     Returns a list of all products in the inventory with their current stock levels.
     The list may be empty if no products have been created yet.
     
+    - **skus**: Optional comma-separated SKUs; fetches just those products in a
+      single request. Unknown SKUs are left out of the result.
+    
     Returns a ProductListResponse containing the list of products.
     
     **Error Scenarios:**
     - 500: Internal server or database errors
     """
-    products = await service.get_all_products()
+    if skus is not None:
+        requested = [sku.strip() for sku in skus.split(",") if sku.strip()]
+        products = await service.get_products_by_skus(requested)
+    else:
+        products = await service.get_all_products()
     return ProductListResponse(products=products)
 
 
@@ -233,4 +248,54 @@ async def remove_stock(
     - 422: Request validation errors (e.g., amount <= 0)
     - 500: Internal server or database errors
     """
-    return await service.remove_stock(sku, operation.amount)
\ No newline at end of file
+    return await service.remove_stock(sku, operation.amount)
+
+
+@router.patch(
+    "/{sku}/adjust",
+    response_model=ProductResponse,
+    responses={
+        200: {"description": "Stock adjusted successfully"},
+        400: {
+            "description": "Bad Request - Invalid amount or insufficient stock",
+            "model": InsufficientStockErrorResponse
+        },
+        404: {
+            "description": "Product not found",
+            "model": ErrorResponse
+        },
+        422: {
+            "description": "Validation Error - Invalid request format",
+            "model": ValidationErrorResponse
+        },
+        500: {
+            "description": "Internal Server Error",
+            "model": ErrorResponse
+        }
+    }
+)
+async def adjust_stock(
+    sku: str,
+    adjustment: StockAdjustmentRequest,
+    service: ProductServiceProtocol = Depends(get_product_service)
+) -> ProductResponse:
+    """
+    Apply several stock operations to a product at once.
+    
+    Applies each add/remove operation in order within a single transaction,
+    saving a request per step compared to calling /add and /remove
+    repeatedly. If any removal would take stock below zero, none of the
+    operations are applied.
+    
+    - **sku**: The Stock Keeping Unit identifier
+    - **operations**: List of `{"op": "add" | "remove", "amount": n}` steps
+    
+    Returns the product with its stock quantity after all operations.
+    
+    **Error Scenarios:**
+    - 400: Insufficient stock at some step of the sequence
+    - 404: Product with the specified SKU does not exist
+    - 422: Request validation errors (e.g., empty list, amount <= 0, unknown op)
+    - 500: Internal server or database errors
+    """
+    return await service.adjust_stock(sku, adjustment.operations)
\ No newline at end of file
@@ -5,8 +5,10 @@ This module provides SQLModel database engine and session management
 with proper async support and connection pooling.
 """
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
 
 from inventory_api.core.config import get_settings
@@ -15,6 +17,41 @@ from inventory_api.core.config import get_settings
 # Global engine instance
 engine = None
 
+# Database used when the application runs with environment=testing
+TESTING_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+def is_memory_database(database_url: str) -> bool:
+    """
+    Check whether a database URL points at an in-memory SQLite database.
+    
+    Covers both the plain ``:memory:`` form and named shared-cache URIs
+    such as ``file:inventory?mode=memory&cache=shared&uri=true``.
+    
+    Args:
+        database_url: SQLAlchemy database URL
+        
+    Returns:
+        bool: True if the database is held in memory
+    """
+    return ":memory:" in database_url or "mode=memory" in database_url
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Tune every new file-backed SQLite connection for concurrent access.
+    
+    WAL lets readers proceed while a write is in progress, busy_timeout makes
+    a blocked writer wait instead of failing with "database is locked", and
+    synchronous=NORMAL is durable under WAL with far fewer fsyncs.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
 
 def get_engine():
     """
@@ -29,14 +66,29 @@ def get_engine():
         
         # Convert sqlite:// to sqlite+aiosqlite:// for async support
         database_url = settings.database_url
+        if settings.environment == "testing":
+            # Keep test runs in RAM: no database file, no fsync on commit
+            database_url = TESTING_DATABASE_URL
         if database_url.startswith("sqlite://"):
             database_url = database_url.replace("sqlite://", "sqlite+aiosqlite://")
         
+        engine_options = {}
+        if is_memory_database(database_url):
+            # An in-memory database only lives as long as its connection, so
+            # every session must share one connection to see the same schema
+            engine_options["poolclass"] = StaticPool
+            engine_options["connect_args"] = {"check_same_thread": False}
+        
         engine = create_async_engine(
             database_url,
             echo=settings.database_echo,
-            future=True
+            future=True,
+            **engine_options
         )
+        
+        # WAL needs a database file; in-memory databases keep their own journal
+        if database_url.startswith("sqlite") and not is_memory_database(database_url):
+            event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
     
     return engine
 
@@ -136,4 +188,28 @@ async def drop_tables():
     """
     engine = get_engine()
     async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
\ No newline at end of file
+        await conn.run_sync(SQLModel.metadata.drop_all)
+
+
+async def clear_tables():
+    """
+    Delete all rows from every table while keeping the schema.
+    
+    Much cheaper than drop_tables() followed by create_tables() when only the
+    data needs resetting, e.g. between tests. Runs in a single transaction:
+    PostgreSQL truncates every table in one statement, other backends delete
+    table by table in reverse dependency order so foreign keys stay valid.
+    """
+    # Import models to ensure they're registered with SQLModel metadata
+    from inventory_api.models.database import Product
+    
+    engine = get_engine()
+    tables = SQLModel.metadata.sorted_tables
+    async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            from sqlalchemy import text
+            table_names = ", ".join(f'"{table.name}"' for table in tables)
+            await conn.execute(text(f"TRUNCATE {table_names} RESTART IDENTITY CASCADE"))
+        else:
+            for table in reversed(tables):
+                await conn.execute(table.delete())
\ No newline at end of file
@@ -7,7 +7,7 @@ HTTP responses with proper status codes.
 """
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import IntegrityError
 from pydantic import ValidationError
@@ -112,7 +112,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
     async def product_not_found_handler(request: Request, exc: ProductNotFound):
         """Handle ProductNotFound exceptions with 404 status."""
         logger.info(f"Product not found: {exc.sku}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={
                 "error": "Product Not Found",
@@ -127,7 +127,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
     async def insufficient_stock_handler(request: Request, exc: InsufficientStock):
         """Handle InsufficientStock exceptions with 400 status."""
         logger.warning(f"Insufficient stock for {exc.sku}: requested {exc.requested_amount}, available {exc.available_amount}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "error": "Insufficient Stock",
@@ -144,7 +144,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
     async def duplicate_sku_handler(request: Request, exc: DuplicateSKU):
         """Handle DuplicateSKU exceptions with 400 status."""
         logger.warning(f"Attempt to create duplicate SKU: {exc.sku}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "error": "Duplicate SKU",
@@ -159,7 +159,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
     async def database_error_handler(request: Request, exc: DatabaseError):
         """Handle DatabaseError exceptions with 500 status."""
         logger.error(f"Database error during {exc.operation}: {exc.original_error}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Database Error",
@@ -177,7 +177,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
         
         # Check if this is a duplicate SKU error
         if "UNIQUE constraint failed" in str(exc.orig) and "sku" in str(exc.orig):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={
                     "error": "Duplicate SKU",
@@ -189,7 +189,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
         
         # Check for other constraint violations
         if "CHECK constraint failed" in str(exc.orig):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={
                     "error": "Data Constraint Violation",
@@ -200,7 +200,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
             )
         
         # Generic integrity error
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "error": "Data Integrity Error",
@@ -286,7 +286,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
                     "provided_value": error.get("input")
                 })
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={
                 "error": "Validation Error",
@@ -302,7 +302,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
         """Handle Pydantic validation errors."""
         logger.warning(f"Pydantic validation error: {exc.errors()}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={
                 "error": "Validation Error",
@@ -317,7 +317,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
         """Handle ValueError exceptions from business logic."""
         logger.warning(f"Value error: {exc}")
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "error": "Invalid Value",
@@ -337,7 +337,7 @@ def setup_exception_handlers(app: FastAPI) -> None:
         """
         logger.error(f"Unhandled exception: {type(exc).__name__}: {exc}", exc_info=True)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Internal Server Error",
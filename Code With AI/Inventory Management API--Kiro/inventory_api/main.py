@@ -7,6 +7,8 @@ with proper middleware, exception handlers, and routing setup.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from inventory_api.core.config import get_settings
 from inventory_api.core.exceptions import setup_exception_handlers
@@ -66,6 +68,8 @@ def create_app() -> FastAPI:
         - **Technical Deep Dive:** [Atomic Transactions](./docs/atomic-transactions.md)
         """,
         version=settings.api_version,
+        # Serialize responses with orjson instead of the stdlib json encoder
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
         contact={
@@ -111,6 +115,10 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Compress larger responses (e.g. full product lists) for clients that accept gzip;
+    # small single-product payloads are not worth the CPU and are sent as-is
+    app.add_middleware(GZipMiddleware, minimum_size=500)
+    
     # Setup exception handlers
     setup_exception_handlers(app)
     
@@ -6,10 +6,15 @@ validation, serialization, and documentation for all API operations.
 """
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import Optional
+from typing import Literal, Optional
 import re
 
 
+# SKU format compiled once at import rather than on every validation.
+# Matched with fullmatch, since '$' alone would also accept a trailing newline.
+SKU_PATTERN = re.compile(r'[A-Z0-9\-]+')
+
+
 class ProductCreate(BaseModel):
     """
     Input model for creating products. 
@@ -48,7 +53,7 @@ class ProductCreate(BaseModel):
         Validate SKU format - should contain only alphanumeric characters and hyphens.
         This ensures SKUs are URL-safe and follow common conventions.
         """
-        if not re.match(r'^[A-Z0-9\-]+$', v):
+        if not SKU_PATTERN.fullmatch(v):
             raise ValueError('SKU must contain only uppercase letters, numbers, and hyphens')
         return v
     
@@ -56,9 +61,10 @@ class ProductCreate(BaseModel):
     @classmethod
     def validate_name_not_empty(cls, v):
         """Ensure name is not just whitespace."""
-        if not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError('Product name cannot be empty or just whitespace')
-        return v.strip()
+        return stripped
     
     @field_validator('description')
     @classmethod
@@ -104,6 +110,47 @@ class StockOperation(BaseModel):
     )
 
 
+class StockAdjustment(BaseModel):
+    """
+    A single step in a bulk stock adjustment.
+    
+    Unlike StockOperation, the operation type travels with the amount so that
+    several adds and removes can be sent to the adjust endpoint at once.
+    """
+    
+    op: Literal["add", "remove"] = Field(description="Whether to add or remove stock")
+    
+    amount: int = Field(
+        gt=0,
+        description="Amount to add or remove (must be positive)"
+    )
+
+
+class StockAdjustmentRequest(BaseModel):
+    """
+    Model for applying several stock operations to one product in one request.
+    
+    The operations are applied in order within a single transaction: either
+    all of them succeed or the product is left unchanged.
+    """
+    
+    operations: list[StockAdjustment] = Field(
+        min_length=1,
+        description="Stock operations to apply, in order"
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "operations": [
+                    {"op": "add", "amount": 10},
+                    {"op": "remove", "amount": 3}
+                ]
+            }
+        }
+    )
+
+
 class ProductResponse(BaseModel):
     """
     Response model for product data.
@@ -119,6 +166,9 @@ class ProductResponse(BaseModel):
     
     model_config = ConfigDict(
         from_attributes=True,
+        # Responses are snapshots of a product; freezing them keeps them from
+        # drifting from what was read and makes them hashable
+        frozen=True,
         json_schema_extra={
             "example": {
                 "sku": "TSHIRT-RED-L",
@@ -46,6 +46,18 @@ class ProductRepositoryProtocol(Protocol):
         """
         ...
     
+    async def get_products_by_skus(self, skus: list[str]) -> list[Product]:
+        """
+        Retrieve every product whose SKU is in the given list.
+        
+        Args:
+            skus: Stock Keeping Unit identifiers to look up
+            
+        Returns:
+            list[Product]: Matching products; unknown SKUs are simply absent
+        """
+        ...
+    
     async def get_product_by_sku(self, sku: str) -> Optional[Product]:
         """
         Retrieve a product by its SKU.
@@ -81,14 +93,13 @@ class ProductRepositoryProtocol(Protocol):
         """
         Atomically remove stock from a product with safety checks.
         
-        This operation implements the critical read-check-update pattern within
-        a transaction to prevent race conditions and ensure stock never goes negative.
+        The stock check and the update must happen atomically to prevent race
+        conditions and ensure stock never goes negative.
         
         The implementation must:
-        1. Lock the product row (SELECT FOR UPDATE)
-        2. Check if sufficient stock is available
-        3. Update the quantity if check passes
-        4. Return None if insufficient stock (without modifying the product)
+        1. Check if sufficient stock is available and update the quantity
+           in one atomic step (e.g. UPDATE ... WHERE quantity >= amount)
+        2. Return None if insufficient stock (without modifying the product)
         
         Args:
             sku: The Stock Keeping Unit identifier
@@ -101,4 +112,25 @@ class ProductRepositoryProtocol(Protocol):
         Raises:
             ValueError: If amount is not positive
         """
+        ...
+    
+    async def adjust_stock_atomic(self, sku: str, changes: list[int]) -> Optional[Product]:
+        """
+        Atomically apply a sequence of stock changes to a product.
+        
+        Each change is a signed amount: positive adds stock, negative removes it.
+        All changes are applied in one transaction, and the quantity must never
+        drop below zero at any step.
+        
+        Args:
+            sku: The Stock Keeping Unit identifier
+            changes: Signed, non-zero stock changes in the order to apply them
+            
+        Returns:
+            Product | None: Updated product if found, None if product doesn't exist
+            
+        Raises:
+            ValueError: If any change is zero
+            InsufficientStock: If a removal would take the quantity below zero
+        """
         ...
\ No newline at end of file
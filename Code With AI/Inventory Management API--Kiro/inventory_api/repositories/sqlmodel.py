@@ -5,15 +5,16 @@ This module provides the concrete implementation of the ProductRepositoryProtoco
 using SQLModel/SQLAlchemy with proper async support and atomic operations.
 """
 
+from itertools import accumulate
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import SQLModel
 
 from inventory_api.models.database import Product
 from inventory_api.models.api import ProductCreate
-from inventory_api.core.exceptions import DuplicateSKU
+from inventory_api.core.exceptions import DuplicateSKU, InsufficientStock
 
 
 class SQLModelProductRepository:
@@ -78,6 +79,22 @@ class SQLModelProductRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
     
+    async def get_products_by_skus(self, skus: list[str]) -> list[Product]:
+        """
+        Retrieve every product whose SKU is in the given list.
+        
+        Uses a single WHERE sku IN (...) query instead of one lookup per SKU.
+        
+        Args:
+            skus: Stock Keeping Unit identifiers to look up
+            
+        Returns:
+            list[Product]: Matching products ordered by SKU; unknown SKUs are simply absent
+        """
+        stmt = select(Product).where(Product.sku.in_(skus)).order_by(Product.sku)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+    
     async def get_product_by_sku(self, sku: str) -> Optional[Product]:
         """
         Retrieve a product by its SKU.
@@ -92,25 +109,61 @@ class SQLModelProductRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def _apply_stock_change(
+        self, sku: str, change: int, required_quantity: int = 0
+    ) -> Optional[Product]:
+        """
+        Apply a stock change as one conditional UPDATE and commit it.
+        
+        Every stock mutation goes through here, so they all share one atomic
+        idiom: the quantity is computed inside the database
+        (quantity = quantity + change) and the stock check is part of the same
+        statement (quantity >= required_quantity). There is no window between
+        reading the quantity and writing it back for a concurrent request to
+        slip into. RETURNING hands back the new row, and populate_existing
+        refreshes any copy already in the session.
+        
+        Args:
+            sku: The Stock Keeping Unit identifier
+            change: Signed amount to add to the stored quantity
+            required_quantity: Smallest stored quantity the change may start from
+            
+        Returns:
+            Product | None: Updated product, or None if no row matched (the
+                           product doesn't exist or has too little stock)
+        """
+        stmt = (
+            update(Product)
+            .where(Product.sku == sku, Product.quantity >= required_quantity)
+            .values(quantity=Product.quantity + change)
+            .returning(Product)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        product = result.scalar_one_or_none()
+        
+        # 💾 COMMIT: Persists the change (or simply ends the transaction if no row matched)
+        await self.session.commit()
+        return product
+    
     async def add_stock_atomic(self, sku: str, amount: int) -> Optional[Product]:
         """
         Atomically add stock to a product with race condition prevention.
         
-        Even though stock addition doesn't risk negative values, we still use
-        atomic transactions to prevent lost updates and ensure data consistency.
+        Even though stock addition doesn't risk negative values, the increment
+        must still be atomic to prevent lost updates and ensure data consistency.
         
-        ATOMIC TRANSACTION PATTERN:
-        1. Begin transaction (implicit with session)
-        2. SELECT FOR UPDATE - locks the product row
-        3. Verify product exists
-        4. Update quantity (safe operation - only adding)
-        5. COMMIT - releases lock and persists changes
+        ATOMIC UPDATE PATTERN:
+        1. A single UPDATE computes the new quantity from the stored one
+           (quantity = quantity + amount) and returns the updated row
+        2. No row returned - the product doesn't exist
+        3. COMMIT - persists the change
         
         RACE CONDITION SCENARIO PREVENTED:
         - Request A: Add 10 items (reads quantity=50)
         - Request B: Add 5 items (reads quantity=50) 
-        - Without locking: Both update based on 50, result could be 55 or 60
-        - With locking: Serialized execution ensures result is always 65
+        - Read-modify-write: Both update based on 50, result could be 55 or 60
+        - In-database increment: Each UPDATE applies to the current value, result is always 65
         
         Args:
             sku: The Stock Keeping Unit identifier
@@ -125,57 +178,38 @@ class SQLModelProductRepository:
         if amount <= 0:
             raise ValueError("Amount must be positive")
         
-        # 🔒 CRITICAL: SELECT FOR UPDATE acquires an exclusive lock on the product row
-        # This lock is held until the transaction completes (COMMIT or ROLLBACK)
-        # Other transactions attempting to SELECT FOR UPDATE on the same row will wait
-        stmt = select(Product).where(Product.sku == sku).with_for_update()
-        result = await self.session.execute(stmt)
-        product = result.scalar_one_or_none()
-        
-        if not product:
-            # Product doesn't exist - return None without modifying anything
-            # Transaction will be rolled back automatically
-            return None
-        
-        # ✅ SAFE UPDATE: We have exclusive access to this product row
-        # No other transaction can read or modify this product until we commit
-        product.quantity += amount
-        
-        # 💾 COMMIT: Persists changes and releases the lock
-        # Other waiting transactions can now proceed
-        await self.session.commit()
-        return product
+        return await self._apply_stock_change(sku, amount)
     
     async def remove_stock_atomic(self, sku: str, amount: int) -> Optional[Product]:
         """
         Atomically remove stock from a product with comprehensive safety checks.
         
-        This method implements the critical READ-CHECK-UPDATE pattern within
-        a database transaction to prevent race conditions and ensure stock never goes negative.
-        This is the most important method for preventing overselling in e-commerce scenarios.
+        The stock check and the decrement are a single conditional UPDATE, so
+        stock can never go negative and there is no read-check-update window
+        for a concurrent request to slip into. This is the most important method
+        for preventing overselling in e-commerce scenarios.
         
-        ATOMIC TRANSACTION PATTERN (Read-Check-Update):
-        1. Begin transaction (implicit with session)
-        2. SELECT FOR UPDATE - locks the product row exclusively
-        3. Verify product exists
-        4. CHECK: Ensure sufficient stock is available
-        5. UPDATE: Decrease quantity only if check passes
-        6. COMMIT: Release lock and persist changes
+        ATOMIC UPDATE PATTERN (Conditional Update):
+        1. UPDATE ... SET quantity = quantity - amount
+           WHERE sku = :sku AND quantity >= :amount
+        2. Row returned - the check passed and the stock was removed
+        3. No row returned - the product doesn't exist or has too little stock,
+           and nothing was modified
+        4. COMMIT: Persist changes
         
         RACE CONDITION SCENARIO PREVENTED:
         Initial state: Product has quantity = 1
         - Customer A: Wants to buy 1 item
         - Customer B: Wants to buy 1 item (simultaneously)
         
-        WITHOUT ATOMIC TRANSACTIONS:
+        WITH READ-CHECK-UPDATE:
         T1: A reads quantity=1 ✓ (sufficient)    T2: B reads quantity=1 ✓ (sufficient)
         T1: A updates quantity=0 ✓               T2: B updates quantity=0 ✓
         Result: Both customers get the item, but stock is oversold!
         
-        WITH ATOMIC TRANSACTIONS:
-        T1: A locks row, reads quantity=1 ✓      T2: B waits for lock...
-        T1: A updates quantity=0 ✓, commits     T2: B gets lock, reads quantity=0 ❌
-        T1: Lock released                        T2: B gets "insufficient stock" error
+        WITH A CONDITIONAL UPDATE:
+        T1: A's UPDATE matches quantity=1 ✓      T2: B's UPDATE waits for the write lock...
+        T1: A sets quantity=0 ✓, commits         T2: B's WHERE quantity >= 1 matches nothing ❌
         Result: Only A gets the item, B gets proper error message
         
         Args:
@@ -192,38 +226,71 @@ class SQLModelProductRepository:
         if amount <= 0:
             raise ValueError("Amount must be positive")
         
-        # 🔒 CRITICAL SECTION START: Acquire exclusive lock on product row
-        # SELECT FOR UPDATE prevents other transactions from reading or modifying
-        # this specific product until our transaction completes
-        # This is the foundation of our race condition prevention
-        stmt = select(Product).where(Product.sku == sku).with_for_update()
-        result = await self.session.execute(stmt)
-        product = result.scalar_one_or_none()
+        # 🛡️ SAFETY CHECK: The WHERE clause is the stock check. It is evaluated
+        # against the row as it is when the UPDATE runs, so no other transaction
+        # can change the quantity between the check and the write. When nothing
+        # matches, the caller tells "not found" apart from "insufficient stock"
+        # by reading the product afterwards.
+        return await self._apply_stock_change(sku, -amount, required_quantity=amount)
+    
+    async def adjust_stock_atomic(self, sku: str, changes: list[int]) -> Optional[Product]:
+        """
+        Atomically apply a sequence of stock changes to a product.
         
-        if not product:
-            # Product doesn't exist - return None without modifying anything
-            # Transaction will be rolled back automatically
-            return None
-        
-        # 🛡️ SAFETY CHECK: Verify sufficient stock while holding the lock
-        # This is the critical check that prevents overselling
-        # Because we hold the lock, no other transaction can modify the quantity
-        # between this check and the update below
-        if product.quantity < amount:
-            # ❌ INSUFFICIENT STOCK: Don't modify anything
-            # Return None to signal insufficient stock
-            # The transaction will be rolled back automatically
-            # The lock will be released, allowing other transactions to proceed
-            return None
-        
-        # ✅ SAFE UPDATE: We have verified sufficient stock and hold the exclusive lock
-        # No other transaction can interfere with this update
-        product.quantity -= amount
-        
-        # 💾 COMMIT: Persist changes and release the lock
-        # This makes the stock reduction visible to other transactions
-        # Other waiting transactions can now proceed with the updated quantity
-        await self.session.commit()
+        The whole batch is one conditional UPDATE and one commit, replacing a
+        round trip per add/remove. Replayed in order, the batch never dips
+        below its lowest running total, so the UPDATE only matches when the
+        quantity can absorb that dip and then applies the net change:
+        
+            UPDATE ... SET quantity = quantity + :total
+            WHERE sku = :sku AND quantity >= -:lowest_running_total
+        
+        Like remove_stock_atomic, the check and the write happen in the same
+        statement, so concurrent batches can neither lose updates nor oversell.
+        If any removal would go negative, nothing is written.
         
-        # 🔒 CRITICAL SECTION END: Lock is released, other transactions can proceed
-        return product
\ No newline at end of file
+        Args:
+            sku: The Stock Keeping Unit identifier
+            changes: Signed, non-zero stock changes in the order to apply them
+            
+        Returns:
+            Product | None: Updated product if found, None if product doesn't exist
+            
+        Raises:
+            ValueError: If any change is zero
+            InsufficientStock: If a removal would take the quantity below zero
+        """
+        if any(change == 0 for change in changes):
+            raise ValueError("Amount must be positive")
+        
+        running_totals = list(accumulate(changes, initial=0))
+        total = running_totals[-1]
+        lowest_running_total = min(running_totals)
+        
+        while True:
+            product = await self._apply_stock_change(
+                sku, total, required_quantity=-lowest_running_total
+            )
+            if product is not None:
+                return product
+            
+            # Nothing matched: read the row (only on this error path) to tell
+            # "not found" apart from "insufficient stock"
+            stmt = (
+                select(Product)
+                .where(Product.sku == sku)
+                .execution_options(populate_existing=True)
+            )
+            result = await self.session.execute(stmt)
+            product = result.scalar_one_or_none()
+            if product is None:
+                return None
+            
+            # Replay the batch to report the step that fails
+            quantity = product.quantity
+            for change in changes:
+                if quantity + change < 0:
+                    raise InsufficientStock(sku, -change, quantity)
+                quantity += change
+            # Stock was added between the UPDATE and the read, so the batch
+            # fits now: try the conditional UPDATE again
\ No newline at end of file
@@ -9,7 +9,7 @@ and coordination between the API and repository layers.
 from typing import Optional
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
-from inventory_api.models.api import ProductCreate, ProductResponse
+from inventory_api.models.api import ProductCreate, ProductResponse, StockAdjustment
 from inventory_api.models.database import Product
 from inventory_api.repositories.protocols import ProductRepositoryProtocol
 from inventory_api.core.exceptions import (
@@ -113,6 +113,26 @@ class ProductService:
         except SQLAlchemyError as e:
             raise DatabaseError("product retrieval", e)
     
+    async def get_products_by_skus(self, skus: list[str]) -> list[ProductResponse]:
+        """
+        Retrieve several products by SKU in one lookup.
+        
+        Args:
+            skus: Stock Keeping Unit identifiers to look up
+            
+        Returns:
+            list[ProductResponse]: Matching products; unknown SKUs are omitted
+            
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            products = await self.repository.get_products_by_skus(skus)
+            return [self._convert_to_response(product) for product in products]
+            
+        except SQLAlchemyError as e:
+            raise DatabaseError("product retrieval", e)
+    
     async def get_product_by_sku(self, sku: str) -> ProductResponse:
         """
         Retrieve a product by SKU with comprehensive error handling.
@@ -171,8 +191,7 @@ class ProductService:
             DatabaseError: If database operation fails
         """
         # Business rule validation
-        if amount <= 0:
-            raise ValueError("Amount must be positive")
+        self._validate_positive_amount(amount)
         
         try:
             # Attempt atomic stock addition
@@ -181,13 +200,7 @@ class ProductService:
             if product is None:
                 raise ProductNotFound(sku)
             
-            # Convert database entity to API response model
-            return ProductResponse(
-                sku=product.sku,
-                name=product.name,
-                description=product.description,
-                quantity=product.quantity
-            )
+            return self._convert_to_response(product)
             
         except ProductNotFound:
             # Re-raise ProductNotFound as-is
@@ -211,8 +224,10 @@ class ProductService:
         4. Handles insufficient stock errors
         5. Converts result to API response model
         
-        The repository handles the atomic read-check-update pattern to prevent
-        race conditions and ensure stock never goes negative.
+        The repository applies the stock check and the update as one atomic
+        statement to prevent race conditions and ensure stock never goes negative.
+        The product is only read back when the removal fails, to tell a missing
+        product apart from insufficient stock.
         
         Args:
             sku: The Stock Keeping Unit identifier
@@ -228,31 +243,22 @@ class ProductService:
             DatabaseError: If database operation fails
         """
         # Business rule validation
-        if amount <= 0:
-            raise ValueError("Amount must be positive")
+        self._validate_positive_amount(amount)
         
         try:
-            # First, get the current product to check stock levels for error reporting
-            current_product = await self.repository.get_product_by_sku(sku)
-            
-            if current_product is None:
-                raise ProductNotFound(sku)
-            
             # Attempt atomic stock removal
             updated_product = await self.repository.remove_stock_atomic(sku, amount)
             
             if updated_product is None:
-                # Repository returned None, meaning insufficient stock
-                # We already know the product exists, so this must be insufficient stock
+                # Nothing was removed: read the product once to report why
+                current_product = await self.repository.get_product_by_sku(sku)
+                
+                if current_product is None:
+                    raise ProductNotFound(sku)
+                
                 raise InsufficientStock(sku, amount, current_product.quantity)
             
-            # Convert database entity to API response model
-            return ProductResponse(
-                sku=updated_product.sku,
-                name=updated_product.name,
-                description=updated_product.description,
-                quantity=updated_product.quantity
-            )
+            return self._convert_to_response(updated_product)
             
         except (ProductNotFound, InsufficientStock, ValueError):
             # Re-raise these exceptions as-is
@@ -261,12 +267,75 @@ class ProductService:
         except SQLAlchemyError as e:
             raise DatabaseError("stock removal", e)
     
+    async def adjust_stock(self, sku: str, operations: list[StockAdjustment]) -> ProductResponse:
+        """
+        Apply several add/remove operations to a product in one transaction.
+        
+        The operations are turned into signed changes and handed to the
+        repository as one batch, so the whole sequence costs a single
+        lock/commit instead of one request per step.
+        
+        Args:
+            sku: The Stock Keeping Unit identifier
+            operations: Stock operations to apply, in order
+            
+        Returns:
+            ProductResponse: Product data after every operation has been applied
+            
+        Raises:
+            ProductNotFound: If no product exists with the given SKU
+            InsufficientStock: If a removal would take stock below zero
+            ValueError: If there are no operations or an amount is not positive
+            DatabaseError: If database operation fails
+        """
+        # Business rule validation
+        if not operations:
+            raise ValueError("At least one operation is required")
+        for operation in operations:
+            self._validate_positive_amount(operation.amount)
+        
+        changes = [
+            operation.amount if operation.op == "add" else -operation.amount
+            for operation in operations
+        ]
+        
+        try:
+            product = await self.repository.adjust_stock_atomic(sku, changes)
+            
+            if product is None:
+                raise ProductNotFound(sku)
+            
+            return self._convert_to_response(product)
+            
+        except (ProductNotFound, InsufficientStock, ValueError):
+            # Re-raise these exceptions as-is
+            raise
+            
+        except SQLAlchemyError as e:
+            raise DatabaseError("stock adjustment", e)
+    
+    @staticmethod
+    def _validate_positive_amount(amount: int) -> None:
+        """
+        Helper method to enforce that a stock amount is positive.
+        
+        Args:
+            amount: Quantity to add or remove
+            
+        Raises:
+            ValueError: If amount is zero or negative
+        """
+        if amount <= 0:
+            raise ValueError("Amount must be positive")
+    
     def _convert_to_response(self, product: Product) -> ProductResponse:
         """
         Helper method to convert database entity to API response model.
         
         This method centralizes the conversion logic and ensures consistency
-        across all service methods.
+        across all service methods. The entity was validated on its way into
+        the database, so the response is built with model_construct to skip
+        re-running the field validators.
         
         Args:
             product: Database product entity
@@ -274,7 +343,7 @@ class ProductService:
         Returns:
             ProductResponse: API response model
         """
-        return ProductResponse(
+        return ProductResponse.model_construct(
             sku=product.sku,
             name=product.name,
             description=product.description,
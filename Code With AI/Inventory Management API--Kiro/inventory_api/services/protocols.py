@@ -6,7 +6,7 @@ enabling dependency inversion and easy testing while maintaining type safety.
 """
 
 from typing import Protocol
-from inventory_api.models.api import ProductCreate, ProductResponse
+from inventory_api.models.api import ProductCreate, ProductResponse, StockAdjustment
 
 
 class ProductServiceProtocol(Protocol):
@@ -55,6 +55,21 @@ class ProductServiceProtocol(Protocol):
         """
         ...
     
+    async def get_products_by_skus(self, skus: list[str]) -> list[ProductResponse]:
+        """
+        Retrieve several products by SKU in one lookup.
+        
+        Args:
+            skus: Stock Keeping Unit identifiers to look up
+            
+        Returns:
+            list[ProductResponse]: Matching products; unknown SKUs are omitted
+            
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        ...
+    
     async def get_product_by_sku(self, sku: str) -> ProductResponse:
         """
         Retrieve a product by SKU with error handling.
@@ -119,4 +134,23 @@ class ProductServiceProtocol(Protocol):
             ValueError: If amount is not positive
             DatabaseError: If database operation fails
         """
+        ...
+    
+    async def adjust_stock(self, sku: str, operations: list[StockAdjustment]) -> ProductResponse:
+        """
+        Apply several add/remove operations to a product in one transaction.
+        
+        Args:
+            sku: The Stock Keeping Unit identifier
+            operations: Stock operations to apply, in order
+            
+        Returns:
+            ProductResponse: Product data after every operation has been applied
+            
+        Raises:
+            ProductNotFound: If no product exists with the given SKU
+            InsufficientStock: If a removal would take stock below zero
+            ValueError: If there are no operations or an amount is not positive
+            DatabaseError: If database operation fails
+        """
         ...
\ No newline at end of file
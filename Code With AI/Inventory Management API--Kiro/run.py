@@ -13,6 +13,7 @@ Usage:
 
 import argparse
 import asyncio
+import logging
 import sys
 import uvicorn
 
@@ -20,6 +21,9 @@ from inventory_api.core.database import initialize_database, drop_tables
 from inventory_api.core.config import get_settings
 
 
+logger = logging.getLogger("inventory_api.startup")
+
+
 async def init_database_only():
     """Initialize database tables only (no server start)."""
     try:
@@ -50,7 +54,7 @@ def start_server():
     """Start the FastAPI server with proper configuration."""
     settings = get_settings()
     
-    print(f"🚀 Starting Inventory Management API")
+    logger.info("🚀 Starting Inventory Management API")
     
     # Show user-friendly URLs
     if settings.host == "0.0.0.0":
@@ -58,11 +62,10 @@ def start_server():
     else:
         display_host = settings.host
         
-    print(f"📍 Server: http://{display_host}:{settings.port}")
-    print(f"📚 API Docs: http://{display_host}:{settings.port}/docs")
-    print(f"🔧 Environment: {settings.environment}")
-    print(f"💾 Database: {settings.database_url}")
-    print("-" * 50)
+    logger.info("📍 Server: http://%s:%s", display_host, settings.port)
+    logger.info("📚 API Docs: http://%s:%s/docs", display_host, settings.port)
+    logger.info("🔧 Environment: %s", settings.environment)
+    logger.info("💾 Database: %s", settings.database_url)
     
     try:
         uvicorn.run(
@@ -73,9 +76,9 @@ def start_server():
             log_level="info" if settings.environment == "production" else "debug"
         )
     except KeyboardInterrupt:
-        print("\n👋 Server stopped by user")
+        logger.info("👋 Server stopped by user")
     except Exception as e:
-        print(f"❌ Server failed to start: {e}")
+        logger.error("❌ Server failed to start: %s", e)
         sys.exit(1)
 
 
@@ -119,6 +122,9 @@ Environment Variables:
     
     args = parser.parse_args()
     
+    # Configure logging once, before anything is logged
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:     %(message)s")
+    
     # Handle database-only initialization
     if args.init_db_only:
         success = asyncio.run(init_database_only())
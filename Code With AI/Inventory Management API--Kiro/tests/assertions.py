@@ -0,0 +1,50 @@
+"""
+Shared assertion helpers for the API test modules.
+
+The response-contract checks used to be repeated inline in every test; they
+live here so the rewritten assertion bytecode is built once. ``conftest.py``
+registers this module for pytest's assertion rewriting, which turns each
+``assert`` into an explicit check that still runs under ``python -O``.
+
+Response bodies are decoded through ``json_body`` so the tests parse the
+app's orjson output with orjson as well.
+"""
+
+import orjson
+
+
+# Field sets are frozensets so a contract check is one set difference
+# against the payload's keys instead of a membership test per field.
+
+# Fields every product payload carries
+PRODUCT_FIELDS = frozenset({"sku", "name", "description", "quantity"})
+
+# Fields every error response carries
+ERROR_FIELDS = frozenset({"error", "message", "details", "path"})
+
+# Extra fields on specific error responses
+INSUFFICIENT_STOCK_FIELDS = ERROR_FIELDS | {"sku", "requested", "available"}
+VALIDATION_ERROR_FIELDS = ERROR_FIELDS | {"validation_errors"}
+
+# Fields of each entry in ``validation_errors``
+VALIDATION_DETAIL_FIELDS = frozenset({"field", "message", "details"})
+
+
+def assert_has_fields(data: dict, fields: frozenset, kind: str = "required") -> None:
+    """Assert that ``data`` contains every key in ``fields``."""
+    missing = fields - data.keys()
+    assert not missing, f"Missing {kind} fields: {sorted(missing)}"
+
+
+def assert_product_shape(product: dict) -> None:
+    """Assert that a product payload has every field with the expected type."""
+    assert_has_fields(product, PRODUCT_FIELDS)
+    assert isinstance(product["sku"], str)
+    assert isinstance(product["name"], str)
+    assert isinstance(product["description"], str) or product["description"] is None
+    assert isinstance(product["quantity"], int)
+
+
+def json_body(response):
+    """Decode a response body with orjson rather than the stdlib json module."""
+    return orjson.loads(response.content)
@@ -0,0 +1,135 @@
+"""
+Shared pytest configuration for the test suite.
+
+The suite runs with ``INVENTORY_ENVIRONMENT=testing``, which makes the engine
+use an in-memory SQLite database on a single shared connection, so schema
+setup and every request stay in RAM. The environment variable must be set
+before any ``inventory_api`` module is imported, because the engine and
+session factory are created at import time.
+
+Under pytest-xdist every worker is a separate process with its own
+in-memory database, so workers never share state and tests can be spread
+individually (``--dist load``).
+
+The schema and the ``AsyncClient`` are created once per session; the
+``client`` fixture isolates tests by deleting the rows each test wrote instead
+of dropping and recreating every table. Rows are deleted rather than rolled
+back from a per-test SAVEPOINT because the repositories commit their own
+sessions and the concurrency tests run overlapping requests on the one shared
+connection, where nested savepoints would release each other out of order.
+All async tests and fixtures share the session-scoped event loop so the
+engine's pooled connection is only ever used from one loop. Test classes
+whose tests use disjoint SKUs can opt into ``class_scoped_rows`` to clear once
+when the class finishes instead of after every test.
+"""
+
+import asyncio
+import os
+
+os.environ.setdefault("INVENTORY_ENVIRONMENT", "testing")
+
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from pytest_asyncio import is_async_test
+
+from inventory_api.main import app
+from inventory_api.core.database import async_session_factory, clear_tables, create_tables, drop_tables
+from inventory_api.models.database import Product
+from inventory_api.repositories.sqlmodel import SQLModelProductRepository
+from inventory_api.services.product import ProductService
+
+# Shared assertion helpers must be registered before the test modules import them
+pytest.register_assert_rewrite("assertions")
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the session loop on uvloop when it is installed (uvicorn[standard] pulls it in)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test in the session-scoped event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def database():
+    """Create the schema once for the whole test session."""
+    await create_tables()
+    yield
+    await drop_tables()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def asgi_transport():
+    """ASGI transport shared by every API test."""
+    return ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client(asgi_transport):
+    """Session-wide AsyncClient; opened once and closed after the last test."""
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture(scope="class")
+async def class_scoped_rows(database):
+    """
+    Share rows between the tests of a class and clear them once at the end.
+    
+    Apply with ``@pytest.mark.usefixtures("class_scoped_rows")`` on classes
+    whose tests each work on their own SKUs and never assert on the full list.
+    """
+    yield
+    await clear_tables()
+
+
+@pytest_asyncio.fixture
+async def client(request, http_client, database):
+    """Hand the shared client to a test and delete the rows it wrote afterwards."""
+    yield http_client
+
+    if "class_scoped_rows" not in request.fixturenames:
+        await clear_tables()
+
+
+@pytest_asyncio.fixture
+async def seed_product(client):
+    """
+    Insert products straight into the database, bypassing the HTTP layer.
+    
+    For tests that only need a product to exist before exercising another
+    endpoint. Depends on ``client`` so the rows are cleared at teardown.
+    """
+    async def seed(sku: str, name: str, quantity: int, description: str = None) -> Product:
+        product = Product(sku=sku, name=name, quantity=quantity, description=description)
+        async with async_session_factory() as session:
+            session.add(product)
+            await session.commit()
+        return product
+    
+    return seed
+
+
+@pytest_asyncio.fixture
+async def product_service(client):
+    """
+    A ``ProductService`` backed by the test database, without the HTTP layer.
+    
+    For tests that check stored state rather than response contracts, so
+    they skip ASGI routing and response serialization. Depends on ``client``
+    so the rows are cleared at teardown.
+    """
+    async with async_session_factory() as session:
+        yield ProductService(SQLModelProductRepository(session))
\ No newline at end of file
@@ -5,34 +5,14 @@ These tests verify that the API endpoints work correctly with proper HTTP semant
 request/response handling, and error scenarios.
 """
 
-import pytest
-import pytest_asyncio
-import httpx
 from httpx import AsyncClient
-from fastapi.testclient import TestClient
 
-from inventory_api.main import app
-from inventory_api.core.database import create_tables, drop_tables
-
-
-@pytest_asyncio.fixture
-async def client():
-    """Create test client with database setup and teardown."""
-    # Setup: Create tables
-    await create_tables()
-    
-    # Use httpx AsyncClient with the app's ASGI interface
-    async with AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
-        yield ac
-    
-    # Teardown: Drop tables
-    await drop_tables()
+from assertions import json_body
 
 
 class TestProductCreation:
     """Test product creation endpoint (POST /products)."""
     
-    @pytest.mark.asyncio
     async def test_create_product_success(self, client: AsyncClient):
         """Test successful product creation."""
         # Arrange
@@ -48,13 +28,12 @@ class TestProductCreation:
         
         # Assert
         assert response.status_code == 201
-        data = response.json()
+        data = json_body(response)
         assert data["sku"] == "TSHIRT-RED-L"
         assert data["name"] == "Red T-Shirt (Large)"
         assert data["description"] == "Comfortable cotton t-shirt in red, size large"
         assert data["quantity"] == 25
     
-    @pytest.mark.asyncio
     async def test_create_product_minimal_data(self, client: AsyncClient):
         """Test product creation with minimal required data."""
         # Arrange
@@ -69,13 +48,12 @@ class TestProductCreation:
         
         # Assert
         assert response.status_code == 201
-        data = response.json()
+        data = json_body(response)
         assert data["sku"] == "MINIMAL-001"
         assert data["name"] == "Minimal Product"
         assert data["description"] is None
         assert data["quantity"] == 0
     
-    @pytest.mark.asyncio
     async def test_create_product_duplicate_sku(self, client: AsyncClient):
         """Test product creation with duplicate SKU."""
         # Arrange
@@ -99,11 +77,10 @@ class TestProductCreation:
         
         # Assert
         assert response2.status_code == 400
-        data = response2.json()
+        data = json_body(response2)
         assert data["error"] == "Duplicate SKU"
         assert "already exists" in data["message"]
     
-    @pytest.mark.asyncio
     async def test_create_product_invalid_sku_format(self, client: AsyncClient):
         """Test product creation with invalid SKU format."""
         # Arrange
@@ -118,17 +95,14 @@ class TestProductCreation:
         
         # Assert
         assert response.status_code == 422  # Validation error
-        data = response.json()
+        data = json_body(response)
         assert data["error"] == "Validation Error"
         # Check that SKU validation error is present
-        sku_error = next(
-            (error for error in data["validation_errors"] if error["field"] == "sku"),
-            None
-        )
-        assert sku_error is not None
+        field_errors = {error["field"]: error for error in data["validation_errors"]}
+        assert "sku" in field_errors
+        sku_error = field_errors["sku"]
         assert "SKU format is invalid" in sku_error["message"]
     
-    @pytest.mark.asyncio
     async def test_create_product_negative_quantity(self, client: AsyncClient):
         """Test product creation with negative quantity."""
         # Arrange
@@ -143,17 +117,14 @@ class TestProductCreation:
         
         # Assert
         assert response.status_code == 422  # Validation error
-        data = response.json()
+        data = json_body(response)
         assert data["error"] == "Validation Error"
         # Check that quantity validation error is present
-        quantity_error = next(
-            (error for error in data["validation_errors"] if error["field"] == "quantity"),
-            None
-        )
-        assert quantity_error is not None
+        field_errors = {error["field"]: error for error in data["validation_errors"]}
+        assert "quantity" in field_errors
+        quantity_error = field_errors["quantity"]
         assert "greater than or equal to" in quantity_error["message"]
     
-    @pytest.mark.asyncio
     async def test_create_product_missing_required_fields(self, client: AsyncClient):
         """Test product creation with missing required fields."""
         # Arrange
@@ -167,9 +138,9 @@ class TestProductCreation:
         
         # Assert
         assert response.status_code == 422  # Validation error
-        data = response.json()
+        data = json_body(response)
         assert data["error"] == "Validation Error"
-        missing_fields = [error["field"] for error in data["validation_errors"]]
+        missing_fields = {error["field"] for error in data["validation_errors"]}
         assert "name" in missing_fields
         assert "quantity" in missing_fields
 
@@ -177,7 +148,6 @@ class TestProductCreation:
 class TestProductRetrieval:
     """Test product retrieval endpoints."""
     
-    @pytest.mark.asyncio
     async def test_get_all_products_empty(self, client: AsyncClient):
         """Test retrieving all products when none exist."""
         # Act
@@ -185,10 +155,9 @@ class TestProductRetrieval:
         
         # Assert
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert data["products"] == []
     
-    @pytest.mark.asyncio
     async def test_get_all_products_with_data(self, client: AsyncClient):
         """Test retrieving all products with existing data."""
         # Arrange - Create test products
@@ -205,7 +174,7 @@ class TestProductRetrieval:
         
         # Assert
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert len(data["products"]) == 2
         
         # Verify products are returned (order may vary)
@@ -213,7 +182,6 @@ class TestProductRetrieval:
         assert "PROD-001" in skus
         assert "PROD-002" in skus
     
-    @pytest.mark.asyncio
     async def test_get_product_by_sku_success(self, client: AsyncClient):
         """Test retrieving a product by SKU."""
         # Arrange
@@ -230,13 +198,27 @@ class TestProductRetrieval:
         
         # Assert
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert data["sku"] == "GET-TEST-001"
         assert data["name"] == "Get Test Product"
         assert data["description"] == "Product for testing retrieval"
         assert data["quantity"] == 15
     
-    @pytest.mark.asyncio
+    async def test_get_products_by_skus(self, client: AsyncClient, seed_product):
+        """Test retrieving several products in one request."""
+        # Arrange
+        await seed_product("MULTI-GET-001", "Multi Get 1", 1)
+        await seed_product("MULTI-GET-002", "Multi Get 2", 2)
+        await seed_product("MULTI-GET-003", "Multi Get 3", 3)
+        
+        # Act
+        response = await client.get("/products", params={"skus": "MULTI-GET-003,MULTI-GET-001,UNKNOWN-001"})
+        
+        # Assert
+        assert response.status_code == 200
+        quantities = {p["sku"]: p["quantity"] for p in json_body(response)["products"]}
+        assert quantities == {"MULTI-GET-001": 1, "MULTI-GET-003": 3}
+    
     async def test_get_product_by_sku_not_found(self, client: AsyncClient):
         """Test retrieving a non-existent product."""
         # Act
@@ -244,7 +226,7 @@ class TestProductRetrieval:
         
         # Assert
         assert response.status_code == 404
-        data = response.json()
+        data = json_body(response)
         assert data["error"] == "Product Not Found"
         assert "not found" in data["message"]
 
@@ -252,7 +234,6 @@ class TestProductRetrieval:
 class TestStockOperations:
     """Test stock addition and removal endpoints."""
     
-    @pytest.mark.asyncio
     async def test_add_stock_success(self, client: AsyncClient):
         """Test successful stock addition."""
         # Arrange
@@ -268,11 +249,10 @@ class TestStockOperations:
         
         # Assert
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert data["sku"] == "STOCK-ADD-001"
         assert data["quantity"] == 15  # 10 + 5
     
-    @pytest.mark.asyncio
     async def test_add_stock_product_not_found(self, client: AsyncClient):
         """Test stock addition for non-existent product."""
         # Act
@@ -280,11 +260,10 @@ class TestStockOperations:
         
         # Assert
         assert response.status_code == 404
-        data = response.json()
+        data = json_body(response)
         assert data["error"] == "Product Not Found"
         assert "not found" in data["message"]
     
-    @pytest.mark.asyncio
     async def test_add_stock_invalid_amount(self, client: AsyncClient):
         """Test stock addition with invalid amount."""
         # Arrange
@@ -300,17 +279,14 @@ class TestStockOperations:
         
         # Assert
         assert response.status_code == 422  # Validation error
-        data = response.json()
+        data = json_body(response)
         assert data["error"] == "Validation Error"
         # Check that amount validation error is present
-        amount_error = next(
-            (error for error in data["validation_errors"] if error["field"] == "amount"),
-            None
-        )
-        assert amount_error is not None
+        field_errors = {error["field"]: error for error in data["validation_errors"]}
+        assert "amount" in field_errors
+        amount_error = field_errors["amount"]
         assert "greater than" in amount_error["message"]
     
-    @pytest.mark.asyncio
     async def test_remove_stock_success(self, client: AsyncClient):
         """Test successful stock removal."""
         # Arrange
@@ -326,11 +302,10 @@ class TestStockOperations:
         
         # Assert
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert data["sku"] == "STOCK-REMOVE-001"
         assert data["quantity"] == 7  # 10 - 3
     
-    @pytest.mark.asyncio
     async def test_remove_stock_insufficient(self, client: AsyncClient):
         """Test stock removal with insufficient stock."""
         # Arrange
@@ -346,13 +321,12 @@ class TestStockOperations:
         
         # Assert
         assert response.status_code == 400
-        data = response.json()
+        data = json_body(response)
         assert data["error"] == "Insufficient Stock"
         assert "Insufficient stock" in data["message"]
         assert data["requested"] == 10
         assert data["available"] == 5
     
-    @pytest.mark.asyncio
     async def test_remove_stock_product_not_found(self, client: AsyncClient):
         """Test stock removal for non-existent product."""
         # Act
@@ -360,11 +334,10 @@ class TestStockOperations:
         
         # Assert
         assert response.status_code == 404
-        data = response.json()
+        data = json_body(response)
         assert data["error"] == "Product Not Found"
         assert "not found" in data["message"]
     
-    @pytest.mark.asyncio
     async def test_remove_stock_invalid_amount(self, client: AsyncClient):
         """Test stock removal with invalid amount."""
         # Arrange
@@ -380,21 +353,89 @@ class TestStockOperations:
         
         # Assert
         assert response.status_code == 422  # Validation error
-        data = response.json()
+        data = json_body(response)
         assert data["error"] == "Validation Error"
         # Check that amount validation error is present
-        amount_error = next(
-            (error for error in data["validation_errors"] if error["field"] == "amount"),
-            None
-        )
-        assert amount_error is not None
+        field_errors = {error["field"]: error for error in data["validation_errors"]}
+        assert "amount" in field_errors
+        amount_error = field_errors["amount"]
         assert "greater than" in amount_error["message"]
+    
+    async def test_adjust_stock_success(self, client: AsyncClient):
+        """Test applying several stock operations in one request."""
+        # Arrange
+        await client.post("/products", json={
+            "sku": "STOCK-ADJUST-001",
+            "name": "Stock Adjustment Test",
+            "quantity": 10
+        })
+        
+        # Act
+        response = await client.patch("/products/STOCK-ADJUST-001/adjust", json={
+            "operations": [
+                {"op": "add", "amount": 5},
+                {"op": "remove", "amount": 12},
+                {"op": "add", "amount": 2}
+            ]
+        })
+        
+        # Assert
+        assert response.status_code == 200
+        data = json_body(response)
+        assert data["sku"] == "STOCK-ADJUST-001"
+        assert data["quantity"] == 5  # 10 + 5 - 12 + 2
+    
+    async def test_adjust_stock_insufficient_is_all_or_nothing(self, client: AsyncClient):
+        """Test that an insufficient step rejects the whole batch."""
+        # Arrange
+        await client.post("/products", json={
+            "sku": "STOCK-ADJUST-002",
+            "name": "Stock Adjustment Rollback Test",
+            "quantity": 10
+        })
+        
+        # Act
+        response = await client.patch("/products/STOCK-ADJUST-002/adjust", json={
+            "operations": [
+                {"op": "add", "amount": 5},
+                {"op": "remove", "amount": 20}
+            ]
+        })
+        
+        # Assert
+        assert response.status_code == 400
+        data = json_body(response)
+        assert data["error"] == "Insufficient Stock"
+        assert data["requested"] == 20
+        assert data["available"] == 15
+        
+        product = json_body(await client.get("/products/STOCK-ADJUST-002"))
+        assert product["quantity"] == 10
+    
+    async def test_adjust_stock_product_not_found(self, client: AsyncClient):
+        """Test stock adjustment for non-existent product."""
+        # Act
+        response = await client.patch("/products/NONEXISTENT-001/adjust", json={
+            "operations": [{"op": "add", "amount": 5}]
+        })
+        
+        # Assert
+        assert response.status_code == 404
+        assert json_body(response)["error"] == "Product Not Found"
+    
+    async def test_adjust_stock_invalid_operations(self, client: AsyncClient):
+        """Test stock adjustment with an empty list or an unknown operation."""
+        for operations in ([], [{"op": "double", "amount": 5}], [{"op": "add", "amount": 0}]):
+            response = await client.patch("/products/STOCK-ADJUST-001/adjust", json={
+                "operations": operations
+            })
+            assert response.status_code == 422
+            assert json_body(response)["error"] == "Validation Error"
 
 
 class TestCompleteWorkflow:
     """Test complete API workflows."""
     
-    @pytest.mark.asyncio
     async def test_complete_product_lifecycle(self, client: AsyncClient):
         """Test complete product lifecycle: create, retrieve, modify stock."""
         # 1. Create product
@@ -411,24 +452,23 @@ class TestCompleteWorkflow:
         # 2. Retrieve product
         get_response = await client.get("/products/LIFECYCLE-001")
         assert get_response.status_code == 200
-        assert get_response.json()["quantity"] == 20
+        assert json_body(get_response)["quantity"] == 20
         
         # 3. Add stock
         add_response = await client.patch("/products/LIFECYCLE-001/add", json={"amount": 10})
         assert add_response.status_code == 200
-        assert add_response.json()["quantity"] == 30
+        assert json_body(add_response)["quantity"] == 30
         
         # 4. Remove stock
         remove_response = await client.patch("/products/LIFECYCLE-001/remove", json={"amount": 5})
         assert remove_response.status_code == 200
-        assert remove_response.json()["quantity"] == 25
+        assert json_body(remove_response)["quantity"] == 25
         
         # 5. Verify final state
         final_response = await client.get("/products/LIFECYCLE-001")
         assert final_response.status_code == 200
-        assert final_response.json()["quantity"] == 25
+        assert json_body(final_response)["quantity"] == 25
     
-    @pytest.mark.asyncio
     async def test_multiple_products_management(self, client: AsyncClient):
         """Test managing multiple products simultaneously."""
         # Create multiple products
@@ -445,7 +485,7 @@ class TestCompleteWorkflow:
         # Retrieve all products
         all_response = await client.get("/products")
         assert all_response.status_code == 200
-        assert len(all_response.json()["products"]) == 3
+        assert len(json_body(all_response)["products"]) == 3
         
         # Modify stock for different products
         await client.patch("/products/MULTI-001/add", json={"amount": 5})
@@ -453,19 +493,18 @@ class TestCompleteWorkflow:
         
         # Verify individual states
         product1 = await client.get("/products/MULTI-001")
-        assert product1.json()["quantity"] == 15
+        assert json_body(product1)["quantity"] == 15
         
         product2 = await client.get("/products/MULTI-002")
-        assert product2.json()["quantity"] == 17
+        assert json_body(product2)["quantity"] == 17
         
         product3 = await client.get("/products/MULTI-003")
-        assert product3.json()["quantity"] == 30  # Unchanged
+        assert json_body(product3)["quantity"] == 30  # Unchanged
 
 
 class TestHTTPSemantics:
     """Test proper HTTP semantics and status codes."""
     
-    @pytest.mark.asyncio
     async def test_http_methods_and_status_codes(self, client: AsyncClient):
         """Test that endpoints use correct HTTP methods and return proper status codes."""
         # POST for creation returns 201
@@ -492,7 +531,6 @@ class TestHTTPSemantics:
         not_found_response = await client.get("/products/NONEXISTENT")
         assert not_found_response.status_code == 404
     
-    @pytest.mark.asyncio
     async def test_content_type_headers(self, client: AsyncClient):
         """Test that responses have correct content-type headers."""
         # Create a product
@@ -508,4 +546,18 @@ class TestHTTPSemantics:
         # Get product
         get_response = await client.get("/products/CONTENT-TYPE-001")
         assert get_response.headers["content-type"] == "application/json"
-        assert get_response.status_code == 200
\ No newline at end of file
+        assert get_response.status_code == 200
+    
+    async def test_large_responses_are_gzip_compressed(self, client: AsyncClient, seed_product):
+        """Test that large responses are gzip-compressed and small ones are not."""
+        for index in range(20):
+            await seed_product(f"GZIP-TEST-{index:03d}", f"Gzip Test Product {index}", index)
+        
+        list_response = await client.get("/products", headers={"Accept-Encoding": "gzip"})
+        assert list_response.status_code == 200
+        assert list_response.headers["content-encoding"] == "gzip"
+        assert len(json_body(list_response)["products"]) == 20
+        
+        get_response = await client.get("/products/GZIP-TEST-001", headers={"Accept-Encoding": "gzip"})
+        assert get_response.status_code == 200
+        assert "content-encoding" not in get_response.headers
\ No newline at end of file
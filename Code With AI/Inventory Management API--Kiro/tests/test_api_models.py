@@ -0,0 +1,199 @@
+"""
+Unit tests for API model validation.
+
+These tests verify that the Pydantic request and response models properly
+validate input data and handle edge cases correctly. They need no database,
+so this module does not import SQLAlchemy or the database models.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from inventory_api.models.api import (
+    ProductCreate,
+    ProductResponse,
+    StockOperation,
+    ErrorResponse,
+    ProductListResponse
+)
+
+
+class TestProductCreateModel:
+    """Test the ProductCreate API model."""
+    
+    def test_product_create_valid_data(self):
+        """Test creating ProductCreate with valid data."""
+        product_data = ProductCreate(
+            sku="CREATE-001",
+            name="Create Test Product",
+            description="Test description",
+            quantity=15
+        )
+        
+        assert product_data.sku == "CREATE-001"
+        assert product_data.name == "Create Test Product"
+        assert product_data.description == "Test description"
+        assert product_data.quantity == 15
+    
+    @pytest.mark.parametrize("sku", ["ABC-123", "PRODUCT-001", "TEST123", "A1B2C3"])
+    def test_product_create_sku_valid(self, sku):
+        """Test that well-formed SKUs are accepted."""
+        product = ProductCreate(
+            sku=sku,
+            name="Test Product",
+            quantity=10
+        )
+        assert product.sku == sku
+    
+    @pytest.mark.parametrize("sku", ["abc-123", "product with spaces", "test@123", "test.123", "TEST-123\n"])
+    def test_product_create_sku_invalid(self, sku):
+        """Test that SKUs outside the allowed format are rejected."""
+        with pytest.raises(ValidationError, match=r"SKU must contain only uppercase letters"):
+            ProductCreate(
+                sku=sku,
+                name="Test Product",
+                quantity=10
+            )
+    
+    @pytest.mark.parametrize(
+        "field,input_val,expected",
+        [
+            ("name", "  Valid Product Name  ", "Valid Product Name"),
+            ("name", "   ", ValidationError),
+            ("description", "  Test description  ", "Test description"),
+            ("description", "   ", None),
+        ],
+        ids=["name-stripped", "name-blank", "description-stripped", "description-blank"],
+    )
+    def test_product_create_whitespace_handling(self, field, input_val, expected):
+        """Test that name and description are stripped, and blank values rejected or cleared."""
+        data = {"sku": "WS-TEST", "name": "Test Product", "quantity": 10, field: input_val}
+
+        if expected is ValidationError:
+            with pytest.raises(ValidationError, match=r"cannot be empty or just whitespace"):
+                ProductCreate(**data)
+        else:
+            product = ProductCreate(**data)
+            assert getattr(product, field) == expected
+    
+    @pytest.mark.parametrize("qty", [0, 1, 100, 9999], ids=str)
+    def test_quantity_valid(self, qty):
+        """Test that zero and positive quantities are accepted."""
+        product = ProductCreate(
+            sku=f"QTY-{qty}",
+            name="Quantity Test",
+            quantity=qty
+        )
+        assert product.quantity == qty
+    
+    def test_quantity_negative(self):
+        """Test that a negative quantity is rejected."""
+        with pytest.raises(ValidationError):
+            ProductCreate(
+                sku="NEG-QTY",
+                name="Negative Quantity",
+                quantity=-1
+            )
+
+
+class TestStockOperationModel:
+    """Test the StockOperation model."""
+    
+    @pytest.mark.parametrize("amount", [1, 5, 100, 9999], ids=str)
+    def test_stock_operation_valid_amounts(self, amount):
+        """Test valid stock operation amounts."""
+        operation = StockOperation(amount=amount)
+        assert operation.amount == amount
+    
+    def test_stock_operation_invalid_amounts(self):
+        """Test invalid stock operation amounts."""
+        invalid_amounts = [0, -1, -100]
+        
+        for amount in invalid_amounts:
+            with pytest.raises(ValidationError) as exc_info:
+                StockOperation(amount=amount)
+            
+            error = exc_info.value.errors()[0]
+            assert error['type'] == 'greater_than'
+            assert 'amount' in error['loc']
+
+
+class TestProductResponseModel:
+    """Test the ProductResponse model."""
+    
+    def test_product_response_creation(self):
+        """Test creating ProductResponse from data."""
+        response = ProductResponse(
+            sku="RESP-001",
+            name="Response Test",
+            description="Test description",
+            quantity=25
+        )
+        
+        assert response.sku == "RESP-001"
+        assert response.name == "Response Test"
+        assert response.description == "Test description"
+        assert response.quantity == 25
+    
+    def test_product_response_is_immutable(self):
+        """Test that ProductResponse fields cannot be reassigned."""
+        response = ProductResponse(
+            sku="RESP-002",
+            name="Frozen Test",
+            description=None,
+            quantity=5
+        )
+        
+        with pytest.raises(ValidationError):
+            response.quantity = 10
+
+
+class TestProductListResponseModel:
+    """Test the ProductListResponse model."""
+    
+    def test_product_list_response_creation(self):
+        """Test creating ProductListResponse."""
+        # Only the list wrapper is under test, so the items skip validation
+        products = [
+            ProductResponse.model_construct(
+                sku="LIST-001",
+                name="Product 1",
+                description="First product",
+                quantity=10
+            ),
+            ProductResponse.model_construct(
+                sku="LIST-002",
+                name="Product 2",
+                description="Second product",
+                quantity=20
+            )
+        ]
+        
+        response = ProductListResponse(products=products)
+        
+        assert len(response.products) == 2
+        assert response.products[0].sku == "LIST-001"
+        assert response.products[1].sku == "LIST-002"
+    
+    def test_product_list_response_empty(self):
+        """Test creating empty ProductListResponse."""
+        response = ProductListResponse(products=[])
+        assert len(response.products) == 0
+
+
+class TestErrorResponseModel:
+    """Test the ErrorResponse model."""
+    
+    def test_error_response_creation(self):
+        """Test creating ErrorResponse."""
+        error = ErrorResponse(
+            error="Validation Error",
+            message="Request validation failed",
+            details="SKU format is invalid",
+            path="/products"
+        )
+        
+        assert error.error == "Validation Error"
+        assert error.message == "Request validation failed"
+        assert error.details == "SKU format is invalid"
+        assert error.path == "/products"
\ No newline at end of file
@@ -7,34 +7,143 @@ from HTTP requests through to database operations.
 """
 
 import pytest
-import pytest_asyncio
 import asyncio
-import httpx
-from httpx import AsyncClient
+import orjson
+from types import MappingProxyType
+from httpx import AsyncClient, Request
 from typing import List, Dict, Any
 
-from inventory_api.main import app
-from inventory_api.core.database import create_tables, drop_tables
+from assertions import (
+    ERROR_FIELDS,
+    INSUFFICIENT_STOCK_FIELDS,
+    PRODUCT_FIELDS,
+    VALIDATION_DETAIL_FIELDS,
+    VALIDATION_ERROR_FIELDS,
+    assert_has_fields,
+    assert_product_shape,
+    json_body,
+)
 
 
-@pytest_asyncio.fixture
-async def client():
-    """Create test client with database setup and teardown."""
-    # Setup: Create tables
-    await create_tables()
+_JSON_HEADERS = MappingProxyType({"content-type": "application/json"})
+
+
+def _stock_requests(client: AsyncClient, sku: str, operations: List[Dict[str, Any]]) -> List[Request]:
+    """
+    Build the PATCH requests for a sequence of stock operations up front.
     
-    # Use httpx AsyncClient with the app's ASGI interface
-    async with AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
-        yield ac
+    The add/remove URLs are resolved once against the client's base URL and
+    each body is encoded with orjson, so the loop only has to send them.
+    """
+    urls = {
+        op_type: client.base_url.join(f"/products/{sku}/{op_type}")
+        for op_type in ("add", "remove")
+    }
+    return [
+        Request(
+            "PATCH",
+            urls[operation["type"]],
+            content=orjson.dumps({"amount": operation["amount"]}),
+            headers=_JSON_HEADERS,
+        )
+        for operation in operations
+    ]
+
+
+async def _run_ops(
+    client: AsyncClient,
+    product_service,
+    sku: str,
+    initial: int,
+    ops: List[Dict[str, Any]],
+    expected_fail_indices: tuple,
+) -> None:
+    """
+    Create a product, apply stock operations in order, and check every step.
+    
+    Operations at ``expected_fail_indices`` must be rejected as insufficient
+    stock without changing the quantity; every other operation must succeed
+    and return the running quantity. The stored quantity is checked at the end.
+    """
+    create_response = await client.post("/products", json={
+        "sku": sku,
+        "name": "Stock State Machine Test",
+        "quantity": initial
+    })
+    assert create_response.status_code == 201
+    
+    expected_quantity = initial
+    requests = _stock_requests(client, sku, ops)
+    for index, (operation, request) in enumerate(zip(ops, requests)):
+        response = await client.send(request)
+        
+        if index in expected_fail_indices:
+            # Rejected removals must report the untouched stock level
+            assert response.status_code == 400
+            error_data = json_body(response)
+            assert error_data["error"] == "Insufficient Stock"
+            assert error_data["available"] == expected_quantity
+            assert error_data["requested"] == operation["amount"]
+            continue
+        
+        assert response.status_code == 200
+        if operation["type"] == "add":
+            expected_quantity += operation["amount"]
+        else:
+            expected_quantity -= operation["amount"]
+        assert json_body(response)["quantity"] == expected_quantity
     
-    # Teardown: Drop tables
-    await drop_tables()
+    # Final verification against the stored product
+    stored = await product_service.get_product_by_sku(sku)
+    assert stored.quantity == expected_quantity
+
+
+# Invariant workflow payloads, built once at import. MappingProxyType keeps them
+# read-only so no test can leak changes into another; copy with dict() to send.
+_LIFECYCLE_PAYLOAD = MappingProxyType({
+    "sku": "LIFECYCLE-COMPLETE-001",
+    "name": "Complete Lifecycle Product",
+    "description": "Testing complete product lifecycle",
+    "quantity": 50
+})
+
+_MULTI_PRODUCT_PAYLOADS = tuple(MappingProxyType(payload) for payload in (
+    {"sku": "MULTI-SHIRT-001", "name": "Red T-Shirt", "quantity": 100},
+    {"sku": "MULTI-PANTS-001", "name": "Blue Jeans", "quantity": 50},
+    {"sku": "MULTI-SHOES-001", "name": "Running Shoes", "quantity": 25},
+    {"sku": "MULTI-HAT-001", "name": "Baseball Cap", "quantity": 75}
+))
+
+_MULTI_PRODUCT_OPERATIONS = tuple(MappingProxyType(op) for op in (
+    {"sku": "MULTI-SHIRT-001", "operation": "add", "amount": 20, "expected": 120},
+    {"sku": "MULTI-PANTS-001", "operation": "remove", "amount": 10, "expected": 40},
+    {"sku": "MULTI-SHOES-001", "operation": "add", "amount": 15, "expected": 40},
+    {"sku": "MULTI-HAT-001", "operation": "remove", "amount": 25, "expected": 50}
+))
+
+_RESTOCK_PAYLOAD = MappingProxyType({
+    "sku": "RESTOCK-WIDGET-001",
+    "name": "Premium Widget",
+    "description": "High-quality widget for testing restocking",
+    "quantity": 100
+})
+
+_SALES_OPERATIONS = tuple(MappingProxyType(op) for op in (
+    {"amount": 25, "description": "Morning sales"},
+    {"amount": 30, "description": "Afternoon sales"},
+    {"amount": 20, "description": "Evening sales"}
+))
+
+_RESTOCK_OPERATIONS = tuple(MappingProxyType(op) for op in (
+    {"amount": 50, "description": "First delivery"},
+    {"amount": 75, "description": "Second delivery"},
+    {"amount": 25, "description": "Final delivery"}
+))
 
 
 class TestEndToEndWorkflows:
     """Test complete end-to-end API workflows."""
     
-    @pytest.mark.asyncio
     async def test_complete_product_lifecycle_workflow(self, client: AsyncClient):
         """
         Test complete product lifecycle from creation to stock depletion.
@@ -47,23 +156,16 @@ class TestEndToEndWorkflows:
         - Final state verification
         """
         # Step 1: Create a new product
-        product_data = {
-            "sku": "LIFECYCLE-COMPLETE-001",
-            "name": "Complete Lifecycle Product",
-            "description": "Testing complete product lifecycle",
-            "quantity": 50
-        }
-        
-        create_response = await client.post("/products", json=product_data)
+        create_response = await client.post("/products", json=dict(_LIFECYCLE_PAYLOAD))
         assert create_response.status_code == 201
-        created_product = create_response.json()
+        created_product = json_body(create_response)
         assert created_product["sku"] == "LIFECYCLE-COMPLETE-001"
         assert created_product["quantity"] == 50
         
         # Step 2: Verify product appears in product list
         list_response = await client.get("/products")
         assert list_response.status_code == 200
-        products = list_response.json()["products"]
+        products = json_body(list_response)["products"]
         lifecycle_product = next(
             (p for p in products if p["sku"] == "LIFECYCLE-COMPLETE-001"), 
             None
@@ -71,63 +173,51 @@ class TestEndToEndWorkflows:
         assert lifecycle_product is not None
         assert lifecycle_product["quantity"] == 50
         
-        # Step 3: Add stock multiple times
-        add_operations = [
-            {"amount": 10, "expected_total": 60},
-            {"amount": 25, "expected_total": 85},
-            {"amount": 5, "expected_total": 90}
-        ]
-        
-        for operation in add_operations:
-            add_response = await client.patch(
-                f"/products/LIFECYCLE-COMPLETE-001/add", 
-                json={"amount": operation["amount"]}
-            )
-            assert add_response.status_code == 200
-            assert add_response.json()["quantity"] == operation["expected_total"]
-        
-        # Step 4: Remove stock multiple times
-        remove_operations = [
-            {"amount": 15, "expected_total": 75},
-            {"amount": 30, "expected_total": 45},
-            {"amount": 20, "expected_total": 25}
-        ]
-        
-        for operation in remove_operations:
-            remove_response = await client.patch(
-                f"/products/LIFECYCLE-COMPLETE-001/remove", 
-                json={"amount": operation["amount"]}
-            )
-            assert remove_response.status_code == 200
-            assert remove_response.json()["quantity"] == operation["expected_total"]
+        # Step 3: Add stock multiple times in one batch (50 + 10 + 25 + 5)
+        add_response = await client.patch(
+            "/products/LIFECYCLE-COMPLETE-001/adjust", 
+            json={"operations": [
+                {"op": "add", "amount": 10},
+                {"op": "add", "amount": 25},
+                {"op": "add", "amount": 5}
+            ]}
+        )
+        assert add_response.status_code == 200
+        assert json_body(add_response)["quantity"] == 90
         
-        # Step 5: Verify final state through individual product retrieval
-        final_response = await client.get("/products/LIFECYCLE-COMPLETE-001")
-        assert final_response.status_code == 200
-        final_product = final_response.json()
-        assert final_product["quantity"] == 25
-        assert final_product["name"] == "Complete Lifecycle Product"
+        # Step 4: Remove stock multiple times in one batch (90 - 15 - 30 - 20)
+        remove_response = await client.patch(
+            "/products/LIFECYCLE-COMPLETE-001/adjust", 
+            json={"operations": [
+                {"op": "remove", "amount": 15},
+                {"op": "remove", "amount": 30},
+                {"op": "remove", "amount": 20}
+            ]}
+        )
+        assert remove_response.status_code == 200
+        remaining_product = json_body(remove_response)
+        assert remaining_product["quantity"] == 25
+        assert remaining_product["name"] == "Complete Lifecycle Product"
         
-        # Step 6: Attempt to remove more stock than available (should fail)
+        # Step 5: Attempt to remove more stock than available (should fail)
         insufficient_response = await client.patch(
             "/products/LIFECYCLE-COMPLETE-001/remove", 
             json={"amount": 30}
         )
         assert insufficient_response.status_code == 400
-        error_data = insufficient_response.json()
+        error_data = json_body(insufficient_response)
         assert error_data["error"] == "Insufficient Stock"
         assert error_data["available"] == 25
         assert error_data["requested"] == 30
         
-        # Step 7: Remove exact remaining stock
+        # Step 6: Remove exact remaining stock
         final_remove_response = await client.patch(
             "/products/LIFECYCLE-COMPLETE-001/remove", 
             json={"amount": 25}
         )
         assert final_remove_response.status_code == 200
-        assert final_remove_response.json()["quantity"] == 0
+        assert json_body(final_remove_response)["quantity"] == 0
     
-    @pytest.mark.asyncio
     async def test_multi_product_inventory_management_workflow(self, client: AsyncClient):
         """
         Test managing multiple products simultaneously.
@@ -139,49 +229,37 @@ class TestEndToEndWorkflows:
         - Bulk retrieval and verification
         """
         # Step 1: Create multiple products with different initial stock levels
-        products_to_create = [
-            {"sku": "MULTI-SHIRT-001", "name": "Red T-Shirt", "quantity": 100},
-            {"sku": "MULTI-PANTS-001", "name": "Blue Jeans", "quantity": 50},
-            {"sku": "MULTI-SHOES-001", "name": "Running Shoes", "quantity": 25},
-            {"sku": "MULTI-HAT-001", "name": "Baseball Cap", "quantity": 75}
-        ]
-        
-        created_products = []
-        for product_data in products_to_create:
-            response = await client.post("/products", json=product_data)
+        # The creations are independent, so issue them concurrently
+        responses = await asyncio.gather(
+            *(client.post("/products", json=dict(payload)) for payload in _MULTI_PRODUCT_PAYLOADS)
+        )
+        for response in responses:
             assert response.status_code == 201
-            created_products.append(response.json())
+        created_products = [json_body(response) for response in responses]
         
         # Step 2: Verify all products are created and retrievable
         all_products_response = await client.get("/products")
         assert all_products_response.status_code == 200
-        all_products = all_products_response.json()["products"]
+        all_products = json_body(all_products_response)["products"]
         
         # Should have at least our 4 products (may have others from other tests)
         multi_products = [p for p in all_products if p["sku"].startswith("MULTI-")]
         assert len(multi_products) == 4
         
         # Step 3: Perform different operations on each product
-        operations = [
-            {"sku": "MULTI-SHIRT-001", "operation": "add", "amount": 20, "expected": 120},
-            {"sku": "MULTI-PANTS-001", "operation": "remove", "amount": 10, "expected": 40},
-            {"sku": "MULTI-SHOES-001", "operation": "add", "amount": 15, "expected": 40},
-            {"sku": "MULTI-HAT-001", "operation": "remove", "amount": 25, "expected": 50}
-        ]
-        
-        for op in operations:
-            endpoint = f"/products/{op['sku']}/{op['operation']}"
-            response = await client.patch(endpoint, json={"amount": op["amount"]})
-            assert response.status_code == 200
-            assert response.json()["quantity"] == op["expected"]
+        operations = _MULTI_PRODUCT_OPERATIONS
         
-        # Step 4: Verify each product individually
-        for op in operations:
-            response = await client.get(f"/products/{op['sku']}")
+        responses = await asyncio.gather(
+            *(
+                client.patch(f"/products/{op['sku']}/{op['operation']}", json={"amount": op["amount"]})
+                for op in operations
+            )
+        )
+        for op, response in zip(operations, responses):
             assert response.status_code == 200
-            assert response.json()["quantity"] == op["expected"]
+            assert json_body(response)["quantity"] == op["expected"]
         
-        # Step 5: Perform simultaneous operations on different products
+        # Step 4: Perform simultaneous operations on different products
         async def modify_product(sku: str, operation: str, amount: int):
             endpoint = f"/products/{sku}/{operation}"
             return await client.patch(endpoint, json={"amount": amount})
@@ -208,12 +286,11 @@ class TestEndToEndWorkflows:
             "MULTI-HAT-001": 75
         }
         
-        for sku, expected_qty in expected_final_quantities.items():
-            response = await client.get(f"/products/{sku}")
-            assert response.status_code == 200
-            assert response.json()["quantity"] == expected_qty
+        response = await client.get("/products", params={"skus": ",".join(expected_final_quantities)})
+        assert response.status_code == 200
+        final_quantities = {p["sku"]: p["quantity"] for p in json_body(response)["products"]}
+        assert final_quantities == expected_final_quantities
     
-    @pytest.mark.asyncio
     async def test_inventory_restocking_workflow(self, client: AsyncClient):
         """
         Test a realistic inventory restocking workflow.
@@ -225,64 +302,40 @@ class TestEndToEndWorkflows:
         - Verification of stock levels throughout
         """
         # Step 1: Create product with initial stock
-        initial_product = {
-            "sku": "RESTOCK-WIDGET-001",
-            "name": "Premium Widget",
-            "description": "High-quality widget for testing restocking",
-            "quantity": 100
-        }
-        
-        create_response = await client.post("/products", json=initial_product)
+        create_response = await client.post("/products", json=dict(_RESTOCK_PAYLOAD))
         assert create_response.status_code == 201
         
         # Step 2: Simulate sales (multiple stock removals)
-        sales_operations = [
-            {"amount": 25, "description": "Morning sales"},
-            {"amount": 30, "description": "Afternoon sales"},
-            {"amount": 20, "description": "Evening sales"}
-        ]
-        
         current_stock = 100
-        for sale in sales_operations:
+        for sale in _SALES_OPERATIONS:
             response = await client.patch(
                 "/products/RESTOCK-WIDGET-001/remove", 
                 json={"amount": sale["amount"]}
             )
             assert response.status_code == 200
             current_stock -= sale["amount"]
-            assert response.json()["quantity"] == current_stock
+            assert json_body(response)["quantity"] == current_stock
         
         # Current stock should be 25 (100 - 25 - 30 - 20)
         assert current_stock == 25
         
-        # Step 3: Check stock level is low (simulate low stock alert)
-        stock_check_response = await client.get("/products/RESTOCK-WIDGET-001")
-        assert stock_check_response.status_code == 200
-        assert stock_check_response.json()["quantity"] == 25
-        
-        # Step 4: Restock operations (multiple deliveries)
-        restock_operations = [
-            {"amount": 50, "description": "First delivery"},
-            {"amount": 75, "description": "Second delivery"},
-            {"amount": 25, "description": "Final delivery"}
-        ]
-        
-        for restock in restock_operations:
+        # Step 3: Restock operations (multiple deliveries)
+        for restock in _RESTOCK_OPERATIONS:
             response = await client.patch(
                 "/products/RESTOCK-WIDGET-001/add", 
                 json={"amount": restock["amount"]}
             )
             assert response.status_code == 200
             current_stock += restock["amount"]
-            assert response.json()["quantity"] == current_stock
+            assert json_body(response)["quantity"] == current_stock
         
         # Final stock should be 175 (25 + 50 + 75 + 25)
         assert current_stock == 175
         
-        # Step 5: Verify final inventory level
+        # Step 4: Verify final inventory level with a fresh read
         final_check_response = await client.get("/products/RESTOCK-WIDGET-001")
         assert final_check_response.status_code == 200
-        final_product = final_check_response.json()
+        final_product = json_body(final_check_response)
         assert final_product["quantity"] == 175
         assert final_product["name"] == "Premium Widget"
         assert final_product["description"] == "High-quality widget for testing restocking"
@@ -291,59 +344,13 @@ class TestEndToEndWorkflows:
 class TestConcurrentOperations:
     """Test concurrent operations to verify system behavior under concurrent load."""
     
-    @pytest.mark.asyncio
-    async def test_sequential_operations_for_consistency(self, client: AsyncClient):
-        """
-        Test sequential operations to establish baseline behavior.
-        
-        This test verifies that operations work correctly when run sequentially,
-        establishing a baseline for comparison with concurrent operations.
-        """
-        # Setup: Create product with initial stock
-        product_data = {
-            "sku": "SEQUENTIAL-001",
-            "name": "Sequential Test",
-            "quantity": 100
-        }
-        
-        create_response = await client.post("/products", json=product_data)
-        assert create_response.status_code == 201
-        
-        # Run operations sequentially
-        operations = [
-            {"type": "add", "amount": 10},
-            {"type": "add", "amount": 15},
-            {"type": "remove", "amount": 5},
-            {"type": "add", "amount": 20},
-            {"type": "remove", "amount": 8}
-        ]
-        
-        expected_quantity = 100
-        for operation in operations:
-            endpoint = f"/products/SEQUENTIAL-001/{operation['type']}"
-            response = await client.patch(endpoint, json={"amount": operation["amount"]})
-            assert response.status_code == 200
-            
-            if operation["type"] == "add":
-                expected_quantity += operation["amount"]
-            else:
-                expected_quantity -= operation["amount"]
-            
-            assert response.json()["quantity"] == expected_quantity
-        
-        # Final verification
-        final_response = await client.get("/products/SEQUENTIAL-001")
-        assert final_response.status_code == 200
-        assert final_response.json()["quantity"] == expected_quantity
-    
-    @pytest.mark.asyncio
     async def test_concurrent_operations_data_integrity(self, client: AsyncClient):
         """
         Test that concurrent operations maintain data integrity.
         
-        This test focuses on ensuring that the final state is consistent
-        and that no data corruption occurs, regardless of the exact
-        execution order of concurrent operations.
+        Stock never runs short here, so every operation must succeed and
+        the final quantity must reflect each one exactly once, regardless
+        of the execution order.
         """
         # Setup: Create product with initial stock
         product_data = {
@@ -355,117 +362,35 @@ class TestConcurrentOperations:
         create_response = await client.post("/products", json=product_data)
         assert create_response.status_code == 201
         
-        # Define operations
-        async def add_stock(amount: int):
-            return await client.patch(
-                "/products/CONCURRENT-INTEGRITY-001/add", 
-                json={"amount": amount}
-            )
-        
-        async def remove_stock(amount: int):
-            return await client.patch(
-                "/products/CONCURRENT-INTEGRITY-001/remove", 
-                json={"amount": amount}
-            )
+        # Build the requests up front so the gather only sends them
+        requests = _stock_requests(client, "CONCURRENT-INTEGRITY-001", [
+            {"type": "add", "amount": 10},
+            {"type": "add", "amount": 5},
+            {"type": "remove", "amount": 3},
+            {"type": "add", "amount": 8}
+        ])
         
         # Run a mix of operations concurrently
-        tasks = [
-            add_stock(10),
-            add_stock(5),
-            remove_stock(3),
-            add_stock(8)
-        ]
-        
-        results = await asyncio.gather(*tasks)
+        results = await asyncio.gather(*(client.send(request) for request in requests))
         
-        # Verify all operations completed (either success or proper failure)
+        # Verify every operation succeeded
         for result in results:
-            assert result.status_code in [200, 400], f"Unexpected status code: {result.status_code}"
+            assert result.status_code == 200, f"Unexpected status code: {result.status_code}"
         
-        # Verify final state is consistent
+        # Verify no update was lost
         final_response = await client.get("/products/CONCURRENT-INTEGRITY-001")
         assert final_response.status_code == 200
-        final_quantity = final_response.json()["quantity"]
-        
-        # Stock should never be negative
-        assert final_quantity >= 0, f"Final stock {final_quantity} should never be negative"
-        
-        # Stock should be within reasonable bounds based on operations
-        # Minimum: 100 - 3 = 97 (if only remove succeeded)
-        # Maximum: 100 + 10 + 5 + 8 = 123 (if all adds succeeded, remove failed)
-        assert 95 <= final_quantity <= 125, f"Final quantity {final_quantity} should be within reasonable bounds"
-    
-    @pytest.mark.asyncio
-    async def test_insufficient_stock_prevention(self, client: AsyncClient):
-        """
-        Test that the system prevents overselling.
-        
-        This test verifies that the system correctly handles attempts to
-        remove more stock than available, ensuring data integrity.
-        """
-        # Setup: Create product with limited stock
-        product_data = {
-            "sku": "OVERSELL-PREVENTION-001",
-            "name": "Oversell Prevention Test",
-            "quantity": 3  # Very limited stock
-        }
-        
-        create_response = await client.post("/products", json=product_data)
-        assert create_response.status_code == 201
-        
-        # First, remove some stock successfully
-        first_remove = await client.patch(
-            "/products/OVERSELL-PREVENTION-001/remove", 
-            json={"amount": 2}
-        )
-        assert first_remove.status_code == 200
-        assert first_remove.json()["quantity"] == 1
-        
-        # Now try to remove more than what's available
-        second_remove = await client.patch(
-            "/products/OVERSELL-PREVENTION-001/remove", 
-            json={"amount": 2}  # Trying to remove 2, but only 1 available
-        )
-        
-        # This should fail
-        assert second_remove.status_code == 400
-        error_data = second_remove.json()
-        assert error_data["error"] == "Insufficient Stock"
-        assert error_data["available"] == 1
-        assert error_data["requested"] == 2
-        
-        # Verify final stock is still 1 (unchanged from failed operation)
-        final_response = await client.get("/products/OVERSELL-PREVENTION-001")
-        assert final_response.status_code == 200
-        final_stock = final_response.json()["quantity"]
-        assert final_stock == 1, f"Final stock should be 1, got {final_stock}"
-        
-        # Now remove the last item successfully
-        final_remove = await client.patch(
-            "/products/OVERSELL-PREVENTION-001/remove", 
-            json={"amount": 1}
-        )
-        assert final_remove.status_code == 200
-        assert final_remove.json()["quantity"] == 0
+        final_quantity = json_body(final_response)["quantity"]
         
-        # Try to remove from empty stock
-        empty_remove = await client.patch(
-            "/products/OVERSELL-PREVENTION-001/remove", 
-            json={"amount": 1}
-        )
-        assert empty_remove.status_code == 400
-        error_data = empty_remove.json()
-        assert error_data["error"] == "Insufficient Stock"
-        assert error_data["available"] == 0
-        assert error_data["requested"] == 1
+        # 100 + 10 + 5 - 3 + 8
+        assert final_quantity == 120, f"Final quantity {final_quantity} should be 120"
     
-    @pytest.mark.asyncio
     async def test_mixed_concurrent_operations(self, client: AsyncClient):
         """
         Test concurrent mix of add and remove operations.
         
-        Verifies that concurrent add and remove operations are handled
-        correctly and the final stock level is consistent.
+        Verifies that concurrent add and remove operations all succeed
+        and the final stock level counts each of them exactly once.
         """
         # Setup: Create product with initial stock
         product_data = {
@@ -477,52 +402,35 @@ class TestConcurrentOperations:
         create_response = await client.post("/products", json=product_data)
         assert create_response.status_code == 201
         
-        # Define mixed operations
-        async def add_stock(amount: int):
-            return await client.patch(
-                "/products/MIXED-CONCURRENT-001/add", 
-                json={"amount": amount}
-            )
-        
-        async def remove_stock(amount: int):
-            return await client.patch(
-                "/products/MIXED-CONCURRENT-001/remove", 
-                json={"amount": amount}
-            )
-        
-        # Create smaller mixed operations to work within SQLite limitations
-        tasks = [
-            add_stock(10),    # +10
-            remove_stock(5),  # -5
-            add_stock(8),     # +8
-        ]
+        # Create smaller mixed operations to work within SQLite limitations,
+        # encoded once before the fan-out
+        requests = _stock_requests(client, "MIXED-CONCURRENT-001", [
+            {"type": "add", "amount": 10},    # +10
+            {"type": "remove", "amount": 5},  # -5
+            {"type": "add", "amount": 8},     # +8
+        ])
         
-        results = await asyncio.gather(*tasks)
+        results = await asyncio.gather(*(client.send(request) for request in requests))
         
-        # Count successful operations
-        successful_operations = [r for r in results if r.status_code == 200]
-        assert len(successful_operations) >= 1, "At least one operation should succeed"
+        # Verify every operation succeeded
+        for result in results:
+            assert result.status_code == 200, f"Unexpected status code: {result.status_code}"
         
-        # Verify final stock level is reasonable
+        # Verify no update was lost
         final_response = await client.get("/products/MIXED-CONCURRENT-001")
         assert final_response.status_code == 200
-        final_quantity = final_response.json()["quantity"]
-        
-        # Final quantity should be within reasonable bounds
-        # Minimum: 50 (if no operations succeeded)
-        # Maximum: 50 + 10 + 8 = 68 (if all add operations succeeded and remove failed)
-        assert 45 <= final_quantity <= 70, f"Final quantity {final_quantity} should be within reasonable bounds"
+        final_quantity = json_body(final_response)["quantity"]
         
-        # Most importantly, stock should never be negative
-        assert final_quantity >= 0, f"Final stock {final_quantity} should never be negative"
+        # 50 + 10 - 5 + 8
+        assert final_quantity == 63, f"Final quantity {final_quantity} should be 63"
     
-    @pytest.mark.asyncio
     async def test_high_concurrency_stress_test(self, client: AsyncClient):
         """
         Stress test with moderate concurrency to verify system stability.
         
-        This test verifies that the system maintains data integrity
-        and handles multiple operations without corruption.
+        Each client sends its operations as one /adjust batch, so the server
+        takes the write lock once per batch instead of once per operation.
+        This test verifies that concurrent batches keep data integrity.
         """
         # Setup: Create product with substantial stock
         product_data = {
@@ -534,47 +442,46 @@ class TestConcurrentOperations:
         create_response = await client.post("/products", json=product_data)
         assert create_response.status_code == 201
         
-        # Define operations
-        async def perform_operation(operation_type: str, amount: int):
-            endpoint = f"/products/STRESS-TEST-001/{operation_type}"
-            return await client.patch(endpoint, json={"amount": amount})
-        
-        # Create moderate number of concurrent operations
-        tasks = []
-        
-        # Add operations: 5 operations adding 10 each = +50
-        for _ in range(5):
-            tasks.append(perform_operation("add", 10))
-        
-        # Remove operations: 5 operations removing 8 each = -40
-        for _ in range(5):
-            tasks.append(perform_operation("remove", 8))
-        
-        # Execute all operations concurrently
-        results = await asyncio.gather(*tasks)
-        
-        # Count successful operations
-        successful_operations = [r for r in results if r.status_code == 200]
-        assert len(successful_operations) >= 5, "At least half the operations should succeed"
+        # One batch: 3 adds of 10 (+30) and 2 removes of 8 (-16) = +14.
+        # Every client sends the same body, so it is encoded once up front.
+        batch_body = orjson.dumps({"operations": [
+            {"op": "add", "amount": 10},
+            {"op": "remove", "amount": 8},
+            {"op": "add", "amount": 10},
+            {"op": "remove", "amount": 8},
+            {"op": "add", "amount": 10},
+        ]})
+        batch_count = 4
+        
+        # Execute all batches concurrently, with at most two in flight at a time
+        # so the clients queue up instead of all contending for the write lock
+        in_flight = asyncio.Semaphore(2)
+        
+        async def send_batch():
+            async with in_flight:
+                return await client.patch(
+                    "/products/STRESS-TEST-001/adjust", content=batch_body, headers=_JSON_HEADERS
+                )
+        
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(send_batch()) for _ in range(batch_count)]
+        results = [task.result() for task in tasks]
+        
+        # Stock never runs short, so every batch should succeed
+        for result in results:
+            assert result.status_code == 200, f"Unexpected status code: {result.status_code}"
         
-        # Verify final stock level is reasonable and never negative
+        # Verify every batch was applied exactly once: no update may be lost
         final_response = await client.get("/products/STRESS-TEST-001")
         assert final_response.status_code == 200
-        final_quantity = final_response.json()["quantity"]
+        final_quantity = json_body(final_response)["quantity"]
         
-        # Stock should never be negative
-        assert final_quantity >= 0, f"Final stock {final_quantity} should never be negative"
-        
-        # Stock should be within reasonable bounds
-        # Minimum: 1000 - 40 = 960 (if all removes succeeded, no adds)
-        # Maximum: 1000 + 50 = 1050 (if all adds succeeded, no removes)
-        assert 950 <= final_quantity <= 1060, f"Final quantity {final_quantity} should be within reasonable bounds"
-
+        # 1000 + 4 * 14
+        assert final_quantity == 1056, f"Final quantity {final_quantity} should be 1056"
 
 class TestAPIContractCompliance:
     """Test API contract compliance and response formats."""
     
-    @pytest.mark.asyncio
     async def test_product_creation_response_contract(self, client: AsyncClient):
         """Test that product creation responses follow the expected contract."""
         product_data = {
@@ -590,16 +497,8 @@ class TestAPIContractCompliance:
         assert response.status_code == 201
         
         # Verify response structure
-        data = response.json()
-        required_fields = ["sku", "name", "description", "quantity"]
-        for field in required_fields:
-            assert field in data, f"Missing required field: {field}"
-        
-        # Verify field types and values
-        assert isinstance(data["sku"], str)
-        assert isinstance(data["name"], str)
-        assert isinstance(data["description"], str) or data["description"] is None
-        assert isinstance(data["quantity"], int)
+        data = json_body(response)
+        assert_product_shape(data)
         
         # Verify values match input
         assert data["sku"] == product_data["sku"]
@@ -610,7 +509,6 @@ class TestAPIContractCompliance:
         # Verify content-type header
         assert response.headers["content-type"] == "application/json"
     
-    @pytest.mark.asyncio
     async def test_product_list_response_contract(self, client: AsyncClient):
         """Test that product list responses follow the expected contract."""
         # Create test products
@@ -629,26 +527,17 @@ class TestAPIContractCompliance:
         assert response.status_code == 200
         
         # Verify response structure
-        data = response.json()
+        data = json_body(response)
         assert "products" in data
         assert isinstance(data["products"], list)
         
         # Verify each product in the list has correct structure
         for product in data["products"]:
-            required_fields = ["sku", "name", "description", "quantity"]
-            for field in required_fields:
-                assert field in product, f"Missing required field: {field}"
-            
-            # Verify field types
-            assert isinstance(product["sku"], str)
-            assert isinstance(product["name"], str)
-            assert isinstance(product["description"], str) or product["description"] is None
-            assert isinstance(product["quantity"], int)
+            assert_product_shape(product)
         
         # Verify content-type header
         assert response.headers["content-type"] == "application/json"
     
-    @pytest.mark.asyncio
     async def test_stock_operation_response_contract(self, client: AsyncClient):
         """Test that stock operation responses follow the expected contract."""
         # Create test product
@@ -667,12 +556,10 @@ class TestAPIContractCompliance:
         )
         
         assert add_response.status_code == 200
-        add_data = add_response.json()
+        add_data = json_body(add_response)
         
         # Verify response structure
-        required_fields = ["sku", "name", "description", "quantity"]
-        for field in required_fields:
-            assert field in add_data, f"Missing required field: {field}"
+        assert_has_fields(add_data, PRODUCT_FIELDS)
         
         # Verify updated quantity
         assert add_data["quantity"] == 25
@@ -685,27 +572,23 @@ class TestAPIContractCompliance:
         )
         
         assert remove_response.status_code == 200
-        remove_data = remove_response.json()
+        remove_data = json_body(remove_response)
         
         # Verify response structure
-        for field in required_fields:
-            assert field in remove_data, f"Missing required field: {field}"
+        assert_has_fields(remove_data, PRODUCT_FIELDS)
         
         # Verify updated quantity
         assert remove_data["quantity"] == 20
         assert remove_response.headers["content-type"] == "application/json"
     
-    @pytest.mark.asyncio
     async def test_error_response_contract(self, client: AsyncClient):
         """Test that error responses follow the expected contract."""
         # Test 404 error contract
         not_found_response = await client.get("/products/NONEXISTENT-CONTRACT")
         assert not_found_response.status_code == 404
         
-        error_data = not_found_response.json()
-        required_error_fields = ["error", "message", "details", "path"]
-        for field in required_error_fields:
-            assert field in error_data, f"Missing required error field: {field}"
+        error_data = json_body(not_found_response)
+        assert_has_fields(error_data, ERROR_FIELDS, "error")
         
         assert error_data["error"] == "Product Not Found"
         assert "NONEXISTENT-CONTRACT" in error_data["message"]
@@ -724,10 +607,8 @@ class TestAPIContractCompliance:
         )
         assert insufficient_response.status_code == 400
         
-        insufficient_data = insufficient_response.json()
-        required_insufficient_fields = ["error", "message", "details", "sku", "requested", "available", "path"]
-        for field in required_insufficient_fields:
-            assert field in insufficient_data, f"Missing required insufficient stock field: {field}"
+        insufficient_data = json_body(insufficient_response)
+        assert_has_fields(insufficient_data, INSUFFICIENT_STOCK_FIELDS, "insufficient stock")
         
         assert insufficient_data["error"] == "Insufficient Stock"
         assert insufficient_data["sku"] == "ERROR-CONTRACT-001"
@@ -742,10 +623,8 @@ class TestAPIContractCompliance:
         })
         assert validation_response.status_code == 422
         
-        validation_data = validation_response.json()
-        required_validation_fields = ["error", "message", "details", "validation_errors", "path"]
-        for field in required_validation_fields:
-            assert field in validation_data, f"Missing required validation field: {field}"
+        validation_data = json_body(validation_response)
+        assert_has_fields(validation_data, VALIDATION_ERROR_FIELDS, "validation")
         
         assert validation_data["error"] == "Validation Error"
         assert isinstance(validation_data["validation_errors"], list)
@@ -753,11 +632,8 @@ class TestAPIContractCompliance:
         
         # Verify validation error structure
         for validation_error in validation_data["validation_errors"]:
-            validation_error_fields = ["field", "message", "details"]
-            for field in validation_error_fields:
-                assert field in validation_error, f"Missing validation error field: {field}"
+            assert_has_fields(validation_error, VALIDATION_DETAIL_FIELDS, "validation error")
     
-    @pytest.mark.asyncio
     async def test_http_method_compliance(self, client: AsyncClient):
         """Test that endpoints use correct HTTP methods."""
         # POST for resource creation
@@ -804,13 +680,12 @@ class TestAPIContractCompliance:
 class TestDataIntegrityVerification:
     """Test data integrity across operations."""
     
-    @pytest.mark.asyncio
     async def test_stock_level_consistency_across_operations(self, client: AsyncClient):
         """
         Test that stock levels remain consistent across multiple operations.
         
-        This test performs a series of operations and verifies that the
-        stock level is always accurate and never goes negative.
+        This test applies a series of operations as one atomic batch and
+        verifies that the resulting stock level is accurate.
         """
         # Create product with known initial stock
         initial_stock = 100
@@ -822,98 +697,67 @@ class TestDataIntegrityVerification:
         
         await client.post("/products", json=product_data)
         
-        # Track expected stock level
-        expected_stock = initial_stock
-        
-        # Perform series of operations
+        # Perform series of operations in a single round trip
         operations = [
-            {"type": "add", "amount": 25},     # 100 + 25 = 125
-            {"type": "remove", "amount": 15},  # 125 - 15 = 110
-            {"type": "add", "amount": 40},     # 110 + 40 = 150
-            {"type": "remove", "amount": 30},  # 150 - 30 = 120
-            {"type": "remove", "amount": 20},  # 120 - 20 = 100
-            {"type": "add", "amount": 10},     # 100 + 10 = 110
+            {"op": "add", "amount": 25},     # 100 + 25 = 125
+            {"op": "remove", "amount": 15},  # 125 - 15 = 110
+            {"op": "add", "amount": 40},     # 110 + 40 = 150
+            {"op": "remove", "amount": 30},  # 150 - 30 = 120
+            {"op": "remove", "amount": 20},  # 120 - 20 = 100
+            {"op": "add", "amount": 10},     # 100 + 10 = 110
         ]
         
-        for operation in operations:
-            endpoint = f"/products/INTEGRITY-001/{operation['type']}"
-            response = await client.patch(endpoint, json={"amount": operation["amount"]})
-            
-            assert response.status_code == 200
-            
-            # Update expected stock
-            if operation["type"] == "add":
-                expected_stock += operation["amount"]
-            else:
-                expected_stock -= operation["amount"]
-            
-            # Verify response shows correct stock level
-            assert response.json()["quantity"] == expected_stock
-            
-            # Double-check with individual product retrieval
-            verify_response = await client.get("/products/INTEGRITY-001")
-            assert verify_response.status_code == 200
-            assert verify_response.json()["quantity"] == expected_stock
+        response = await client.patch(
+            "/products/INTEGRITY-001/adjust",
+            json={"operations": operations}
+        )
+        assert response.status_code == 200
+        assert json_body(response)["quantity"] == 110
         
         # Final verification
-        assert expected_stock == 110
         final_response = await client.get("/products/INTEGRITY-001")
-        assert final_response.json()["quantity"] == 110
+        assert json_body(final_response)["quantity"] == 110
     
-    @pytest.mark.asyncio
-    async def test_negative_stock_prevention(self, client: AsyncClient):
+    @pytest.mark.parametrize("sku,initial,ops,fails", [
+        (
+            "SEQUENTIAL-001", 100,
+            [
+                {"type": "add", "amount": 10},
+                {"type": "add", "amount": 15},
+                {"type": "remove", "amount": 5},
+                {"type": "add", "amount": 20},
+                {"type": "remove", "amount": 8},
+            ],
+            (),
+        ),
+        (
+            "OVERSELL-PREVENTION-001", 3,
+            [
+                {"type": "remove", "amount": 2},
+                {"type": "remove", "amount": 2},  # Only 1 left
+                {"type": "remove", "amount": 1},
+                {"type": "remove", "amount": 1},  # Stock is empty
+            ],
+            (1, 3),
+        ),
+        (
+            "NEGATIVE-PREVENTION-001", 10,
+            [
+                {"type": "remove", "amount": 11},  # 1 more than available
+                {"type": "remove", "amount": 15},  # 5 more than available
+                {"type": "remove", "amount": 100},  # Much more than available
+                {"type": "remove", "amount": 5},
+                {"type": "remove", "amount": 6},  # 1 more than what is left
+            ],
+            (0, 1, 2, 4),
+        ),
+    ], ids=["sequential", "oversell", "negative-stock"])
+    async def test_stock_state_machine(self, client: AsyncClient, product_service, sku, initial, ops, fails):
         """
-        Test that the system prevents stock levels from going negative.
+        Test that sequences of stock operations keep the quantity consistent.
         
-        This test verifies that attempts to remove more stock than available
-        are properly rejected and don't affect the stock level.
+        Covers the sequential baseline, overselling a small stock down to
+        zero, and removals larger than the available stock. Rejected
+        operations must never change the stock level or take it negative.
         """
-        # Create product with limited stock
-        product_data = {
-            "sku": "NEGATIVE-PREVENTION-001",
-            "name": "Negative Stock Prevention Test",
-            "quantity": 10
-        }
-        
-        await client.post("/products", json=product_data)
-        
-        # Attempt to remove more stock than available
-        invalid_operations = [
-            {"amount": 11, "description": "Remove 1 more than available"},
-            {"amount": 15, "description": "Remove 5 more than available"},
-            {"amount": 100, "description": "Remove much more than available"}
-        ]
-        
-        for operation in invalid_operations:
-            response = await client.patch(
-                "/products/NEGATIVE-PREVENTION-001/remove", 
-                json={"amount": operation["amount"]}
-            )
-            
-            # Should fail with 400 Bad Request
-            assert response.status_code == 400
-            error_data = response.json()
-            assert error_data["error"] == "Insufficient Stock"
-            assert error_data["available"] == 10  # Stock should remain unchanged
-            assert error_data["requested"] == operation["amount"]
-            
-            # Verify stock level hasn't changed
-            verify_response = await client.get("/products/NEGATIVE-PREVENTION-001")
-            assert verify_response.status_code == 200
-            assert verify_response.json()["quantity"] == 10
-        
-        # Verify that valid operations still work
-        valid_response = await client.patch(
-            "/products/NEGATIVE-PREVENTION-001/remove", 
-            json={"amount": 5}
-        )
-        assert valid_response.status_code == 200
-        assert valid_response.json()["quantity"] == 5
-        
-        # Now attempting to remove 6 should fail
-        final_invalid_response = await client.patch(
-            "/products/NEGATIVE-PREVENTION-001/remove", 
-            json={"amount": 6}
-        )
-        assert final_invalid_response.status_code == 400
-        assert final_invalid_response.json()["available"] == 5
\ No newline at end of file
+        await _run_ops(client, product_service, sku, initial, ops, fails)
\ No newline at end of file
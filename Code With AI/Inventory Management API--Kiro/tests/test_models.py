@@ -1,23 +1,19 @@
 """
-Unit tests for data models validation and constraints.
+Unit tests for the database model and its constraints.
 
-These tests verify that our models properly validate input data,
-enforce constraints, and handle edge cases correctly.
+These tests verify that the SQLModel entity validates its fields, converts
+to the API response model, and that the database enforces its constraints.
+The pure API model tests live in ``test_api_models.py``.
 """
 
 import pytest
 from pydantic import ValidationError
 from sqlmodel import SQLModel, create_engine, Session
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import StaticPool
 
 from inventory_api.models.database import Product
-from inventory_api.models.api import (
-    ProductCreate,
-    ProductResponse,
-    StockOperation,
-    ErrorResponse,
-    ProductListResponse
-)
+from inventory_api.models.api import ProductResponse
 
 
 class TestProductDatabaseModel:
@@ -116,149 +112,6 @@ class TestProductDatabaseModel:
                 description="A" * 1001,  # Max is 1000
                 quantity=5
             )
-
-
-class TestProductCreateModel:
-    """Test the ProductCreate API model."""
-    
-    def test_product_create_valid_data(self):
-        """Test creating ProductCreate with valid data."""
-        product_data = ProductCreate(
-            sku="CREATE-001",
-            name="Create Test Product",
-            description="Test description",
-            quantity=15
-        )
-        
-        assert product_data.sku == "CREATE-001"
-        assert product_data.name == "Create Test Product"
-        assert product_data.description == "Test description"
-        assert product_data.quantity == 15
-    
-    def test_product_create_sku_validation(self):
-        """Test SKU format validation."""
-        # Valid SKUs
-        valid_skus = ["ABC-123", "PRODUCT-001", "TEST123", "A1B2C3"]
-        for sku in valid_skus:
-            product = ProductCreate(
-                sku=sku,
-                name="Test Product",
-                quantity=10
-            )
-            assert product.sku == sku
-        
-        # Invalid SKUs
-        invalid_skus = ["abc-123", "product with spaces", "test@123", "test.123"]
-        for sku in invalid_skus:
-            with pytest.raises(ValidationError) as exc_info:
-                ProductCreate(
-                    sku=sku,
-                    name="Test Product",
-                    quantity=10
-                )
-            
-            errors = exc_info.value.errors()
-            assert any('SKU must contain only uppercase letters' in str(error) for error in errors)
-    
-    def test_product_create_name_validation(self):
-        """Test name validation and whitespace handling."""
-        # Valid name
-        product = ProductCreate(
-            sku="NAME-TEST",
-            name="  Valid Product Name  ",
-            quantity=10
-        )
-        assert product.name == "Valid Product Name"  # Should be stripped
-        
-        # Empty name after stripping
-        with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(
-                sku="EMPTY-NAME",
-                name="   ",  # Just whitespace
-                quantity=10
-            )
-        
-        errors = exc_info.value.errors()
-        assert any('cannot be empty or just whitespace' in str(error) for error in errors)
-    
-    def test_product_create_description_validation(self):
-        """Test description validation and cleanup."""
-        # Description with whitespace should be cleaned
-        product = ProductCreate(
-            sku="DESC-TEST",
-            name="Test Product",
-            description="  Test description  ",
-            quantity=10
-        )
-        assert product.description == "Test description"
-        
-        # Empty description after stripping should become None
-        product = ProductCreate(
-            sku="EMPTY-DESC",
-            name="Test Product",
-            description="   ",  # Just whitespace
-            quantity=10
-        )
-        assert product.description is None
-    
-    def test_product_create_quantity_validation(self):
-        """Test quantity validation."""
-        # Valid quantities
-        for qty in [0, 1, 100, 9999]:
-            product = ProductCreate(
-                sku=f"QTY-{qty}",
-                name="Quantity Test",
-                quantity=qty
-            )
-            assert product.quantity == qty
-        
-        # Invalid quantities
-        with pytest.raises(ValidationError):
-            ProductCreate(
-                sku="NEG-QTY",
-                name="Negative Quantity",
-                quantity=-1
-            )
-
-
-class TestStockOperationModel:
-    """Test the StockOperation model."""
-    
-    def test_stock_operation_valid_amounts(self):
-        """Test valid stock operation amounts."""
-        for amount in [1, 5, 100, 9999]:
-            operation = StockOperation(amount=amount)
-            assert operation.amount == amount
-    
-    def test_stock_operation_invalid_amounts(self):
-        """Test invalid stock operation amounts."""
-        invalid_amounts = [0, -1, -100]
-        
-        for amount in invalid_amounts:
-            with pytest.raises(ValidationError) as exc_info:
-                StockOperation(amount=amount)
-            
-            error = exc_info.value.errors()[0]
-            assert error['type'] == 'greater_than'
-            assert 'amount' in error['loc']
-
-
-class TestProductResponseModel:
-    """Test the ProductResponse model."""
-    
-    def test_product_response_creation(self):
-        """Test creating ProductResponse from data."""
-        response = ProductResponse(
-            sku="RESP-001",
-            name="Response Test",
-            description="Test description",
-            quantity=25
-        )
-        
-        assert response.sku == "RESP-001"
-        assert response.name == "Response Test"
-        assert response.description == "Test description"
-        assert response.quantity == 25
     
     def test_product_response_from_database_model(self):
         """Test creating ProductResponse from database Product."""
@@ -280,67 +133,40 @@ class TestProductResponseModel:
         assert response.quantity == 30
 
 
-class TestProductListResponseModel:
-    """Test the ProductListResponse model."""
-    
-    def test_product_list_response_creation(self):
-        """Test creating ProductListResponse."""
-        products = [
-            ProductResponse(
-                sku="LIST-001",
-                name="Product 1",
-                description="First product",
-                quantity=10
-            ),
-            ProductResponse(
-                sku="LIST-002",
-                name="Product 2",
-                description="Second product",
-                quantity=20
-            )
-        ]
-        
-        response = ProductListResponse(products=products)
-        
-        assert len(response.products) == 2
-        assert response.products[0].sku == "LIST-001"
-        assert response.products[1].sku == "LIST-002"
-    
-    def test_product_list_response_empty(self):
-        """Test creating empty ProductListResponse."""
-        response = ProductListResponse(products=[])
-        assert len(response.products) == 0
-
-
-class TestErrorResponseModel:
-    """Test the ErrorResponse model."""
-    
-    def test_error_response_creation(self):
-        """Test creating ErrorResponse."""
-        error = ErrorResponse(
-            error="Validation Error",
-            message="Request validation failed",
-            details="SKU format is invalid",
-            path="/products"
-        )
-        
-        assert error.error == "Validation Error"
-        assert error.message == "Request validation failed"
-        assert error.details == "SKU format is invalid"
-        assert error.path == "/products"
-
-
 class TestDatabaseConstraints:
     """Test database-level constraints using an in-memory SQLite database."""
     
-    @pytest.fixture
-    def engine_and_session(self):
-        """Create an in-memory SQLite database for testing."""
-        engine = create_engine("sqlite:///:memory:")
+    @pytest.fixture(scope="session")
+    def engine(self):
+        """
+        Create an in-memory SQLite database once for the whole test session.
+        
+        StaticPool keeps the single connection, and with it the schema, alive
+        for every test that uses the engine.
+        """
+        engine = create_engine(
+            "sqlite://",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False}
+        )
         SQLModel.metadata.create_all(engine)
-        
-        with Session(engine) as session:
-            yield engine, session
+        yield engine
+        engine.dispose()
+    
+    @pytest.fixture
+    def engine_and_session(self, engine):
+        """
+        Give each test a session inside an outer transaction that is rolled back.
+        
+        The session joins the connection's transaction, so its commits do not
+        end it and nothing a test writes outlives the test.
+        """
+        with engine.connect() as connection:
+            transaction = connection.begin()
+            with Session(bind=connection) as session:
+                yield engine, session
+            if transaction.is_active:
+                transaction.rollback()
     
     def test_unique_sku_constraint(self, engine_and_session):
         """Test that duplicate SKUs are rejected at the database level."""
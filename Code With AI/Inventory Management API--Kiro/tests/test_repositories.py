@@ -8,30 +8,41 @@ This module tests the repository implementations, focusing on:
 - Error handling and edge cases
 """
 
+import asyncio
 import pytest
 import pytest_asyncio
-
-# Configure pytest-asyncio to automatically handle async tests
-pytest_asyncio.asyncio_mode = "auto"
-import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 from sqlmodel import SQLModel
 
 from inventory_api.models.database import Product
 from inventory_api.models.api import ProductCreate
 from inventory_api.repositories.sqlmodel import SQLModelProductRepository
-from inventory_api.core.exceptions import DuplicateSKU
+from inventory_api.core.database import set_sqlite_pragmas
+from inventory_api.core.exceptions import DuplicateSKU, InsufficientStock
 
 
 # Test database setup
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module")
 async def engine():
-    """Create test database engine."""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    """
+    Create test database engine and schema once for the module.
+    
+    Every in-memory SQLite connection is its own database, so StaticPool
+    keeps a single connection that all sessions, including the concurrent
+    ones, share.
+    """
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        echo=False
+    )
     
     # Create tables
     async with engine.begin() as conn:
@@ -44,16 +55,30 @@ async def engine():
 
 
 @pytest.fixture
-async def session(engine):
-    """Create test database session."""
-    async_session_factory = sessionmaker(
+def session_factory(engine):
+    """Create a session factory bound to the test engine."""
+    return sessionmaker(
         bind=engine,
         class_=AsyncSession,
         expire_on_commit=False
     )
+
+
+@pytest_asyncio.fixture
+async def session(engine, session_factory):
+    """
+    Create test database session.
     
-    async with async_session_factory() as session:
+    Rows are deleted afterwards instead of rebuilding the schema. The
+    repository commits its own writes and the concurrency tests use separate
+    sessions, so a per-test rollback would not undo them.
+    """
+    async with session_factory() as session:
         yield session
+    
+    async with engine.begin() as conn:
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            await conn.execute(table.delete())
 
 
 @pytest.fixture
@@ -62,9 +87,14 @@ async def repository(session):
     return SQLModelProductRepository(session)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_product_data():
-    """Sample product data for testing."""
+    """
+    Sample product data for testing, validated once for the module.
+    
+    Shared between tests, so never mutate it: derive variants with
+    ``model_copy(update=...)`` instead.
+    """
     return ProductCreate(
         sku="TEST-001",
         name="Test Product",
@@ -73,6 +103,31 @@ def sample_product_data():
     )
 
 
+@pytest.fixture
+def initial_qty(sample_product_data):
+    """Starting stock for ``created_product``; override with parametrize."""
+    return sample_product_data.quantity
+
+
+@pytest_asyncio.fixture
+async def created_product(repository, sample_product_data, initial_qty):
+    """Create the sample product with ``initial_qty`` stock and return ``(sku, product)``."""
+    product_data = sample_product_data.model_copy(update={"quantity": initial_qty})
+    created = await repository.create_product(product_data)
+    return product_data.sku, created
+
+
+async def bulk_insert(session, rows):
+    """
+    Insert products directly with a single commit.
+    
+    For tests that only need rows to exist, rather than paying one
+    create_product round trip and commit per row.
+    """
+    session.add_all([Product(**row) for row in rows])
+    await session.commit()
+
+
 class TestProductRepositoryBasicOperations:
     """Test basic CRUD operations."""
     
@@ -102,14 +157,13 @@ class TestProductRepositoryBasicOperations:
         products = await repository.get_all_products()
         assert products == []
     
-    async def test_get_all_products_with_data(self, repository):
+    async def test_get_all_products_with_data(self, repository, session):
         """Test getting all products when some exist."""
         # Create test products
-        product1_data = ProductCreate(sku="TEST-001", name="Product 1", quantity=5)
-        product2_data = ProductCreate(sku="TEST-002", name="Product 2", quantity=10)
-        
-        await repository.create_product(product1_data)
-        await repository.create_product(product2_data)
+        await bulk_insert(session, [
+            {"sku": "TEST-001", "name": "Product 1", "quantity": 5},
+            {"sku": "TEST-002", "name": "Product 2", "quantity": 10},
+        ])
         
         products = await repository.get_all_products()
         
@@ -118,6 +172,18 @@ class TestProductRepositoryBasicOperations:
         assert products[0].sku == "TEST-001"
         assert products[1].sku == "TEST-002"
     
+    async def test_get_products_by_skus(self, repository, session):
+        """Test looking up several products by SKU in one query."""
+        await bulk_insert(session, [
+            {"sku": sku, "name": f"Product {sku}", "quantity": 5}
+            for sku in ("TEST-001", "TEST-002", "TEST-003")
+        ])
+        
+        products = await repository.get_products_by_skus(["TEST-003", "TEST-001", "UNKNOWN"])
+        
+        # Unknown SKUs are skipped and results are ordered by SKU
+        assert [product.sku for product in products] == ["TEST-001", "TEST-003"]
+    
     async def test_get_product_by_sku_exists(self, repository, sample_product_data):
         """Test getting a product by SKU when it exists."""
         created_product = await repository.create_product(sample_product_data)
@@ -137,14 +203,13 @@ class TestProductRepositoryBasicOperations:
 class TestStockOperationsAtomic:
     """Test atomic stock operations."""
     
-    async def test_add_stock_success(self, repository, sample_product_data):
+    async def test_add_stock_success(self, repository, created_product):
         """Test successful stock addition."""
-        # Create product with initial stock
-        created_product = await repository.create_product(sample_product_data)
-        initial_quantity = created_product.quantity
+        sku, product = created_product
+        initial_quantity = product.quantity
         
         # Add stock
-        updated_product = await repository.add_stock_atomic(sample_product_data.sku, 5)
+        updated_product = await repository.add_stock_atomic(sku, 5)
         
         assert updated_product is not None
         assert updated_product.quantity == initial_quantity + 5
@@ -154,52 +219,45 @@ class TestStockOperationsAtomic:
         result = await repository.add_stock_atomic("NONEXISTENT", 5)
         assert result is None
     
-    async def test_add_stock_invalid_amount(self, repository, sample_product_data):
+    @pytest.mark.parametrize("amount", [0, -5])
+    async def test_add_stock_invalid_amount(self, repository, created_product, amount):
         """Test adding invalid (non-positive) stock amount."""
-        await repository.create_product(sample_product_data)
-        
         with pytest.raises(ValueError, match="Amount must be positive"):
-            await repository.add_stock_atomic(sample_product_data.sku, 0)
-        
-        with pytest.raises(ValueError, match="Amount must be positive"):
-            await repository.add_stock_atomic(sample_product_data.sku, -5)
+            await repository.add_stock_atomic(created_product[0], amount)
     
-    async def test_remove_stock_success(self, repository, sample_product_data):
+    async def test_remove_stock_success(self, repository, created_product):
         """Test successful stock removal."""
-        # Create product with initial stock
-        created_product = await repository.create_product(sample_product_data)
-        initial_quantity = created_product.quantity
+        sku, product = created_product
+        initial_quantity = product.quantity
         
         # Remove stock
-        updated_product = await repository.remove_stock_atomic(sample_product_data.sku, 3)
+        updated_product = await repository.remove_stock_atomic(sku, 3)
         
         assert updated_product is not None
         assert updated_product.quantity == initial_quantity - 3
     
-    async def test_remove_stock_insufficient(self, repository, sample_product_data):
+    @pytest.mark.parametrize("initial_qty", [5])
+    async def test_remove_stock_insufficient(self, repository, created_product):
         """Test removing more stock than available."""
-        # Create product with limited stock
-        sample_product_data.quantity = 5
-        await repository.create_product(sample_product_data)
+        sku, _ = created_product
         
         # Try to remove more than available
-        result = await repository.remove_stock_atomic(sample_product_data.sku, 10)
+        result = await repository.remove_stock_atomic(sku, 10)
         
         # Should return None (insufficient stock)
         assert result is None
         
         # Verify original quantity unchanged
-        product = await repository.get_product_by_sku(sample_product_data.sku)
+        product = await repository.get_product_by_sku(sku)
         assert product.quantity == 5
     
-    async def test_remove_stock_exact_amount(self, repository, sample_product_data):
+    @pytest.mark.parametrize("initial_qty", [5, 20])
+    async def test_remove_stock_exact_amount(self, repository, created_product, initial_qty):
         """Test removing exact available stock amount."""
-        # Create product with specific stock
-        sample_product_data.quantity = 5
-        await repository.create_product(sample_product_data)
+        sku, _ = created_product
         
         # Remove exact amount
-        updated_product = await repository.remove_stock_atomic(sample_product_data.sku, 5)
+        updated_product = await repository.remove_stock_atomic(sku, initial_qty)
         
         assert updated_product is not None
         assert updated_product.quantity == 0
@@ -209,21 +267,88 @@ class TestStockOperationsAtomic:
         result = await repository.remove_stock_atomic("NONEXISTENT", 5)
         assert result is None
     
-    async def test_remove_stock_invalid_amount(self, repository, sample_product_data):
+    @pytest.mark.parametrize("amount", [0, -5])
+    async def test_remove_stock_invalid_amount(self, repository, created_product, amount):
         """Test removing invalid (non-positive) stock amount."""
+        with pytest.raises(ValueError, match="Amount must be positive"):
+            await repository.remove_stock_atomic(created_product[0], amount)
+    
+    async def test_adjust_stock_applies_changes_in_order(self, repository, sample_product_data):
+        """Test applying a batch of adds and removes in one call."""
         await repository.create_product(sample_product_data)
         
-        with pytest.raises(ValueError, match="Amount must be positive"):
-            await repository.remove_stock_atomic(sample_product_data.sku, 0)
+        # 10 + 5 - 12 + 3 (the removal only fits because the add came first)
+        updated_product = await repository.adjust_stock_atomic(sample_product_data.sku, [5, -12, 3])
         
-        with pytest.raises(ValueError, match="Amount must be positive"):
-            await repository.remove_stock_atomic(sample_product_data.sku, -5)
+        assert updated_product is not None
+        assert updated_product.quantity == 6
+    
+    async def test_adjust_stock_insufficient_leaves_product_unchanged(self, repository, sample_product_data):
+        """Test that a failing step in a batch discards the earlier steps."""
+        await repository.create_product(sample_product_data)
+        
+        with pytest.raises(InsufficientStock) as exc_info:
+            await repository.adjust_stock_atomic(sample_product_data.sku, [5, -20])
+        
+        assert exc_info.value.requested_amount == 20
+        assert exc_info.value.available_amount == 15
+        
+        product = await repository.get_product_by_sku(sample_product_data.sku)
+        assert product.quantity == 10
+    
+    async def test_adjust_stock_product_not_found(self, repository):
+        """Test adjusting stock of a non-existent product."""
+        result = await repository.adjust_stock_atomic("NONEXISTENT", [5])
+        assert result is None
+
+
+async def run_in_own_session(session_factory, operation):
+    """
+    Run a repository operation in its own session.
+    
+    An AsyncSession cannot be shared between concurrently running tasks, so
+    each simulated request gets a dedicated session and repository.
+    """
+    async with session_factory() as task_session:
+        return await operation(SQLModelProductRepository(task_session))
+
+
+# Two tasks are enough to exercise a race; the wider fan-out runs unless -m "not slow"
+CONCURRENCY_LEVELS = pytest.mark.parametrize(
+    "n_tasks", [2, pytest.param(5, marks=pytest.mark.slow)]
+)
 
 
 class TestConcurrentOperations:
     """Test concurrent access scenarios to verify atomic behavior."""
     
-    async def test_concurrent_stock_addition(self, repository, sample_product_data):
+    @pytest_asyncio.fixture
+    async def engine(self, tmp_path):
+        """
+        File-backed WAL database with a real connection pool for this class.
+        
+        Overrides the module's in-memory engine: there every session shares
+        one connection, so operations are serialized before they ever reach
+        SQLite. Here each session gets its own connection and concurrent
+        writers contend for the database lock as they would in production.
+        """
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'concurrent.db'}",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=5,
+            echo=False
+        )
+        event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+        
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        
+        yield engine
+        
+        await engine.dispose()
+    
+    @CONCURRENCY_LEVELS
+    async def test_concurrent_stock_addition(self, repository, session_factory, sample_product_data, n_tasks):
         """Test concurrent stock additions are handled atomically."""
         # Create product with initial stock
         await repository.create_product(sample_product_data)
@@ -231,43 +356,58 @@ class TestConcurrentOperations:
         
         # Define concurrent add operations
         async def add_stock_task(amount):
-            return await repository.add_stock_atomic(sample_product_data.sku, amount)
+            return await run_in_own_session(
+                session_factory,
+                lambda repo: repo.add_stock_atomic(sample_product_data.sku, amount)
+            )
         
         # Run multiple add operations concurrently
-        tasks = [add_stock_task(2) for _ in range(5)]
-        results = await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(add_stock_task(2)) for _ in range(n_tasks)]
+        results = [task.result() for task in tasks]
         
         # All operations should succeed
         assert all(result is not None for result in results)
         
         # Verify final quantity is correct
-        final_product = await repository.get_product_by_sku(sample_product_data.sku)
-        expected_quantity = initial_quantity + (2 * 5)  # 5 operations adding 2 each
+        final_product = await run_in_own_session(
+            session_factory,
+            lambda repo: repo.get_product_by_sku(sample_product_data.sku)
+        )
+        expected_quantity = initial_quantity + (2 * n_tasks)  # Each operation adds 2
         assert final_product.quantity == expected_quantity
     
-    async def test_concurrent_stock_removal_success(self, repository, sample_product_data):
+    @CONCURRENCY_LEVELS
+    async def test_concurrent_stock_removal_success(self, repository, session_factory, sample_product_data, n_tasks):
         """Test concurrent stock removals when sufficient stock exists."""
         # Create product with enough stock for all operations
-        sample_product_data.quantity = 20
-        await repository.create_product(sample_product_data)
+        product_data = sample_product_data.model_copy(update={"quantity": 20})
+        await repository.create_product(product_data)
         
         # Define concurrent remove operations
         async def remove_stock_task(amount):
-            return await repository.remove_stock_atomic(sample_product_data.sku, amount)
+            return await run_in_own_session(
+                session_factory,
+                lambda repo: repo.remove_stock_atomic(sample_product_data.sku, amount)
+            )
         
-        # Run multiple remove operations concurrently (total: 10)
-        tasks = [remove_stock_task(2) for _ in range(5)]
-        results = await asyncio.gather(*tasks)
+        # Run multiple remove operations concurrently (at most 5 x 2 = 10)
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(remove_stock_task(2)) for _ in range(n_tasks)]
+        results = [task.result() for task in tasks]
         
         # All operations should succeed
         assert all(result is not None for result in results)
         
         # Verify final quantity is correct
-        final_product = await repository.get_product_by_sku(sample_product_data.sku)
-        expected_quantity = 20 - (2 * 5)  # 5 operations removing 2 each
+        final_product = await run_in_own_session(
+            session_factory,
+            lambda repo: repo.get_product_by_sku(sample_product_data.sku)
+        )
+        expected_quantity = 20 - (2 * n_tasks)  # Each operation removes 2
         assert final_product.quantity == expected_quantity
     
-    async def test_concurrent_stock_removal_race_condition(self, repository, sample_product_data):
+    async def test_concurrent_stock_removal_race_condition(self, repository, session_factory, sample_product_data):
         """
         Test the critical race condition scenario: multiple requests trying to buy the last item.
         
@@ -275,12 +415,15 @@ class TestConcurrentOperations:
         simultaneously. Only one should succeed, preventing overselling.
         """
         # Create product with only 1 item in stock
-        sample_product_data.quantity = 1
-        await repository.create_product(sample_product_data)
+        product_data = sample_product_data.model_copy(update={"quantity": 1})
+        await repository.create_product(product_data)
         
         # Define concurrent remove operations trying to remove 1 item each
         async def remove_last_item():
-            return await repository.remove_stock_atomic(sample_product_data.sku, 1)
+            return await run_in_own_session(
+                session_factory,
+                lambda repo: repo.remove_stock_atomic(sample_product_data.sku, 1)
+            )
         
         # Run two operations concurrently trying to get the last item
         results = await asyncio.gather(
@@ -297,21 +440,75 @@ class TestConcurrentOperations:
         assert len(failed_operations) == 1, "One operation should fail"
         
         # Verify final state: quantity should be 0
-        final_product = await repository.get_product_by_sku(sample_product_data.sku)
+        final_product = await run_in_own_session(
+            session_factory,
+            lambda repo: repo.get_product_by_sku(sample_product_data.sku)
+        )
         assert final_product.quantity == 0, "Final quantity should be 0"
     
-    async def test_mixed_concurrent_operations(self, repository, sample_product_data):
+    async def test_concurrent_stock_adjustment(self, repository, session_factory, sample_product_data):
+        """Test that concurrent adjustment batches are each applied exactly once."""
+        product_data = sample_product_data.model_copy(update={"quantity": 1000})
+        await repository.create_product(product_data)
+        
+        async def adjust_stock():
+            return await run_in_own_session(
+                session_factory,
+                lambda repo: repo.adjust_stock_atomic(sample_product_data.sku, [10, -1])
+            )
+        
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(adjust_stock()) for _ in range(20)]
+        assert all(task.result() is not None for task in tasks)
+        
+        # No lost updates: 1000 + 20 * 9
+        final_product = await run_in_own_session(
+            session_factory,
+            lambda repo: repo.get_product_by_sku(sample_product_data.sku)
+        )
+        assert final_product.quantity == 1180
+    
+    async def test_concurrent_stock_adjustment_cannot_oversell(self, repository, session_factory, sample_product_data):
+        """Test that concurrent removal batches never take more stock than exists."""
+        await repository.create_product(sample_product_data)  # quantity 10
+        
+        async def remove_one():
+            return await run_in_own_session(
+                session_factory,
+                lambda repo: repo.adjust_stock_atomic(sample_product_data.sku, [-1])
+            )
+        
+        results = await asyncio.gather(*(remove_one() for _ in range(15)), return_exceptions=True)
+        
+        successful_operations = [r for r in results if not isinstance(r, Exception)]
+        rejected_operations = [r for r in results if isinstance(r, InsufficientStock)]
+        assert len(successful_operations) == 10
+        assert len(rejected_operations) == 5
+        
+        final_product = await run_in_own_session(
+            session_factory,
+            lambda repo: repo.get_product_by_sku(sample_product_data.sku)
+        )
+        assert final_product.quantity == 0
+    
+    async def test_mixed_concurrent_operations(self, repository, session_factory, sample_product_data):
         """Test concurrent mix of add and remove operations."""
         # Create product with initial stock
-        sample_product_data.quantity = 10
-        await repository.create_product(sample_product_data)
+        product_data = sample_product_data.model_copy(update={"quantity": 10})
+        await repository.create_product(product_data)
         
         # Define mixed operations
         async def add_stock():
-            return await repository.add_stock_atomic(sample_product_data.sku, 3)
+            return await run_in_own_session(
+                session_factory,
+                lambda repo: repo.add_stock_atomic(sample_product_data.sku, 3)
+            )
         
         async def remove_stock():
-            return await repository.remove_stock_atomic(sample_product_data.sku, 2)
+            return await run_in_own_session(
+                session_factory,
+                lambda repo: repo.remove_stock_atomic(sample_product_data.sku, 2)
+            )
         
         # Run mixed operations concurrently
         tasks = [add_stock(), remove_stock(), add_stock(), remove_stock()]
@@ -322,7 +519,10 @@ class TestConcurrentOperations:
         assert len(successful_results) == 4
         
         # Verify final quantity: 10 + 3 - 2 + 3 - 2 = 12
-        final_product = await repository.get_product_by_sku(sample_product_data.sku)
+        final_product = await run_in_own_session(
+            session_factory,
+            lambda repo: repo.get_product_by_sku(sample_product_data.sku)
+        )
         assert final_product.quantity == 12
 
 
@@ -350,14 +550,14 @@ class TestEdgeCases:
         product_data = ProductCreate(sku="ZERO-001", name="Zero Stock", quantity=0)
         await repository.create_product(product_data)
         
+        # Removing from zero stock should fail
+        result = await repository.remove_stock_atomic("ZERO-001", 1)
+        assert result is None  # Should fail due to insufficient stock
+        
         # Adding to zero stock should work
         result = await repository.add_stock_atomic("ZERO-001", 5)
         assert result is not None
         assert result.quantity == 5
-        
-        # Removing from zero stock should fail
-        result = await repository.remove_stock_atomic("ZERO-001", 1)
-        assert result is None  # Should fail due to insufficient stock
     
     async def test_large_quantity_operations(self, repository):
         """Test operations with large quantities."""
@@ -2,15 +2,16 @@
 Unit tests for the service layer.
 
 These tests verify business logic, error handling, and the interaction
-between services and repositories using mocks to isolate the service layer.
+between services and repositories using a fake repository to isolate the
+service layer.
 """
 
 import pytest
-from unittest.mock import AsyncMock, Mock
+from collections import defaultdict
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from inventory_api.services.product import ProductService
-from inventory_api.models.api import ProductCreate, ProductResponse
+from inventory_api.models.api import ProductCreate, ProductResponse, StockAdjustment
 from inventory_api.models.database import Product
 from inventory_api.core.exceptions import (
     ProductNotFound,
@@ -20,20 +21,97 @@ from inventory_api.core.exceptions import (
 )
 
 
+# Repository errors raised by the create_product tests, built once and reused
+_DUPLICATE_SKU_ERROR = IntegrityError(
+    "statement", "params", Exception("UNIQUE constraint failed: product.sku")
+)
+_CHECK_CONSTRAINT_ERROR = IntegrityError(
+    "statement", "params", Exception("CHECK constraint failed")
+)
+
+# Entities returned by the fake repository, built once and shared read-only;
+# the variants are copies of the base entity with one field changed
+_PRODUCT_QTY_10 = Product(
+    id=1,
+    sku="TEST-001",
+    name="Test Product",
+    description="A test product",
+    quantity=10
+)
+_PRODUCT_QTY_5 = _PRODUCT_QTY_10.model_copy(update={"quantity": 5})
+_PRODUCT_QTY_7 = _PRODUCT_QTY_10.model_copy(update={"quantity": 7})
+_PRODUCT_QTY_12 = _PRODUCT_QTY_10.model_copy(update={"quantity": 12})
+_PRODUCT_QTY_15 = _PRODUCT_QTY_10.model_copy(update={"quantity": 15})
+_PRODUCT_NONE_DESC = _PRODUCT_QTY_10.model_copy(update={"description": None})
+_OTHER_PRODUCT = Product(id=2, sku="TEST-002", name="Product 2", description=None, quantity=5)
+
+
+class FakeProductRepository:
+    """
+    Stand-in for ProductRepositoryProtocol with scripted results.
+    
+    Each method records its arguments in ``calls`` and then raises the
+    exception set in ``raises`` or returns the value set in ``returns``
+    (None by default). Plain coroutines keep the per-call cost far below
+    that of AsyncMock's introspection and call bookkeeping.
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Forget recorded calls and scripted results."""
+        self.returns = {}
+        self.raises = {}
+        self.calls = defaultdict(list)
+    
+    def _respond(self, method, *args):
+        self.calls[method].append(args)
+        if method in self.raises:
+            raise self.raises[method]
+        return self.returns.get(method)
+    
+    async def create_product(self, product_data):
+        return self._respond("create_product", product_data)
+    
+    async def get_all_products(self):
+        return self._respond("get_all_products")
+    
+    async def get_products_by_skus(self, skus):
+        return self._respond("get_products_by_skus", skus)
+    
+    async def get_product_by_sku(self, sku):
+        return self._respond("get_product_by_sku", sku)
+    
+    async def add_stock_atomic(self, sku, amount):
+        return self._respond("add_stock_atomic", sku, amount)
+    
+    async def remove_stock_atomic(self, sku, amount):
+        return self._respond("remove_stock_atomic", sku, amount)
+    
+    async def adjust_stock_atomic(self, sku, changes):
+        return self._respond("adjust_stock_atomic", sku, changes)
+
+
 # Global fixtures for all test classes
-@pytest.fixture
-def mock_repository():
-    """Create a mock repository for testing."""
-    return AsyncMock()
+@pytest.fixture(scope="session")
+def fake_repository():
+    """Create a fake repository, shared by every test in the session."""
+    return FakeProductRepository()
 
-@pytest.fixture
-def service(mock_repository):
-    """Create a ProductService instance with mocked repository."""
-    return ProductService(mock_repository)
+@pytest.fixture(autouse=True)
+def reset_fake_repository(fake_repository):
+    """Clear calls and scripted results left by the previous test."""
+    fake_repository.reset()
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def service(fake_repository):
+    """Create a ProductService instance with the fake repository."""
+    return ProductService(fake_repository)
+
+@pytest.fixture(scope="module")
 def sample_product_create():
-    """Sample product creation data."""
+    """Sample product creation data, validated once and shared read-only."""
     return ProductCreate(
         sku="TEST-001",
         name="Test Product",
@@ -44,13 +122,7 @@ def sample_product_create():
 @pytest.fixture
 def sample_product_entity():
     """Sample product database entity."""
-    return Product(
-        id=1,
-        sku="TEST-001",
-        name="Test Product",
-        description="A test product",
-        quantity=10
-    )
+    return _PRODUCT_QTY_10
 
 @pytest.fixture
 def sample_product_response():
@@ -71,12 +143,11 @@ class TestProductService:
 class TestCreateProduct:
     """Tests for product creation business logic."""
     
-    @pytest.mark.asyncio
-    async def test_create_product_success(self, service, mock_repository, 
+    async def test_create_product_success(self, service, fake_repository, 
                                         sample_product_create, sample_product_entity):
         """Test successful product creation."""
         # Arrange
-        mock_repository.create_product.return_value = sample_product_entity
+        fake_repository.returns["create_product"] = sample_product_entity
         
         # Act
         result = await service.create_product(sample_product_create)
@@ -87,70 +158,61 @@ class TestCreateProduct:
         assert result.name == "Test Product"
         assert result.description == "A test product"
         assert result.quantity == 10
-        mock_repository.create_product.assert_called_once_with(sample_product_create)
+        # Identity check: the service must pass the caller's model through unchanged
+        assert len(fake_repository.calls["create_product"]) == 1
+        assert fake_repository.calls["create_product"][0][0] is sample_product_create
     
-    @pytest.mark.asyncio
-    async def test_create_product_duplicate_sku(self, service, mock_repository, 
+    async def test_create_product_duplicate_sku(self, service, fake_repository, 
                                               sample_product_create):
         """Test product creation with duplicate SKU."""
         # Arrange
-        orig_error = Mock()
-        orig_error.__str__ = Mock(return_value="UNIQUE constraint failed: product.sku")
-        integrity_error = IntegrityError("statement", "params", orig_error)
-        mock_repository.create_product.side_effect = integrity_error
+        fake_repository.raises["create_product"] = _DUPLICATE_SKU_ERROR
         
         # Act & Assert
         with pytest.raises(DuplicateSKU) as exc_info:
             await service.create_product(sample_product_create)
         
         assert exc_info.value.sku == "TEST-001"
-        mock_repository.create_product.assert_called_once_with(sample_product_create)
+        assert len(fake_repository.calls["create_product"]) == 1
+        assert fake_repository.calls["create_product"][0][0] is sample_product_create
     
-    @pytest.mark.asyncio
-    async def test_create_product_other_integrity_error(self, service, mock_repository, 
+    async def test_create_product_other_integrity_error(self, service, fake_repository, 
                                                       sample_product_create):
         """Test product creation with non-duplicate integrity error."""
         # Arrange
-        orig_error = Mock()
-        orig_error.__str__ = Mock(return_value="CHECK constraint failed")
-        integrity_error = IntegrityError("statement", "params", orig_error)
-        mock_repository.create_product.side_effect = integrity_error
+        fake_repository.raises["create_product"] = _CHECK_CONSTRAINT_ERROR
         
         # Act & Assert
         with pytest.raises(DatabaseError) as exc_info:
             await service.create_product(sample_product_create)
         
         assert exc_info.value.operation == "product creation"
-        mock_repository.create_product.assert_called_once_with(sample_product_create)
+        assert len(fake_repository.calls["create_product"]) == 1
+        assert fake_repository.calls["create_product"][0][0] is sample_product_create
     
-    @pytest.mark.asyncio
-    async def test_create_product_database_error(self, service, mock_repository, 
+    async def test_create_product_database_error(self, service, fake_repository, 
                                                 sample_product_create):
         """Test product creation with general database error."""
         # Arrange
         db_error = SQLAlchemyError("Database connection failed")
-        mock_repository.create_product.side_effect = db_error
+        fake_repository.raises["create_product"] = db_error
         
         # Act & Assert
         with pytest.raises(DatabaseError) as exc_info:
             await service.create_product(sample_product_create)
         
         assert exc_info.value.operation == "product creation"
-        mock_repository.create_product.assert_called_once_with(sample_product_create)
+        assert len(fake_repository.calls["create_product"]) == 1
+        assert fake_repository.calls["create_product"][0][0] is sample_product_create
 
 
 class TestGetAllProducts:
     """Tests for retrieving all products."""
     
-    @pytest.mark.asyncio
-    async def test_get_all_products_success(self, service, mock_repository):
+    async def test_get_all_products_success(self, service, fake_repository):
         """Test successful retrieval of all products."""
         # Arrange
-        products = [
-            Product(id=1, sku="TEST-001", name="Product 1", description="Desc 1", quantity=10),
-            Product(id=2, sku="TEST-002", name="Product 2", description=None, quantity=5)
-        ]
-        mock_repository.get_all_products.return_value = products
+        fake_repository.returns["get_all_products"] = [_PRODUCT_QTY_10, _OTHER_PRODUCT]
         
         # Act
         result = await service.get_all_products()
@@ -160,44 +222,47 @@ class TestGetAllProducts:
         assert all(isinstance(p, ProductResponse) for p in result)
         assert result[0].sku == "TEST-001"
         assert result[1].sku == "TEST-002"
-        mock_repository.get_all_products.assert_called_once()
+        assert fake_repository.calls["get_all_products"] == [()]
     
-    @pytest.mark.asyncio
-    async def test_get_all_products_empty(self, service, mock_repository):
+    async def test_get_all_products_empty(self, service, fake_repository):
         """Test retrieval when no products exist."""
         # Arrange
-        mock_repository.get_all_products.return_value = []
+        fake_repository.returns["get_all_products"] = []
         
         # Act
         result = await service.get_all_products()
         
         # Assert
         assert result == []
-        mock_repository.get_all_products.assert_called_once()
+        assert fake_repository.calls["get_all_products"] == [()]
+
+
+class TestGetProductsBySkus:
+    """Tests for looking up several products by SKU."""
     
-    @pytest.mark.asyncio
-    async def test_get_all_products_database_error(self, service, mock_repository):
-        """Test retrieval with database error."""
+    async def test_get_products_by_skus_success(self, service, fake_repository,
+                                                sample_product_entity):
+        """Test multi-SKU lookup returns response models."""
         # Arrange
-        db_error = SQLAlchemyError("Connection timeout")
-        mock_repository.get_all_products.side_effect = db_error
+        fake_repository.returns["get_products_by_skus"] = [sample_product_entity]
         
-        # Act & Assert
-        with pytest.raises(DatabaseError) as exc_info:
-            await service.get_all_products()
+        # Act
+        result = await service.get_products_by_skus(["TEST-001", "UNKNOWN"])
         
-        assert exc_info.value.operation == "product retrieval"
+        # Assert
+        assert [product.sku for product in result] == ["TEST-001"]
+        assert all(isinstance(product, ProductResponse) for product in result)
+        assert fake_repository.calls["get_products_by_skus"] == [(["TEST-001", "UNKNOWN"],)]
 
 
 class TestGetProductBySku:
     """Tests for retrieving a product by SKU."""
     
-    @pytest.mark.asyncio
-    async def test_get_product_by_sku_success(self, service, mock_repository, 
+    async def test_get_product_by_sku_success(self, service, fake_repository, 
                                             sample_product_entity):
         """Test successful product retrieval by SKU."""
         # Arrange
-        mock_repository.get_product_by_sku.return_value = sample_product_entity
+        fake_repository.returns["get_product_by_sku"] = sample_product_entity
         
         # Act
         result = await service.get_product_by_sku("TEST-001")
@@ -205,45 +270,28 @@ class TestGetProductBySku:
         # Assert
         assert isinstance(result, ProductResponse)
         assert result.sku == "TEST-001"
-        mock_repository.get_product_by_sku.assert_called_once_with("TEST-001")
+        assert fake_repository.calls["get_product_by_sku"] == [("TEST-001",)]
     
-    @pytest.mark.asyncio
-    async def test_get_product_by_sku_not_found(self, service, mock_repository):
+    async def test_get_product_by_sku_not_found(self, service, fake_repository):
         """Test product retrieval when product doesn't exist."""
         # Arrange
-        mock_repository.get_product_by_sku.return_value = None
+        fake_repository.returns["get_product_by_sku"] = None
         
         # Act & Assert
         with pytest.raises(ProductNotFound) as exc_info:
             await service.get_product_by_sku("NONEXISTENT")
         
         assert exc_info.value.sku == "NONEXISTENT"
-        mock_repository.get_product_by_sku.assert_called_once_with("NONEXISTENT")
-    
-    @pytest.mark.asyncio
-    async def test_get_product_by_sku_database_error(self, service, mock_repository):
-        """Test product retrieval with database error."""
-        # Arrange
-        db_error = SQLAlchemyError("Query failed")
-        mock_repository.get_product_by_sku.side_effect = db_error
-        
-        # Act & Assert
-        with pytest.raises(DatabaseError) as exc_info:
-            await service.get_product_by_sku("TEST-001")
-        
-        assert exc_info.value.operation == "product retrieval"
+        assert fake_repository.calls["get_product_by_sku"] == [("NONEXISTENT",)]
 
 
 class TestAddStock:
     """Tests for adding stock to products."""
     
-    @pytest.mark.asyncio
-    async def test_add_stock_success(self, service, mock_repository):
+    async def test_add_stock_success(self, service, fake_repository):
         """Test successful stock addition."""
         # Arrange
-        updated_product = Product(id=1, sku="TEST-001", name="Test Product", 
-                                description="A test product", quantity=15)
-        mock_repository.add_stock_atomic.return_value = updated_product
+        fake_repository.returns["add_stock_atomic"] = _PRODUCT_QTY_15
         
         # Act
         result = await service.add_stock("TEST-001", 5)
@@ -251,13 +299,12 @@ class TestAddStock:
         # Assert
         assert isinstance(result, ProductResponse)
         assert result.quantity == 15
-        mock_repository.add_stock_atomic.assert_called_once_with("TEST-001", 5)
+        assert fake_repository.calls["add_stock_atomic"] == [("TEST-001", 5)]
     
-    @pytest.mark.asyncio
-    async def test_add_stock_product_not_found(self, service, mock_repository):
+    async def test_add_stock_product_not_found(self, service, fake_repository):
         """Test stock addition when product doesn't exist."""
         # Arrange
-        mock_repository.add_stock_atomic.return_value = None
+        fake_repository.returns["add_stock_atomic"] = None
         
         # Act & Assert
         with pytest.raises(ProductNotFound) as exc_info:
@@ -265,147 +312,169 @@ class TestAddStock:
         
         assert exc_info.value.sku == "NONEXISTENT"
     
-    @pytest.mark.asyncio
-    async def test_add_stock_invalid_amount_zero(self, service, mock_repository):
-        """Test stock addition with zero amount."""
+    async def test_add_stock_rejects_nonpositive(self, service, fake_repository):
+        """Test that stock addition validates the amount before touching the repository."""
         # Act & Assert
         with pytest.raises(ValueError, match="Amount must be positive"):
             await service.add_stock("TEST-001", 0)
         
         # Repository should not be called
-        mock_repository.add_stock_atomic.assert_not_called()
+        assert fake_repository.calls["add_stock_atomic"] == []
+
+
+class TestRemoveStock:
+    """Tests for removing stock from products."""
     
-    @pytest.mark.asyncio
-    async def test_add_stock_invalid_amount_negative(self, service, mock_repository):
-        """Test stock addition with negative amount."""
-        # Act & Assert
-        with pytest.raises(ValueError, match="Amount must be positive"):
-            await service.add_stock("TEST-001", -5)
+    @pytest.mark.parametrize(
+        "removed,current,requested,expected_exc,expected_attrs",
+        [
+            pytest.param(_PRODUCT_QTY_7, None, 3, None,
+                         {"quantity": 7}, id="success"),
+            pytest.param(None, None, 3, ProductNotFound,
+                         {"sku": "TEST-001"}, id="not-found"),
+            pytest.param(None, _PRODUCT_QTY_5, 10, InsufficientStock,
+                         {"sku": "TEST-001", "requested_amount": 10, "available_amount": 5},
+                         id="insufficient"),
+            pytest.param(None, SQLAlchemyError("Query failed"), 3, DatabaseError,
+                         {"operation": "stock removal"}, id="lookup-error"),
+        ],
+    )
+    async def test_remove_stock(self, service, fake_repository, removed, current,
+                                requested, expected_exc, expected_attrs):
+        """Test stock removal outcomes for each atomic-removal and lookup result."""
+        # Arrange: `removed` is what the atomic removal returns, `current` what
+        # the follow-up lookup returns (or raises, for an exception)
+        fake_repository.returns["remove_stock_atomic"] = removed
+        if isinstance(current, Exception):
+            fake_repository.raises["get_product_by_sku"] = current
+        else:
+            fake_repository.returns["get_product_by_sku"] = current
         
-        # Repository should not be called
-        mock_repository.add_stock_atomic.assert_not_called()
-    
-    @pytest.mark.asyncio
-    async def test_add_stock_database_error(self, service, mock_repository):
-        """Test stock addition with database error."""
-        # Arrange
-        db_error = SQLAlchemyError("Transaction failed")
-        mock_repository.add_stock_atomic.side_effect = db_error
+        # Act
+        if expected_exc is None:
+            outcome = await service.remove_stock("TEST-001", requested)
+            assert isinstance(outcome, ProductResponse)
+        else:
+            with pytest.raises(expected_exc) as exc_info:
+                await service.remove_stock("TEST-001", requested)
+            outcome = exc_info.value
         
+        # Assert
+        for name, value in expected_attrs.items():
+            assert getattr(outcome, name) == value
+        assert fake_repository.calls["remove_stock_atomic"] == [("TEST-001", requested)]
+        # The product is only read back when the removal fails
+        expected_lookups = [] if removed is not None else [("TEST-001",)]
+        assert fake_repository.calls["get_product_by_sku"] == expected_lookups
+    
+    async def test_remove_stock_rejects_nonpositive(self, service, fake_repository):
+        """Test that stock removal validates the amount before touching the repository."""
         # Act & Assert
-        with pytest.raises(DatabaseError) as exc_info:
-            await service.add_stock("TEST-001", 5)
+        with pytest.raises(ValueError, match="Amount must be positive"):
+            await service.remove_stock("TEST-001", 0)
         
-        assert exc_info.value.operation == "stock addition"
+        # Repository should not be called
+        assert fake_repository.calls["get_product_by_sku"] == []
+        assert fake_repository.calls["remove_stock_atomic"] == []
 
 
-class TestRemoveStock:
-    """Tests for removing stock from products."""
+class TestAdjustStock:
+    """Tests for applying several stock operations at once."""
     
-    @pytest.mark.asyncio
-    async def test_remove_stock_success(self, service, mock_repository):
-        """Test successful stock removal."""
+    async def test_adjust_stock_success(self, service, fake_repository):
+        """Test that operations are passed to the repository as signed changes."""
         # Arrange
-        current_product = Product(id=1, sku="TEST-001", name="Test Product", 
-                                description="A test product", quantity=10)
-        updated_product = Product(id=1, sku="TEST-001", name="Test Product", 
-                                description="A test product", quantity=7)
-        
-        mock_repository.get_product_by_sku.return_value = current_product
-        mock_repository.remove_stock_atomic.return_value = updated_product
+        fake_repository.returns["adjust_stock_atomic"] = _PRODUCT_QTY_12
+        operations = [
+            StockAdjustment(op="add", amount=5),
+            StockAdjustment(op="remove", amount=3)
+        ]
         
         # Act
-        result = await service.remove_stock("TEST-001", 3)
+        result = await service.adjust_stock("TEST-001", operations)
         
         # Assert
         assert isinstance(result, ProductResponse)
-        assert result.quantity == 7
-        mock_repository.get_product_by_sku.assert_called_once_with("TEST-001")
-        mock_repository.remove_stock_atomic.assert_called_once_with("TEST-001", 3)
+        assert result.quantity == 12
+        assert fake_repository.calls["adjust_stock_atomic"] == [("TEST-001", [5, -3])]
     
-    @pytest.mark.asyncio
-    async def test_remove_stock_product_not_found(self, service, mock_repository):
-        """Test stock removal when product doesn't exist."""
+    async def test_adjust_stock_product_not_found(self, service, fake_repository):
+        """Test stock adjustment when product doesn't exist."""
         # Arrange
-        mock_repository.get_product_by_sku.return_value = None
+        fake_repository.returns["adjust_stock_atomic"] = None
         
         # Act & Assert
         with pytest.raises(ProductNotFound) as exc_info:
-            await service.remove_stock("NONEXISTENT", 3)
+            await service.adjust_stock("NONEXISTENT", [StockAdjustment(op="add", amount=5)])
         
         assert exc_info.value.sku == "NONEXISTENT"
-        mock_repository.get_product_by_sku.assert_called_once_with("NONEXISTENT")
-        mock_repository.remove_stock_atomic.assert_not_called()
     
-    @pytest.mark.asyncio
-    async def test_remove_stock_insufficient_stock(self, service, mock_repository):
-        """Test stock removal with insufficient stock."""
+    async def test_adjust_stock_insufficient_stock(self, service, fake_repository):
+        """Test that InsufficientStock from the repository is passed through."""
         # Arrange
-        current_product = Product(id=1, sku="TEST-001", name="Test Product", 
-                                description="A test product", quantity=5)
-        
-        mock_repository.get_product_by_sku.return_value = current_product
-        mock_repository.remove_stock_atomic.return_value = None  # Insufficient stock
+        fake_repository.raises["adjust_stock_atomic"] = InsufficientStock("TEST-001", 20, 10)
         
         # Act & Assert
-        with pytest.raises(InsufficientStock) as exc_info:
-            await service.remove_stock("TEST-001", 10)
-        
-        assert exc_info.value.sku == "TEST-001"
-        assert exc_info.value.requested_amount == 10
-        assert exc_info.value.available_amount == 5
+        with pytest.raises(InsufficientStock):
+            await service.adjust_stock("TEST-001", [StockAdjustment(op="remove", amount=20)])
     
-    @pytest.mark.asyncio
-    async def test_remove_stock_invalid_amount_zero(self, service, mock_repository):
-        """Test stock removal with zero amount."""
+    async def test_adjust_stock_no_operations(self, service, fake_repository):
+        """Test stock adjustment with an empty operation list."""
         # Act & Assert
-        with pytest.raises(ValueError, match="Amount must be positive"):
-            await service.remove_stock("TEST-001", 0)
-        
-        # Repository should not be called
-        mock_repository.get_product_by_sku.assert_not_called()
-        mock_repository.remove_stock_atomic.assert_not_called()
-    
-    @pytest.mark.asyncio
-    async def test_remove_stock_invalid_amount_negative(self, service, mock_repository):
-        """Test stock removal with negative amount."""
-        # Act & Assert
-        with pytest.raises(ValueError, match="Amount must be positive"):
-            await service.remove_stock("TEST-001", -3)
+        with pytest.raises(ValueError, match="At least one operation is required"):
+            await service.adjust_stock("TEST-001", [])
         
         # Repository should not be called
-        mock_repository.get_product_by_sku.assert_not_called()
-        mock_repository.remove_stock_atomic.assert_not_called()
+        assert fake_repository.calls["adjust_stock_atomic"] == []
+
+
+class TestDatabaseErrors:
+    """Tests that repository failures surface as DatabaseError for each operation."""
     
-    @pytest.mark.asyncio
-    async def test_remove_stock_database_error_on_get(self, service, mock_repository):
-        """Test stock removal with database error during product retrieval."""
+    @pytest.mark.parametrize(
+        "operation,repo_method,service_call",
+        [
+            ("product retrieval", "get_all_products",
+             lambda s: s.get_all_products()),
+            ("product retrieval", "get_products_by_skus",
+             lambda s: s.get_products_by_skus(["TEST-001"])),
+            ("product retrieval", "get_product_by_sku",
+             lambda s: s.get_product_by_sku("TEST-001")),
+            ("stock addition", "add_stock_atomic",
+             lambda s: s.add_stock("TEST-001", 5)),
+            ("stock removal", "remove_stock_atomic",
+             lambda s: s.remove_stock("TEST-001", 3)),
+            ("stock adjustment", "adjust_stock_atomic",
+             lambda s: s.adjust_stock("TEST-001", [StockAdjustment(op="add", amount=5)])),
+        ],
+        ids=["get-all", "get-by-skus", "get-by-sku", "add-stock", "remove-stock", "adjust-stock"],
+    )
+    async def test_database_error(self, service, fake_repository,
+                                  operation, repo_method, service_call):
+        """Test that a SQLAlchemyError from the repository becomes a DatabaseError."""
         # Arrange
-        db_error = SQLAlchemyError("Query failed")
-        mock_repository.get_product_by_sku.side_effect = db_error
+        fake_repository.raises[repo_method] = SQLAlchemyError("Query failed")
         
         # Act & Assert
         with pytest.raises(DatabaseError) as exc_info:
-            await service.remove_stock("TEST-001", 3)
+            await service_call(service)
         
-        assert exc_info.value.operation == "stock removal"
+        assert exc_info.value.operation == operation
+
+
+class TestValidatePositiveAmount:
+    """Tests for the amount guard shared by the stock operations."""
     
-    @pytest.mark.asyncio
-    async def test_remove_stock_database_error_on_remove(self, service, mock_repository):
-        """Test stock removal with database error during atomic removal."""
-        # Arrange
-        current_product = Product(id=1, sku="TEST-001", name="Test Product", 
-                                description="A test product", quantity=10)
-        db_error = SQLAlchemyError("Transaction failed")
-        
-        mock_repository.get_product_by_sku.return_value = current_product
-        mock_repository.remove_stock_atomic.side_effect = db_error
-        
-        # Act & Assert
-        with pytest.raises(DatabaseError) as exc_info:
-            await service.remove_stock("TEST-001", 3)
-        
-        assert exc_info.value.operation == "stock removal"
+    @pytest.mark.parametrize("amount", [0, -1, -5])
+    def test_rejects_nonpositive(self, amount):
+        """Test that zero and negative amounts are rejected."""
+        with pytest.raises(ValueError, match="Amount must be positive"):
+            ProductService._validate_positive_amount(amount)
+    
+    @pytest.mark.parametrize("amount", [1, 500])
+    def test_accepts_positive(self, amount):
+        """Test that positive amounts pass."""
+        assert ProductService._validate_positive_amount(amount) is None
 
 
 class TestConvertToResponse:
@@ -422,15 +491,12 @@ class TestConvertToResponse:
         assert result.name == sample_product_entity.name
         assert result.description == sample_product_entity.description
         assert result.quantity == sample_product_entity.quantity
+        assert result.__pydantic_fields_set__ == {"sku", "name", "description", "quantity"}
     
     def test_convert_to_response_none_description(self, service):
         """Test conversion with None description."""
-        # Arrange
-        product = Product(id=1, sku="TEST-001", name="Test Product", 
-                         description=None, quantity=10)
-        
         # Act
-        result = service._convert_to_response(product)
+        result = service._convert_to_response(_PRODUCT_NONE_DESC)
         
         # Assert
         assert result.description is None
\ No newline at end of file
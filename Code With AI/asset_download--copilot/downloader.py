@@ -4,39 +4,114 @@ import httpx # The library for making HTTP requests
 import os # for interacting with OS (Manipulate files & Folders.)
 import argparse # For parsing command-line arguments
 import time # For timing the downloads
+from hashlib import blake2b # For short, stable names derived from a URL
+from urllib.parse import urlsplit # For taking URLs apart safely
+
+# Folder the downloads are saved into
+DOWNLOAD_DIR = os.path.abspath('downloads')
+# Read the response in 64 KiB chunks (httpx defaults to much smaller ones)
+CHUNK_SIZE = 64 * 1024
+# Hand data to the disk in 1 MiB batches so each thread hop does real work
+WRITE_BATCH_SIZE = 1024 * 1024
+# Transient failures (network errors, 429, 5xx) are retried once, after a
+# short exponential backoff; anything else, such as a 404, fails straight away
+MAX_RETRIES = 1
+RETRY_BACKOFF = 0.5  # seconds, doubled on each retry
+# Flags for creating/truncating a download file (O_BINARY only exists on Windows)
+OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+def create_client(max_concurrent=5):
+    """Create an HTTP client that reuses connections across downloads"""
+    # HTTP/2 lets downloads from the same host share one TLS connection
+    limits = httpx.Limits(max_keepalive_connections=max_concurrent,
+                          max_connections=max_concurrent)
+    return httpx.AsyncClient(timeout=30.0, http2=True, limits=limits,
+                             follow_redirects=True)
+
+def filename_from_url(url):
+    """Pick a file name for a URL, keeping query-string variants apart"""
+    parts = urlsplit(url)
+    filename = parts.path.rpartition('/')[2] # the last path segment, without ?query
+    url_hash = blake2b(url.encode(), digest_size=8).hexdigest()
+    stem, ext = os.path.splitext(filename)
+    if not stem or not ext:
+        return f"file_{url_hash}.jpg"  # Default filename, stable for the same URL
+    if parts.query:
+        # e.g. logo.png?v=1 and logo.png?v=2 must not overwrite each other
+        return f"{stem}_{url_hash}{ext}"
+    return filename
+
+def write_chunks(fd, chunks):
+    """Write a batch of chunks to a file descriptor with as few syscalls as possible"""
+    if not hasattr(os, 'writev'):
+        # No vectored writes (e.g. on Windows): join the batch and write it in one go
+        data = memoryview(b''.join(chunks))
+        while data:
+            data = data[os.write(fd, data):]
+        return
+    
+    pending = [memoryview(chunk) for chunk in chunks]
+    while pending:
+        written = os.writev(fd, pending)
+        # writev may stop part-way; drop what reached the file and retry the rest
+        while pending and written >= len(pending[0]):
+            written -= len(pending[0])
+            pending.pop(0)
+        if written:
+            pending[0] = pending[0][written:]
+
+def is_retryable(error):
+    """Tell transient download failures apart from ones a retry cannot fix"""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return status_code == 429 or status_code >= 500
+    return False
 
 # Part B: Downloading a Single File
 
-async def download_file(client, url):
-    """Download a single file from URL"""
+async def download_file(client, url, raise_errors=False):
+    """Download a single file from URL (re-raise failures if raise_errors is set)"""
     try:
         print(f"Starting download: {url}")
         
         # Extract filename from URL
-        filename = url.split('/')[-1] # -1 gets the last part after splitting by '/'
-        if not filename or '.' not in filename:
-            filename = f"file_{int(time.time())}.jpg"  # Default filename with timestamp
-        
-        # Create downloads directory if it doesn't exist
-        os.makedirs('downloads', exist_ok=True)
+        filename = filename_from_url(url)
         
         # Create the full path where to save the file
-        filepath = os.path.join('downloads', filename)
-        
-        # Make the HTTP request
-        response = await client.get(url)
-        response.raise_for_status()  # Raise an error for bad status codes
+        # (the callers create DOWNLOAD_DIR once, before any download starts)
+        filepath = os.path.join(DOWNLOAD_DIR, filename)
         
-        # Write the file to disk
-        with open(filepath, 'wb') as file:
-            async for chunk in response.aiter_bytes():
-                file.write(chunk)
+        # Stream the HTTP response instead of loading the whole body into memory
+        async with client.stream('GET', url) as response:
+            response.raise_for_status()  # Raise an error for bad status codes
+            
+            # Write the file to disk in a worker thread, so a slow disk does not
+            # block the event loop while other downloads are waiting on the network
+            fd = await asyncio.to_thread(os.open, filepath, OPEN_FLAGS, 0o644)
+            try:
+                # Collect chunks without copying them, then write each batch
+                # with a single vectored write
+                chunks, size = [], 0
+                async for chunk in response.aiter_bytes(chunk_size=CHUNK_SIZE):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= WRITE_BATCH_SIZE:
+                        await asyncio.to_thread(write_chunks, fd, chunks)
+                        chunks, size = [], 0
+                if chunks:
+                    await asyncio.to_thread(write_chunks, fd, chunks)
+            finally:
+                await asyncio.to_thread(os.close, fd)
         
         print(f"✓ Downloaded: {filename}")
         return filepath
         
     except Exception as e:
         print(f"✗ Failed to download {url}: {str(e)}")
+        if raise_errors:
+            raise
         return None
 
 # Part C: Downloading Multiple Files Concurrently
@@ -46,10 +121,20 @@ async def download_multiple_files(urls, max_concurrent=5):
     semaphore = asyncio.Semaphore(max_concurrent)
     
     async def download_with_semaphore(client, url):
-        async with semaphore:
-            return await download_file(client, url)
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with semaphore:
+                    return await download_file(client, url, raise_errors=True)
+            except Exception as error:
+                if attempt == MAX_RETRIES or not is_retryable(error):
+                    return None
+            # Back off without holding the semaphore, so other downloads can run
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+    
+    # Create downloads directory if it doesn't exist
+    os.makedirs(DOWNLOAD_DIR, exist_ok=True)
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with create_client(max_concurrent) as client:
         tasks = [download_with_semaphore(client, url) for url in urls]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
@@ -88,7 +173,8 @@ async def main():
     
     if args.url:
         # Download single URL
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        os.makedirs(DOWNLOAD_DIR, exist_ok=True)
+        async with create_client() as client:
             result = await download_file(client, args.url)
             if result:
                 print(f"File saved to: {result}")
@@ -105,8 +191,9 @@ async def main():
         
         results = await download_multiple_files(urls, args.concurrent)
         
-        # Count successful downloads
-        successful = sum(1 for result in results if result is not None and not isinstance(result, Exception))
+        # Count successful downloads (each one returns the saved file path;
+        # failures are None, or the exception gathered from the task)
+        successful = sum(isinstance(result, str) for result in results)
         failed = len(results) - successful
         
         print("-" * 50)
@@ -116,4 +203,9 @@ async def main():
         print(f"Total time: {time.time() - start_time:.2f} seconds")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop # Faster event loop built on libuv (not available on Windows)
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())